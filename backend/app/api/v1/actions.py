@@ -145,7 +145,7 @@ async def execute_action(
             exec_result = await executor.execute(action.target_service, action.parameters)
             success = exec_result.status == ExecutionStatus.SUCCESS
             execution_result = {
-                "status": exec_result.status.value,
+                "status": exec_result.status.label,
                 "message": exec_result.message,
                 "details": exec_result.details,
                 "dry_run": exec_result.dry_run,
@@ -170,6 +170,16 @@ class Settings(BaseSettings):
         ge=30,
         description="Action execution timeout in seconds"
     )
+    k8s_concurrency: int = Field(
+        default=8,
+        ge=1,
+        le=64,
+        description=(
+            "Maximum concurrent executions per execute_many() batch, bounding "
+            "Kubernetes API server load during bulk remediation. "
+            "Set AIRRA_K8S_CONCURRENCY to override."
+        ),
+    )
     verification_stabilization_seconds: int = Field(
         default=30,
         ge=5,
@@ -10,27 +10,73 @@ Senior Engineering Note:
   - Recovery time if action fails
 - Strategy: Pick lowest risk action that can fix the problem
 - This is real production logic
+
+Performance Note:
+- Deliberately no Numba/Cython/JIT here. The working set is ~10 profiles and
+  the hot path is interpreter overhead on tiny dispatch functions, not a
+  numeric inner loop; a JIT compile would cost far more than it saves.
+- Speed comes from precomputation instead: constant profile table,
+  per-profile cost units, criticality lookup table, and batch_rank for
+  fleet-wide scoring. Extend those rather than reaching for a JIT.
+- Ties in adjusted risk (the clamp to 0 under high urgency makes them common)
+  keep the caller's candidate order, so rankings are sorted per context
+  rather than read off a fixed risk order.
+- Reserve JIT for modules that evaluate per-metric time series.
 """
 import logging
-from dataclasses import dataclass
-from enum import Enum
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from enum import IntEnum
+from operator import attrgetter, itemgetter
+from types import MappingProxyType
 
 from app.models.action import ActionType
 
 logger = logging.getLogger(__name__)
 
 
-class ActionRiskCategory(str, Enum):
-    """Risk categories for actions."""
+class Criticality(IntEnum):
+    """Service criticality levels; values index _CRITICALITY_MULTIPLIERS."""
+
+    LOW = 0
+    MEDIUM = 1
+    HIGH = 2
+    CRITICAL = 3
+
+
+# Risk aversion per service criticality: >1.0 penalises risky actions harder.
+_CRITICALITY_MULTIPLIERS: tuple[float, ...] = (
+    0.8,  # LOW - less risk aversion
+    1.0,  # MEDIUM
+    1.2,  # HIGH - more risk aversion
+    1.5,  # CRITICAL - very risk averse
+)
 
-    REVERSIBLE_LOW_IMPACT = "reversible_low_impact"  # Scale up, cache clear
-    REVERSIBLE_MEDIUM_IMPACT = "reversible_medium_impact"  # Scale down, restart
-    IRREVERSIBLE_LOW_IMPACT = "irreversible_low_impact"  # Feature flag toggle
-    IRREVERSIBLE_HIGH_IMPACT = "irreversible_high_impact"  # Rollback, drain node
-    DANGEROUS = "dangerous"  # Direct database changes, data migration
+# Translates the string criticalities used at API boundaries
+_CRITICALITY_BY_NAME: dict[str, Criticality] = {c.name.lower(): c for c in Criticality}
 
 
-@dataclass
+class ActionRiskCategory(IntEnum):
+    """
+    Risk categories for actions.
+
+    Int-valued (ordered from safest to most dangerous) so category dispatch
+    can index lookup tables directly; ``label`` gives the serialized name.
+    """
+
+    REVERSIBLE_LOW_IMPACT = 0  # Scale up, cache clear
+    REVERSIBLE_MEDIUM_IMPACT = 1  # Scale down, restart
+    IRREVERSIBLE_LOW_IMPACT = 2  # Feature flag toggle
+    IRREVERSIBLE_HIGH_IMPACT = 3  # Rollback, drain node
+    DANGEROUS = 4  # Direct database changes, data migration
+
+    @property
+    def label(self) -> str:
+        """Serialized name of the category (e.g. "reversible_low_impact")."""
+        return self.name.lower()
+
+
+@dataclass(frozen=True, slots=True)
 class ActionRiskProfile:
     """Risk profile for a remediation action."""
 
@@ -43,8 +89,212 @@ class ActionRiskProfile:
     reversible: bool  # Can action be undone?
     blast_radius: str  # "single_pod", "deployment", "cluster", "datacenter"
     estimated_cost_per_minute: float  # $ cost per minute of downtime
-    prerequisites: list[str]  # What must be true before executing
-    side_effects: list[str]  # Known side effects
+    prerequisites: tuple[str, ...]  # What must be true before executing
+    side_effects: tuple[str, ...]  # Known side effects
+
+    # Derived: $ cost per unit of blast radius, so cost lookups are one multiply
+    expected_cost_unit: float = field(init=False, repr=False)
+    worst_case_cost_unit: float = field(init=False, repr=False)
+
+    def __post_init__(self):
+        object.__setattr__(
+            self,
+            "expected_cost_unit",
+            self.expected_downtime_seconds / 60.0 * self.estimated_cost_per_minute,
+        )
+        object.__setattr__(
+            self,
+            "worst_case_cost_unit",
+            (self.worst_case_downtime_seconds + self.recovery_time_seconds)
+            / 60.0
+            * self.estimated_cost_per_minute,
+        )
+
+
+# Risk profiles for all action types. Pure constant data: built once at import
+# and shared read-only by every ActionRiskRegistry.
+_RISK_PROFILES: Mapping[ActionType, ActionRiskProfile] = MappingProxyType({
+    # Scale up - low risk, easily reversible
+    ActionType.SCALE_UP: ActionRiskProfile(
+        action_type=ActionType.SCALE_UP,
+        risk_category=ActionRiskCategory.REVERSIBLE_LOW_IMPACT,
+        risk_score=0.05,  # Very low risk
+        expected_downtime_seconds=0,  # No downtime
+        worst_case_downtime_seconds=30,  # Brief if pods fail to start
+        recovery_time_seconds=60,  # Quick rollback
+        reversible=True,
+        blast_radius="deployment",
+        estimated_cost_per_minute=10.0,
+        prerequisites=(
+            "Current replicas < max replicas",
+            "Cluster has capacity",
+        ),
+        side_effects=(
+            "Increased resource usage",
+            "Higher infrastructure cost",
+        ),
+    ),
+
+    # Scale down - medium risk, reversible but reduces capacity
+    ActionType.SCALE_DOWN: ActionRiskProfile(
+        action_type=ActionType.SCALE_DOWN,
+        risk_category=ActionRiskCategory.REVERSIBLE_MEDIUM_IMPACT,
+        risk_score=0.25,  # Medium risk - reduces capacity
+        expected_downtime_seconds=0,
+        worst_case_downtime_seconds=300,  # If scaled too aggressively
+        recovery_time_seconds=120,  # Time to scale back up
+        reversible=True,
+        blast_radius="deployment",
+        estimated_cost_per_minute=50.0,
+        prerequisites=(
+            "Current replicas > min replicas",
+            "Load allows reduction",
+        ),
+        side_effects=(
+            "Reduced capacity",
+            "Potential queuing if load increases",
+        ),
+    ),
+
+    # Restart pod - medium-high risk, causes brief downtime
+    ActionType.RESTART_POD: ActionRiskProfile(
+        action_type=ActionType.RESTART_POD,
+        risk_category=ActionRiskCategory.REVERSIBLE_MEDIUM_IMPACT,
+        risk_score=0.35,  # Medium-high risk
+        expected_downtime_seconds=10,  # Brief per-pod downtime
+        worst_case_downtime_seconds=300,  # If pod fails to restart
+        recovery_time_seconds=180,  # Manual intervention if needed
+        reversible=False,  # Can't undo restart
+        blast_radius="single_pod",
+        estimated_cost_per_minute=100.0,
+        prerequisites=(
+            "Multiple replicas available",
+            "Service has health checks",
+        ),
+        side_effects=(
+            "Connection termination",
+            "In-flight request loss",
+            "Cache cold start",
+        ),
+    ),
+
+    # Rollback deployment - high risk, significant impact
+    ActionType.ROLLBACK_DEPLOYMENT: ActionRiskProfile(
+        action_type=ActionType.ROLLBACK_DEPLOYMENT,
+        risk_category=ActionRiskCategory.IRREVERSIBLE_HIGH_IMPACT,
+        risk_score=0.50,  # High risk
+        expected_downtime_seconds=60,  # Rolling update downtime
+        worst_case_downtime_seconds=1800,  # If rollback fails
+        recovery_time_seconds=600,  # Manual intervention needed
+        reversible=False,  # Can't easily undo
+        blast_radius="deployment",
+        estimated_cost_per_minute=500.0,
+        prerequisites=(
+            "Previous version available",
+            "Database schema compatible",
+        ),
+        side_effects=(
+            "Feature loss",
+            "Potential data inconsistency",
+            "User experience change",
+        ),
+    ),
+
+    # Toggle feature flag - low-medium risk, depends on flag
+    ActionType.TOGGLE_FEATURE_FLAG: ActionRiskProfile(
+        action_type=ActionType.TOGGLE_FEATURE_FLAG,
+        risk_category=ActionRiskCategory.IRREVERSIBLE_LOW_IMPACT,
+        risk_score=0.20,  # Low-medium risk
+        expected_downtime_seconds=0,
+        worst_case_downtime_seconds=60,  # If flag misconfigured
+        recovery_time_seconds=30,  # Quick toggle back
+        reversible=True,  # Can toggle back
+        blast_radius="deployment",
+        estimated_cost_per_minute=50.0,
+        prerequisites=(
+            "Feature flag exists",
+            "Safe to disable feature",
+        ),
+        side_effects=(
+            "Feature unavailable to users",
+            "Potential UX degradation",
+        ),
+    ),
+
+    # Clear cache - low risk, temporary impact
+    ActionType.CLEAR_CACHE: ActionRiskProfile(
+        action_type=ActionType.CLEAR_CACHE,
+        risk_category=ActionRiskCategory.REVERSIBLE_LOW_IMPACT,
+        risk_score=0.10,  # Low risk
+        expected_downtime_seconds=0,
+        worst_case_downtime_seconds=120,  # Cache rebuild time
+        recovery_time_seconds=60,  # Cache repopulates
+        reversible=False,  # Can't undo but low impact
+        blast_radius="deployment",
+        estimated_cost_per_minute=20.0,
+        prerequisites=(
+            "Cache is not critical path",
+            "Service can handle cache miss load",
+        ),
+        side_effects=(
+            "Increased database load",
+            "Slower response times temporarily",
+        ),
+    ),
+
+    # Drain node - high risk, affects multiple services
+    ActionType.DRAIN_NODE: ActionRiskProfile(
+        action_type=ActionType.DRAIN_NODE,
+        risk_category=ActionRiskCategory.IRREVERSIBLE_HIGH_IMPACT,
+        risk_score=0.60,  # High risk
+        expected_downtime_seconds=0,  # Gradual drain
+        worst_case_downtime_seconds=3600,  # If cluster capacity exceeded
+        recovery_time_seconds=1800,  # Node restart + pod scheduling
+        reversible=False,
+        blast_radius="cluster",
+        estimated_cost_per_minute=1000.0,
+        prerequisites=(
+            "Cluster has spare capacity",
+            "Not last healthy node",
+        ),
+        side_effects=(
+            "All pods on node restarted",
+            "Multiple services affected",
+            "Resource contention",
+        ),
+    ),
+})
+
+_risk_score = attrgetter("risk_score")
+_adjusted_score = itemgetter(2)
+
+
+def _risk_context(
+    service_criticality: str | Criticality,
+    current_downtime_seconds: float,
+) -> tuple[float, float]:
+    """Return (criticality_multiplier, urgency_discount) for a service context."""
+    if not isinstance(service_criticality, Criticality):
+        # Unknown levels get the neutral (medium) multiplier
+        service_criticality = _CRITICALITY_BY_NAME.get(service_criticality, Criticality.MEDIUM)
+    criticality_mult = _CRITICALITY_MULTIPLIERS[service_criticality]
+
+    # Downtime urgency factor: the longer the service has been down, the more
+    # risk we accept - 5% per minute, capped at 30% from 6 minutes
+    urgency_discount = (
+        0.3 if current_downtime_seconds >= 360 else current_downtime_seconds / 1200.0
+    )
+
+    return criticality_mult, urgency_discount
+
+
+def _adjusted_risk(
+    profile: ActionRiskProfile,
+    criticality_mult: float,
+    urgency_discount: float,
+) -> float:
+    """Context-adjusted risk score, clamped to [0, 1]."""
+    return max(0.0, min(1.0, profile.risk_score * criticality_mult - urgency_discount))
 
 
 class ActionRiskRegistry:
@@ -57,161 +307,7 @@ class ActionRiskRegistry:
 
     def __init__(self):
         """Initialize action risk registry."""
-        self.risk_profiles: dict[ActionType, ActionRiskProfile] = {}
-        self._load_risk_profiles()
-
-    def _load_risk_profiles(self):
-        """Load risk profiles for all action types."""
-
-        # Scale up - low risk, easily reversible
-        self.risk_profiles[ActionType.SCALE_UP] = ActionRiskProfile(
-            action_type=ActionType.SCALE_UP,
-            risk_category=ActionRiskCategory.REVERSIBLE_LOW_IMPACT,
-            risk_score=0.05,  # Very low risk
-            expected_downtime_seconds=0,  # No downtime
-            worst_case_downtime_seconds=30,  # Brief if pods fail to start
-            recovery_time_seconds=60,  # Quick rollback
-            reversible=True,
-            blast_radius="deployment",
-            estimated_cost_per_minute=10.0,
-            prerequisites=[
-                "Current replicas < max replicas",
-                "Cluster has capacity",
-            ],
-            side_effects=[
-                "Increased resource usage",
-                "Higher infrastructure cost",
-            ],
-        )
-
-        # Scale down - medium risk, reversible but reduces capacity
-        self.risk_profiles[ActionType.SCALE_DOWN] = ActionRiskProfile(
-            action_type=ActionType.SCALE_DOWN,
-            risk_category=ActionRiskCategory.REVERSIBLE_MEDIUM_IMPACT,
-            risk_score=0.25,  # Medium risk - reduces capacity
-            expected_downtime_seconds=0,
-            worst_case_downtime_seconds=300,  # If scaled too aggressively
-            recovery_time_seconds=120,  # Time to scale back up
-            reversible=True,
-            blast_radius="deployment",
-            estimated_cost_per_minute=50.0,
-            prerequisites=[
-                "Current replicas > min replicas",
-                "Load allows reduction",
-            ],
-            side_effects=[
-                "Reduced capacity",
-                "Potential queuing if load increases",
-            ],
-        )
-
-        # Restart pod - medium-high risk, causes brief downtime
-        self.risk_profiles[ActionType.RESTART_POD] = ActionRiskProfile(
-            action_type=ActionType.RESTART_POD,
-            risk_category=ActionRiskCategory.REVERSIBLE_MEDIUM_IMPACT,
-            risk_score=0.35,  # Medium-high risk
-            expected_downtime_seconds=10,  # Brief per-pod downtime
-            worst_case_downtime_seconds=300,  # If pod fails to restart
-            recovery_time_seconds=180,  # Manual intervention if needed
-            reversible=False,  # Can't undo restart
-            blast_radius="single_pod",
-            estimated_cost_per_minute=100.0,
-            prerequisites=[
-                "Multiple replicas available",
-                "Service has health checks",
-            ],
-            side_effects=[
-                "Connection termination",
-                "In-flight request loss",
-                "Cache cold start",
-            ],
-        )
-
-        # Rollback deployment - high risk, significant impact
-        self.risk_profiles[ActionType.ROLLBACK_DEPLOYMENT] = ActionRiskProfile(
-            action_type=ActionType.ROLLBACK_DEPLOYMENT,
-            risk_category=ActionRiskCategory.IRREVERSIBLE_HIGH_IMPACT,
-            risk_score=0.50,  # High risk
-            expected_downtime_seconds=60,  # Rolling update downtime
-            worst_case_downtime_seconds=1800,  # If rollback fails
-            recovery_time_seconds=600,  # Manual intervention needed
-            reversible=False,  # Can't easily undo
-            blast_radius="deployment",
-            estimated_cost_per_minute=500.0,
-            prerequisites=[
-                "Previous version available",
-                "Database schema compatible",
-            ],
-            side_effects=[
-                "Feature loss",
-                "Potential data inconsistency",
-                "User experience change",
-            ],
-        )
-
-        # Toggle feature flag - low-medium risk, depends on flag
-        self.risk_profiles[ActionType.TOGGLE_FEATURE_FLAG] = ActionRiskProfile(
-            action_type=ActionType.TOGGLE_FEATURE_FLAG,
-            risk_category=ActionRiskCategory.IRREVERSIBLE_LOW_IMPACT,
-            risk_score=0.20,  # Low-medium risk
-            expected_downtime_seconds=0,
-            worst_case_downtime_seconds=60,  # If flag misconfigured
-            recovery_time_seconds=30,  # Quick toggle back
-            reversible=True,  # Can toggle back
-            blast_radius="deployment",
-            estimated_cost_per_minute=50.0,
-            prerequisites=[
-                "Feature flag exists",
-                "Safe to disable feature",
-            ],
-            side_effects=[
-                "Feature unavailable to users",
-                "Potential UX degradation",
-            ],
-        )
-
-        # Clear cache - low risk, temporary impact
-        self.risk_profiles[ActionType.CLEAR_CACHE] = ActionRiskProfile(
-            action_type=ActionType.CLEAR_CACHE,
-            risk_category=ActionRiskCategory.REVERSIBLE_LOW_IMPACT,
-            risk_score=0.10,  # Low risk
-            expected_downtime_seconds=0,
-            worst_case_downtime_seconds=120,  # Cache rebuild time
-            recovery_time_seconds=60,  # Cache repopulates
-            reversible=False,  # Can't undo but low impact
-            blast_radius="deployment",
-            estimated_cost_per_minute=20.0,
-            prerequisites=[
-                "Cache is not critical path",
-                "Service can handle cache miss load",
-            ],
-            side_effects=[
-                "Increased database load",
-                "Slower response times temporarily",
-            ],
-        )
-
-        # Drain node - high risk, affects multiple services
-        self.risk_profiles[ActionType.DRAIN_NODE] = ActionRiskProfile(
-            action_type=ActionType.DRAIN_NODE,
-            risk_category=ActionRiskCategory.IRREVERSIBLE_HIGH_IMPACT,
-            risk_score=0.60,  # High risk
-            expected_downtime_seconds=0,  # Gradual drain
-            worst_case_downtime_seconds=3600,  # If cluster capacity exceeded
-            recovery_time_seconds=1800,  # Node restart + pod scheduling
-            reversible=False,
-            blast_radius="cluster",
-            estimated_cost_per_minute=1000.0,
-            prerequisites=[
-                "Cluster has spare capacity",
-                "Not last healthy node",
-            ],
-            side_effects=[
-                "All pods on node restarted",
-                "Multiple services affected",
-                "Resource contention",
-            ],
-        )
+        self.risk_profiles: Mapping[ActionType, ActionRiskProfile] = _RISK_PROFILES
 
     def get_risk_profile(self, action_type: ActionType) -> ActionRiskProfile | None:
         """Get risk profile for an action type."""
@@ -220,7 +316,7 @@ class ActionRiskRegistry:
     def rank_actions_by_risk(
         self,
         action_types: list[ActionType],
-        service_criticality: str = "medium",
+        service_criticality: str | Criticality = "medium",
         current_downtime_seconds: float = 0,
     ) -> list[tuple[ActionType, ActionRiskProfile, float]]:
         """
@@ -237,39 +333,118 @@ class ActionRiskRegistry:
             current_downtime_seconds: How long service has been down
 
         Returns:
-            List of (action_type, profile, adjusted_risk_score) sorted by risk (lowest first)
+            List of (action_type, profile, adjusted_risk_score) sorted by risk
+            (lowest first), ties in the order given
+        """
+        criticality_mult, urgency_discount = _risk_context(
+            service_criticality, current_downtime_seconds
+        )
+
+        if len(action_types) == 1:
+            profile = self.risk_profiles.get(action_types[0])
+            if profile is None:
+                logger.warning(f"No risk profile for {action_types[0]}, skipping")
+                return []
+            return [
+                (
+                    profile.action_type,
+                    profile,
+                    _adjusted_risk(profile, criticality_mult, urgency_discount),
+                )
+            ]
+
+        ranked = [
+            (
+                profile.action_type,
+                profile,
+                _adjusted_risk(profile, criticality_mult, urgency_discount),
+            )
+            for profile in self._known_profiles(action_types)
+        ]
+        # Stable sort: actions tied on adjusted risk keep their input order
+        ranked.sort(key=_adjusted_score)
+        return ranked
+
+    def batch_rank(
+        self,
+        action_types: list[ActionType],
+        service_contexts: list[tuple[str | Criticality, float]],
+    ) -> tuple[list[ActionType], list[list[float]]]:
+        """
+        Rank the same candidate actions for many services at once.
+
+        The context adjustment is monotonic, so every service shares one
+        ordering (base risk, then input order); only the adjusted scores
+        differ. Candidates are resolved and ordered once, then each service
+        costs a single row of arithmetic. Where clamping ties two scores, this
+        shared order can list them differently from rank_actions_by_risk,
+        which breaks ties by input order alone.
+
+        Args:
+            action_types: Potential actions, shared by all services
+            service_contexts: (service_criticality, current_downtime_seconds)
+                per service
+
+        Returns:
+            Tuple of (actions ordered lowest risk first, one row of adjusted
+            risk scores per service aligned with that order). The first
+            action is every service's lowest-risk choice.
         """
-        # Criticality multiplier
-        criticality_multipliers = {
-            "low": 0.8,  # Less risk aversion
-            "medium": 1.0,
-            "high": 1.2,  # More risk aversion
-            "critical": 1.5,  # Very risk averse
-        }
-        criticality_mult = criticality_multipliers.get(service_criticality, 1.0)
-
-        # Downtime urgency factor
-        # If already down for 5+ minutes, willing to take more risk
-        downtime_minutes = current_downtime_seconds / 60.0
-        urgency_discount = min(0.3, downtime_minutes / 20.0)  # Max 30% discount
-
-        ranked_actions = []
+        profiles = sorted(self._known_profiles(action_types), key=_risk_score)
+
+        rows = []
+        for service_criticality, current_downtime_seconds in service_contexts:
+            criticality_mult, urgency_discount = _risk_context(
+                service_criticality, current_downtime_seconds
+            )
+            rows.append(
+                [_adjusted_risk(p, criticality_mult, urgency_discount) for p in profiles]
+            )
+
+        return [p.action_type for p in profiles], rows
+
+    def _known_profiles(self, action_types: list[ActionType]) -> list[ActionRiskProfile]:
+        """Profiles for action_types in input order, skipping unknown ones."""
+        profiles = []
         for action_type in action_types:
-            profile = self.get_risk_profile(action_type)
+            profile = self.risk_profiles.get(action_type)
             if profile is None:
                 logger.warning(f"No risk profile for {action_type}, skipping")
                 continue
+            profiles.append(profile)
+        return profiles
 
-            # Adjusted risk score
-            adjusted_risk = (profile.risk_score * criticality_mult) - urgency_discount
-            adjusted_risk = max(0.0, min(1.0, adjusted_risk))  # Clamp to [0, 1]
+    def _best_action(
+        self,
+        action_types: list[ActionType],
+        criticality_mult: float,
+        urgency_discount: float,
+        action_confidences: dict[ActionType, float] | None,
+        min_confidence: float,
+    ) -> tuple[ActionRiskProfile, float] | None:
+        """
+        Find the lowest-risk action meeting the confidence threshold.
 
-            ranked_actions.append((action_type, profile, adjusted_risk))
+        Single pass in input order keeping the strict minimum, so ties go
+        to the earlier candidate exactly as in rank_actions_by_risk, without
+        ranking everything.
 
-        # Sort by adjusted risk (lowest first)
-        ranked_actions.sort(key=lambda x: x[2])
+        Returns:
+            Tuple of (profile, adjusted_risk_score) or None
+        """
+        best: tuple[ActionRiskProfile, float] | None = None
 
-        return ranked_actions
+        for profile in self._known_profiles(action_types):
+            if (
+                action_confidences
+                and action_confidences.get(profile.action_type, 0.0) < min_confidence
+            ):
+                continue
+            risk = _adjusted_risk(profile, criticality_mult, urgency_discount)
+            if best is None or risk < best[1]:
+                best = profile, risk
+
+        return best
 
     def calculate_expected_cost(
         self,
@@ -288,14 +463,11 @@ class ActionRiskRegistry:
         Returns:
             Expected cost in dollars
         """
-        profile = self.get_risk_profile(action_type)
+        profile = self.risk_profiles.get(action_type)
         if profile is None:
             return 0.0
 
-        downtime_minutes = profile.expected_downtime_seconds / 60.0
-        expected_cost = downtime_minutes * profile.estimated_cost_per_minute * blast_radius_multiplier
-
-        return expected_cost
+        return self._expected_cost_for_profile(profile, blast_radius_multiplier)
 
     def calculate_worst_case_cost(
         self,
@@ -314,20 +486,32 @@ class ActionRiskRegistry:
         Returns:
             Worst-case cost in dollars
         """
-        profile = self.get_risk_profile(action_type)
+        profile = self.risk_profiles.get(action_type)
         if profile is None:
             return 0.0
 
-        total_downtime = profile.worst_case_downtime_seconds + profile.recovery_time_seconds
-        downtime_minutes = total_downtime / 60.0
-        worst_cost = downtime_minutes * profile.estimated_cost_per_minute * blast_radius_multiplier
+        return self._worst_case_cost_for_profile(profile, blast_radius_multiplier)
+
+    @staticmethod
+    def _expected_cost_for_profile(
+        profile: ActionRiskProfile,
+        blast_radius_multiplier: float,
+    ) -> float:
+        """Expected cost for an already-resolved profile."""
+        return profile.expected_cost_unit * blast_radius_multiplier
 
-        return worst_cost
+    @staticmethod
+    def _worst_case_cost_for_profile(
+        profile: ActionRiskProfile,
+        blast_radius_multiplier: float,
+    ) -> float:
+        """Worst-case cost for an already-resolved profile."""
+        return profile.worst_case_cost_unit * blast_radius_multiplier
 
     def select_best_action(
         self,
         candidate_actions: list[ActionType],
-        service_criticality: str = "medium",
+        service_criticality: str | Criticality = "medium",
         current_downtime_seconds: float = 0,
         blast_radius_multiplier: float = 1.0,
         min_confidence: float = 0.6,
@@ -337,7 +521,7 @@ class ActionRiskRegistry:
         Select the best action based on risk-reward tradeoff.
 
         Strategy:
-        1. Rank actions by adjusted risk
+        1. Order actions by adjusted risk
         2. Filter by minimum confidence
         3. Select lowest risk action that meets confidence threshold
         4. Consider expected vs worst-case cost
@@ -356,30 +540,27 @@ class ActionRiskRegistry:
         if not candidate_actions:
             return None
 
-        # Rank by risk
-        ranked = self.rank_actions_by_risk(
-            candidate_actions,
-            service_criticality,
-            current_downtime_seconds,
+        criticality_mult, urgency_discount = _risk_context(
+            service_criticality, current_downtime_seconds
         )
 
-        # Filter by confidence if available
-        if action_confidences:
-            ranked = [
-                (action, profile, risk)
-                for action, profile, risk in ranked
-                if action_confidences.get(action, 0.0) >= min_confidence
-            ]
-
-        if not ranked:
+        # Lowest risk action that meets the confidence threshold (if available)
+        best = self._best_action(
+            candidate_actions,
+            criticality_mult,
+            urgency_discount,
+            action_confidences,
+            min_confidence,
+        )
+        if best is None:
             return None
 
-        # Select lowest risk action
-        best_action, best_profile, best_risk = ranked[0]
+        best_profile, best_risk = best
+        best_action = best_profile.action_type
 
-        # Calculate costs
-        expected_cost = self.calculate_expected_cost(best_action, blast_radius_multiplier)
-        worst_cost = self.calculate_worst_case_cost(best_action, blast_radius_multiplier)
+        # Calculate costs from the profile already in hand (no second lookup)
+        expected_cost = self._expected_cost_for_profile(best_profile, blast_radius_multiplier)
+        worst_cost = self._worst_case_cost_for_profile(best_profile, blast_radius_multiplier)
 
         reasoning = (
             f"Selected {best_action.value} "
@@ -397,13 +578,11 @@ class ActionRiskRegistry:
         return (best_action, reasoning)
 
 
-# Global instance
-_action_risk_registry: ActionRiskRegistry | None = None
+# Global instance. Profiles are module constants, so construction is trivial
+# and the registry is built eagerly at import rather than lazily per lookup.
+_action_risk_registry = ActionRiskRegistry()
 
 
 def get_action_risk_registry() -> ActionRiskRegistry:
     """Get global action risk registry."""
-    global _action_risk_registry
-    if _action_risk_registry is None:
-        _action_risk_registry = ActionRiskRegistry()
     return _action_risk_registry
@@ -6,38 +6,67 @@ Senior Engineering Note:
 - Dry-run mode support for safe testing
 - Execution result tracking
 - Safety validation before execution
+- Bounded-concurrency fan-out for bulk remediation (execute_many)
 """
+import asyncio
+import time
 from abc import ABC, abstractmethod
-from datetime import datetime, timezone
-from enum import Enum
+from collections.abc import Sequence
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta, timezone
+from enum import IntEnum
 from typing import Any
 
-from pydantic import BaseModel, Field
+from app.config import settings
 
 
-class ExecutionStatus(str, Enum):
-    """Status of an action execution."""
+class ExecutionStatus(IntEnum):
+    """
+    Status of an action execution.
+
+    Int-valued so status checks on the execution path are small-int
+    comparisons. Use ``label`` wherever the status leaves the process
+    (API responses, stored results, logs).
+    """
+
+    PENDING = 0
+    RUNNING = 1
+    SUCCESS = 2
+    FAILED = 3
+    ROLLED_BACK = 4
+    SKIPPED = 5
 
-    PENDING = "pending"
-    RUNNING = "running"
-    SUCCESS = "success"
-    FAILED = "failed"
-    ROLLED_BACK = "rolled_back"
-    SKIPPED = "skipped"
+    @property
+    def label(self) -> str:
+        """Serialized name of the status (e.g. "success")."""
+        return self.name.lower()
 
 
-class ExecutionResult(BaseModel):
-    """Result of an action execution."""
+@dataclass(frozen=True, slots=True)
+class ExecutionResult:
+    """
+    Result of an action execution.
+
+    A slotted dataclass rather than a Pydantic model: results are built by
+    trusted executor code on every action, so schema validation is pure cost.
+    Frozen because de-duplicated executions hand one result to several callers.
+    """
 
     status: ExecutionStatus
-    message: str = Field(..., description="Human-readable result message")
-    details: dict[str, Any] = Field(default_factory=dict, description="Execution details")
-    started_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    message: str  # Human-readable result message
+    details: dict[str, Any] = field(default_factory=dict)  # Execution details
+    started_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     completed_at: datetime | None = None
     duration_seconds: float | None = None
     dry_run: bool = False
     error: str | None = None
 
+    def model_dump(self) -> dict[str, Any]:
+        """Return the result as a dict (kept for Pydantic-style callers)."""
+        data = asdict(self)
+        data["status"] = self.status.label
+        return data
+
 
 class ActionExecutor(ABC):
     """
@@ -103,6 +132,45 @@ class ActionExecutor(ABC):
         """
         pass
 
+    async def execute_many(
+        self,
+        items: Sequence[tuple[str, dict[str, Any]]],
+        concurrency: int | None = None,
+    ) -> list[ExecutionResult]:
+        """
+        Execute this action against several targets concurrently.
+
+        At most `concurrency` executions (default: settings.k8s_concurrency)
+        are in flight at once so bulk remediation doesn't burst the API
+        server; total latency approaches the slowest call rather than the sum.
+
+        Args:
+            items: (target, parameters) pairs
+            concurrency: Maximum simultaneous executions
+
+        Returns:
+            One ExecutionResult per item, in input order
+        """
+        semaphore = asyncio.Semaphore(concurrency or settings.k8s_concurrency)
+
+        async def run_one(target: str, parameters: dict[str, Any]) -> ExecutionResult:
+            async with semaphore:
+                return await self.execute(target, parameters)
+
+        return list(await asyncio.gather(*(run_one(t, p) for t, p in items)))
+
+    def _skipped_result(self, message: str) -> ExecutionResult:
+        """Helper for no-op results (e.g. non-reversible rollbacks): one clock read, zero duration."""
+        now = datetime.now(timezone.utc)
+        return ExecutionResult(
+            status=ExecutionStatus.SKIPPED,
+            message=message,
+            started_at=now,
+            completed_at=now,
+            duration_seconds=0.0,
+            dry_run=self.dry_run,
+        )
+
     def _create_result(
         self,
         status: ExecutionStatus,
@@ -110,15 +178,28 @@ class ActionExecutor(ABC):
         started_at: datetime,
         details: dict | None = None,
         error: str | None = None,
+        start_ns: int | None = None,
     ) -> ExecutionResult:
-        """Helper to create execution result with timing."""
-        completed_at = datetime.now(timezone.utc)
-        duration = (completed_at - started_at).total_seconds()
+        """
+        Helper to create execution result with timing.
+
+        Pass start_ns (time.perf_counter_ns() captured alongside started_at)
+        to time the execution on the monotonic clock; completed_at is then
+        derived from started_at instead of reading the wall clock again.
+        Without it the wall clock is used, clamped so a backwards clock step
+        never yields a negative duration.
+        """
+        if start_ns is not None:
+            duration = (time.perf_counter_ns() - start_ns) / 1e9
+            completed_at = started_at + timedelta(seconds=duration)
+        else:
+            completed_at = max(datetime.now(timezone.utc), started_at)
+            duration = (completed_at - started_at).total_seconds()
 
         return ExecutionResult(
             status=status,
             message=message,
-            details=details or {},
+            details=details if details is not None else {},
             started_at=started_at,
             completed_at=completed_at,
             duration_seconds=duration,
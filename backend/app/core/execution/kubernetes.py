@@ -8,15 +8,54 @@ Senior Engineering Note:
 - Implements safety checks (replica count, pod status)
 - Supports dry-run mode
 - Graceful degradation if K8s not available
+- The K8s client is synchronous: API calls run on a dedicated thread pool
+  (sized to the connection pool) so a slow API server never blocks the
+  event loop or starves other to_thread users
+- Transient 429/5xx API errors are retried with capped exponential backoff
+  (honouring Retry-After) via _k8s_call
+- Responses that are discarded or need one field skip client model
+  deserialization (_k8s_call_raw)
+- Failures log lazily (%-style args); tracebacks only at DEBUG level
+- Mixed-type bulk remediation fans out under one concurrency cap
+  (dispatch_many)
 """
 import asyncio
+import functools
+import itertools
+import json
 import logging
 import re
+import threading
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from datetime import datetime, timezone
 from typing import Any
 
+from tenacity import (
+    AsyncRetrying,
+    RetryCallState,
+    before_sleep_log,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential,
+)
+
+from app.config import settings
 from app.core.execution.base import ActionExecutor, ExecutionResult, ExecutionStatus
 
+# Optional dependency: resolved once here; without it executors simulate
+try:
+    from kubernetes import client as _k8s_client
+    from kubernetes import config as _k8s_config
+    from kubernetes import watch as _k8s_watch
+
+    _HAS_K8S = True
+except ImportError:
+    _k8s_client = _k8s_config = _k8s_watch = None
+    _HAS_K8S = False
+
 logger = logging.getLogger(__name__)
 
 # Kubernetes resource name validation pattern
@@ -24,12 +63,272 @@ logger = logging.getLogger(__name__)
 # Must start and end with an alphanumeric character
 K8S_NAME_PATTERN = re.compile(r"^[a-z0-9]([-a-z0-9]*[a-z0-9])?(\.[a-z0-9]([-a-z0-9]*[a-z0-9])?)*$")
 K8S_MAX_NAME_LENGTH = 253
+_NAME_EDGE_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789")
+_NAME_BODY_DELETE = str.maketrans("", "", "abcdefghijklmnopqrstuvwxyz0123456789-")
+
+# Shared success value for validate()-style (is_valid, error_message) checks
+_VALIDATE_OK: tuple[bool, str | None] = (True, None)
+
+JSON_PATCH = "application/json-patch+json"
+
+# Result detail values shared by the dry-run, simulated and live paths
+_ACTION_POD_RESTART = "pod_restart"
+_ACTION_SCALE = "scale"
+_ACTION_ROLLBACK = "rollback"
+_SIM_REASON = "kubernetes_client_not_available"
+
+# urllib3 pool size for the shared Kubernetes ApiClient; the I/O thread pool
+# matches it so no worker ever waits for a connection
+K8S_CONNECTION_POOL_SIZE = 32
+_k8s_io_pool = ThreadPoolExecutor(
+    max_workers=K8S_CONNECTION_POOL_SIZE, thread_name_prefix="k8s-io"
+)
+
+
+async def _run_k8s_io(fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Any:
+    """Run a blocking Kubernetes client call on the dedicated I/O pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_k8s_io_pool, functools.partial(fn, *args, **kwargs))
+
+# Process-wide (CoreV1Api, AppsV1Api) sharing one ApiClient; see _get_k8s_apis()
+_k8s_apis: tuple[Any, Any] | None = None
+_k8s_apis_lock = threading.Lock()
+
+
+def _load_k8s_apis() -> tuple[Any, Any]:
+    """
+    Load kubeconfig and build the shared API handles (blocking, runs once).
+
+    Raises:
+        ImportError: If the kubernetes client is not installed
+    """
+    global _k8s_apis
+    if not _HAS_K8S:
+        raise ImportError("kubernetes client is not installed")
+    with _k8s_apis_lock:
+        if _k8s_apis is None:
+            # Load kubeconfig: try in-cluster first, fall back to local
+            try:
+                _k8s_config.load_incluster_config()
+            except _k8s_config.ConfigException:
+                _k8s_config.load_kube_config()
+
+            configuration = _k8s_client.Configuration.get_default_copy()
+            configuration.connection_pool_maxsize = K8S_CONNECTION_POOL_SIZE
+            api_client = _k8s_client.ApiClient(configuration=configuration)
+            _k8s_apis = (_k8s_client.CoreV1Api(api_client), _k8s_client.AppsV1Api(api_client))
+    return _k8s_apis
+
+
+def _invalidate_k8s_apis() -> None:
+    """Drop the shared API handles so the next call reloads credentials."""
+    global _k8s_apis
+    with _k8s_apis_lock:
+        _k8s_apis = None
+
+
+async def _get_k8s_apis() -> tuple[Any, Any]:
+    """
+    Return the process-wide (CoreV1Api, AppsV1Api) pair.
+
+    Config loading and the ApiClient (with its TLS connection pool) happen
+    once per process instead of on every execute/validate call.
+
+    Raises:
+        ImportError: If the kubernetes client is not installed
+    """
+    if _k8s_apis is not None:
+        return _k8s_apis
+    return await asyncio.to_thread(_load_k8s_apis)
+
+
+# Transient apiserver responses worth retrying (throttling, overload, restarts)
+K8S_RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+K8S_MAX_ATTEMPTS = 5
+# Upper bound on an honoured Retry-After so a throttled call can't stall an action
+K8S_MAX_RETRY_AFTER_SECONDS = 10.0
+_k8s_backoff = wait_exponential(multiplier=0.1, max=2.0)
+
+
+def _is_transient_k8s_error(exc: BaseException) -> bool:
+    # Duck-typed on ApiException.status so the kubernetes import stays optional
+    return getattr(exc, "status", None) in K8S_RETRYABLE_STATUSES
+
+
+def _k8s_retry_wait(retry_state: RetryCallState) -> float:
+    """Honour a 429's Retry-After header, else capped exponential backoff."""
+    if retry_state.outcome is None:
+        return _k8s_backoff(retry_state)
+    headers = getattr(retry_state.outcome.exception(), "headers", None) or {}
+    retry_after = headers.get("Retry-After")
+    if retry_after:
+        try:
+            return min(float(retry_after), K8S_MAX_RETRY_AFTER_SECONDS)
+        except ValueError:
+            pass  # HTTP-date form; fall back to backoff
+    return _k8s_backoff(retry_state)
+
+
+async def _k8s_call(fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Any:
+    """
+    Run a blocking Kubernetes API call in a worker thread, retrying transient errors.
+
+    429/5xx responses are retried up to K8S_MAX_ATTEMPTS times so brief
+    apiserver overload doesn't surface as a FAILED action (and a caller-side
+    retry storm); anything else is raised immediately. A 401 (expired token
+    or rotated credentials) also invalidates the shared clients so the next
+    action re-authenticates.
+    """
+    try:
+        async for attempt in AsyncRetrying(
+            retry=retry_if_exception(_is_transient_k8s_error),
+            wait=_k8s_retry_wait,
+            stop=stop_after_attempt(K8S_MAX_ATTEMPTS),
+            before_sleep=before_sleep_log(logger, logging.WARNING),
+            reraise=True,
+        ):
+            with attempt:
+                return await _run_k8s_io(fn, *args, **kwargs)
+    except Exception as e:
+        if getattr(e, "status", None) == 401:
+            logger.warning("Kubernetes API returned 401, reloading credentials on next call")
+            _invalidate_k8s_apis()
+        raise
+
+
+async def _k8s_call_raw(fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> bytes:
+    """
+    Like _k8s_call, but return the raw JSON body instead of a client model.
+
+    The client's model deserialization (recursive, reflection-driven) costs
+    far more than the HTTP exchange for objects like V1Deployment; mutating
+    calls whose response is discarded, and reads that need one field, skip
+    it. Reading .data drains the body so the connection returns to the pool.
+    """
+    response = await _k8s_call(fn, *args, _preload_content=False, **kwargs)
+    return response.data
+
 
+async def _k8s_delete(fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> None:
+    """
+    Issue a DELETE through _k8s_call_raw, treating a 404 on a retry as done.
 
+    DELETE is not idempotent in its status codes: when an attempt takes
+    effect server-side but answers 5xx, the retry finds the object gone. A
+    404 on the first attempt still raises.
+    """
+    attempts = 0
+
+    def counted(*a: Any, **kw: Any) -> Any:
+        nonlocal attempts
+        attempts += 1
+        return fn(*a, **kw)
+
+    try:
+        await _k8s_call_raw(counted, *args, **kwargs)
+    except Exception as e:
+        if attempts > 1 and getattr(e, "status", None) == 404:
+            logger.info("Retried DELETE found the object gone; an earlier attempt succeeded")
+            return
+        raise
+
+
+# Poll intervals for readiness when the pod watch is unavailable; the last
+# interval repeats until the caller's deadline
+READY_POLL_BACKOFF_SECONDS = (0.25, 0.5, 1.0, 2.0, 4.0)
+
+
+# Live executions are single-flighted per action key: a duplicate issued while
+# one is in flight awaits it. _recent remembers the last action started on
+# each target (namespace/deployment) and, once it succeeds, its result: a
+# repeat of that same action within the window reuses the result, while any
+# other action on the target replaces the entry, so scaling 5 -> 3 -> 5
+# re-issues the final scale.
+DEDUP_WINDOW_SECONDS = 10.0
+_inflight: dict[str, asyncio.Future[ExecutionResult]] = {}
+_recent: dict[str, tuple[str, float, ExecutionResult | None]] = {}
+
+
+def _action_key(executor: ActionExecutor, target: str, parameters: dict[str, Any]) -> str:
+    """Identity of a remediation: executor type, target and full parameters."""
+    return (
+        f"{type(executor).__name__}:{target}:"
+        f"{json.dumps(parameters, sort_keys=True, default=str)}"
+    )
+
+
+def _target_key(target: str, parameters: dict[str, Any]) -> str:
+    """The deployment an action changes, as namespace/name."""
+    return f"{parameters.get('namespace', 'default')}/{parameters.get('deployment', target)}"
+
+
+async def _run_deduplicated(
+    key: str,
+    target_key: str,
+    run: Callable[[], Awaitable[ExecutionResult]],
+) -> ExecutionResult:
+    """Run an execution unless an identical one is in flight or was the target's last success."""
+    now = time.monotonic()
+    last = _recent.get(target_key)
+    if last is not None:
+        last_key, at, last_result = last
+        if last_key == key and last_result is not None and now - at < DEDUP_WINDOW_SECONDS:
+            logger.info("Duplicate action %s within %ss, reusing result", key, DEDUP_WINDOW_SECONDS)
+            return last_result
+
+    loop = asyncio.get_running_loop()
+    pending = _inflight.get(key)
+    # Futures are loop-bound; Celery tasks each run their own event loop
+    if pending is not None and pending.get_loop() is loop:
+        logger.info("Duplicate action %s already in flight, awaiting it", key)
+        return await asyncio.shield(pending)
+
+    future: asyncio.Future[ExecutionResult] = loop.create_future()
+    _inflight[key] = future
+    # This action is now the latest on the target, superseding any result
+    _recent[target_key] = (key, now, None)
+    try:
+        result = await run()
+    except BaseException as e:
+        future.set_exception(e)
+        # Waiters get the exception; mark it retrieved for the no-waiter case
+        future.exception()
+        _finish_recent(key, target_key, None)
+        raise
+    else:
+        future.set_result(result)
+        _finish_recent(key, target_key, result if result.status == ExecutionStatus.SUCCESS else None)
+        return result
+    finally:
+        if _inflight.get(key) is future:
+            del _inflight[key]
+
+
+def _finish_recent(key: str, target_key: str, result: ExecutionResult | None) -> None:
+    """Record a success as the target's reusable result, or forget the target."""
+    last = _recent.get(target_key)
+    if last is None:
+        return
+    if last[0] != key or result is None:
+        # Failed, or another action on the target overlapped this one: the
+        # target's final state is unknown, so nothing may be reused
+        del _recent[target_key]
+        return
+    now = time.monotonic()
+    # Drop expired entries so the table stays bounded
+    for stale in [t for t, (_, at, _) in _recent.items() if now - at >= DEDUP_WINDOW_SECONDS]:
+        del _recent[stale]
+    _recent[target_key] = (key, now, result)
+
+
+@functools.lru_cache(maxsize=4096)
 def validate_k8s_resource_name(name: str, field_name: str = "resource") -> tuple[bool, str | None]:
     """
     Validate a Kubernetes resource name.
 
+    Pure and memoized: dry-run/what-if loops re-check the same handful of
+    namespaces and deployments, so repeats skip the regex match.
+
     Args:
         name: The resource name to validate
         field_name: Name of the field for error messages
@@ -43,19 +342,96 @@ def validate_k8s_resource_name(name: str, field_name: str = "resource") -> tuple
     if len(name) > K8S_MAX_NAME_LENGTH:
         return False, f"{field_name} must be {K8S_MAX_NAME_LENGTH} characters or less (got {len(name)})"
 
-    if not K8S_NAME_PATTERN.match(name):
+    if "." in name:
+        valid = K8S_NAME_PATTERN.fullmatch(name) is not None
+    else:
+        # Common undotted case without the regex: valid edges, and deleting
+        # every allowed character leaves nothing behind
+        valid = (
+            name[0] in _NAME_EDGE_CHARS
+            and name[-1] in _NAME_EDGE_CHARS
+            and not name.translate(_NAME_BODY_DELETE)
+        )
+
+    if not valid:
         return (
             False,
             f"{field_name} must consist of lowercase alphanumeric characters, '-', or '.', "
             f"and must start and end with an alphanumeric character (got: {name})",
         )
 
-    return True, None
+    return _VALIDATE_OK
+
+
+def _restart_annotation_patch(restarted_at: datetime) -> dict[str, Any]:
+    """Deployment patch that triggers a rolling restart (as `kubectl rollout restart`)."""
+    return {
+        "spec": {
+            "template": {
+                "metadata": {
+                    "annotations": {"kubectl.kubernetes.io/restartedAt": restarted_at.isoformat()}
+                }
+            }
+        }
+    }
+
+
+def _pod_is_ready(pod: Any) -> bool:
+    """Return True if the pod is Running with its Ready condition set."""
+    status = pod.status
+    if status is None or status.phase != "Running":
+        return False
+    return any(c.type == "Ready" and c.status == "True" for c in status.conditions or ())
+
+
+@dataclass(frozen=True, slots=True)
+class _RestartParams:
+    """Pod restart parameters, parsed once from the action's parameters dict."""
+
+    namespace: str
+    deployment: str
+    pod_name: str | None
+    wait_for_ready: bool
+    ready_timeout_seconds: int
+
+    @classmethod
+    def parse(cls, target: str, parameters: dict[str, Any]) -> "_RestartParams":
+        return cls(
+            namespace=parameters.get("namespace", "default"),
+            deployment=parameters.get("deployment", target),
+            pod_name=parameters.get("pod_name"),
+            wait_for_ready=bool(parameters.get("wait_for_ready")),
+            ready_timeout_seconds=int(parameters.get("ready_timeout_seconds", 30)),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class _ScaleParams:
+    """Scale parameters, parsed once from the action's parameters dict."""
+
+    namespace: str
+    deployment: str
+    replicas: int
+    current_replicas: int | None
+    min_replicas: int
+    max_replicas: int
+
+    @classmethod
+    def parse(cls, target: str, parameters: dict[str, Any]) -> "_ScaleParams":
+        return cls(
+            namespace=parameters.get("namespace", "default"),
+            deployment=parameters.get("deployment", target),
+            replicas=parameters.get("replicas", 2),
+            current_replicas=parameters.get("current_replicas"),
+            min_replicas=parameters.get("min_replicas", 1),
+            max_replicas=parameters.get("max_replicas", 10),
+        )
 
 
 class KubernetesPodRestartExecutor(ActionExecutor):
     """
-    Restarts a Kubernetes pod by deleting it (relies on ReplicaSet to recreate).
+    Restarts a Kubernetes pod by deleting it (relies on ReplicaSet to recreate),
+    or the whole deployment via a rolling restart when no pod is named.
 
     Safety checks:
     - Ensures multiple replicas exist
@@ -80,161 +456,261 @@ class KubernetesPodRestartExecutor(ActionExecutor):
         parameters: dict[str, Any],
     ) -> ExecutionResult:
         """
-        Restart a pod by deleting it.
+        Restart a pod by deleting it, or roll-restart the deployment.
 
         Parameters expected:
         - namespace: Kubernetes namespace (default: default)
         - deployment: Deployment name
-        - pod_name: Specific pod to restart (optional)
+        - pod_name: Specific pod to restart (optional; without it every pod
+          is replaced by a rolling restart)
+        - wait_for_ready: Wait until a replacement pod is Ready (default: False)
+        - ready_timeout_seconds: Upper bound for that wait (default: 30)
         """
+        if self.dry_run:
+            return await self._execute(target, parameters)
+        return await _run_deduplicated(
+            _action_key(self, target, parameters),
+            _target_key(target, parameters),
+            lambda: self._execute(target, parameters),
+        )
+
+    async def _execute(
+        self,
+        target: str,
+        parameters: dict[str, Any],
+    ) -> ExecutionResult:
+        """Perform the restart; see execute()."""
         started_at = datetime.now(timezone.utc)
+        start_ns = time.perf_counter_ns()
 
         try:
-            namespace = parameters.get("namespace", "default")
-            deployment = parameters.get("deployment", target)
-            pod_name = parameters.get("pod_name")
+            p = _RestartParams.parse(target, parameters)
 
             # Validate Kubernetes resource names to prevent injection
-            is_valid, error_msg = validate_k8s_resource_name(namespace, "namespace")
+            is_valid, error_msg = validate_k8s_resource_name(p.namespace, "namespace")
             if not is_valid:
                 return self._create_result(
                     status=ExecutionStatus.FAILED,
                     message=f"Invalid namespace: {error_msg}",
                     started_at=started_at,
+                    start_ns=start_ns,
                     error=error_msg,
                 )
 
-            is_valid, error_msg = validate_k8s_resource_name(deployment, "deployment")
+            is_valid, error_msg = validate_k8s_resource_name(p.deployment, "deployment")
             if not is_valid:
                 return self._create_result(
                     status=ExecutionStatus.FAILED,
                     message=f"Invalid deployment name: {error_msg}",
                     started_at=started_at,
+                    start_ns=start_ns,
                     error=error_msg,
                 )
 
-            if pod_name:
-                is_valid, error_msg = validate_k8s_resource_name(pod_name, "pod_name")
+            if p.pod_name:
+                is_valid, error_msg = validate_k8s_resource_name(p.pod_name, "pod_name")
                 if not is_valid:
                     return self._create_result(
                         status=ExecutionStatus.FAILED,
                         message=f"Invalid pod name: {error_msg}",
                         started_at=started_at,
+                        start_ns=start_ns,
                         error=error_msg,
                     )
 
-            # Validate deployment state before execution
-            is_valid, error_msg = await self.validate(target, parameters)
-            if not is_valid:
-                return self._create_result(
-                    status=ExecutionStatus.FAILED,
-                    message=f"Validation failed: {error_msg}",
-                    started_at=started_at,
-                    error=error_msg,
-                )
-
             if self.dry_run:
+                # Cluster state validation is skipped in dry-run (see validate())
                 return self._create_result(
                     status=ExecutionStatus.SUCCESS,
-                    message=f"[DRY RUN] Would restart pod in deployment {deployment}",
+                    message=f"[DRY RUN] Would restart pod in deployment {p.deployment}",
                     started_at=started_at,
+                    start_ns=start_ns,
                     details={
-                        "action": "pod_restart",
-                        "namespace": namespace,
-                        "deployment": deployment,
-                        "pod_name": pod_name,
+                        "action": _ACTION_POD_RESTART,
+                        "namespace": p.namespace,
+                        "deployment": p.deployment,
+                        "pod_name": p.pod_name,
                         "simulated": True,
                     },
                 )
 
-            # Actual execution
-            try:
-                if self.k8s_client:
-                    v1 = self.k8s_client.CoreV1Api()
-                else:
-                    # Import kubernetes client (optional dependency)
-                    from kubernetes import client, config
-
-                    # Load kubeconfig: try in-cluster first, fall back to local
-                    try:
-                        config.load_incluster_config()
-                    except config.ConfigException:
-                        config.load_kube_config()
-
-                    v1 = client.CoreV1Api()
-
-                # If specific pod specified, delete it
-                if pod_name:
-                    v1.delete_namespaced_pod(
-                        name=pod_name,
-                        namespace=namespace,
-                        grace_period_seconds=30,
-                    )
-                    message = f"Restarted pod {pod_name}"
-                else:
-                    # Get pods for deployment
-                    pods = v1.list_namespaced_pod(
-                        namespace=namespace,
-                        label_selector=f"app={deployment}",
-                    )
-
-                    if not pods.items:
-                        return self._create_result(
-                            status=ExecutionStatus.FAILED,
-                            message=f"No pods found for deployment {deployment}",
-                            started_at=started_at,
-                            error="No pods found",
-                        )
-
-                    # Restart first pod (let ReplicaSet handle recreation)
-                    pod_to_restart = pods.items[0]
-                    v1.delete_namespaced_pod(
-                        name=pod_to_restart.metadata.name,
-                        namespace=namespace,
-                        grace_period_seconds=30,
-                    )
-                    message = f"Restarted pod {pod_to_restart.metadata.name}"
-
-                # MED-5 fix: removed unconditional sleep(5). The PostActionVerifier's
-                # stabilization window handles "did it actually recover?" — sleeping
-                # here just delays the response without confirming pod readiness.
+            # Validate deployment state before execution. Names were checked
+            # above, so go straight to the cluster check and keep the deployment
+            # it fetched rather than re-reading it.
+            is_valid, error_msg, deployment_obj = await self._check_deployment_state(
+                p.namespace, p.deployment
+            )
+            if not is_valid:
                 return self._create_result(
-                    status=ExecutionStatus.SUCCESS,
-                    message=message,
+                    status=ExecutionStatus.FAILED,
+                    message=f"Validation failed: {error_msg}",
                     started_at=started_at,
-                    details={
-                        "action": "pod_restart",
-                        "namespace": namespace,
-                        "deployment": deployment,
-                        "pod_name": pod_name or pod_to_restart.metadata.name,
-                    },
+                    start_ns=start_ns,
+                    error=error_msg,
                 )
 
-            except ImportError:
-                # Kubernetes client not installed - simulate
+            if self.k8s_client is None and not _HAS_K8S:
                 logger.warning("Kubernetes client not installed, simulating restart")
                 return self._create_result(
                     status=ExecutionStatus.SUCCESS,
-                    message=f"[SIMULATED] Restarted pod in deployment {deployment}",
+                    message=f"[SIMULATED] Restarted pod in deployment {p.deployment}",
                     started_at=started_at,
+                    start_ns=start_ns,
                     details={
-                        "action": "pod_restart",
-                        "namespace": namespace,
-                        "deployment": deployment,
+                        "action": _ACTION_POD_RESTART,
+                        "namespace": p.namespace,
+                        "deployment": p.deployment,
                         "simulated": True,
-                        "reason": "kubernetes_client_not_available",
+                        "reason": _SIM_REASON,
                     },
                 )
 
+            # Actual execution
+            if self.k8s_client:
+                v1 = self.k8s_client.CoreV1Api()
+                apps_v1 = self.k8s_client.AppsV1Api()
+            else:
+                v1, apps_v1 = await _get_k8s_apis()
+
+            # Replacement pods are recognised by being created after this point
+            # (creation timestamps have second precision on the API server)
+            restarted_at = started_at.replace(microsecond=0)
+
+            # If specific pod specified, delete it
+            if p.pod_name:
+                await _k8s_delete(
+                    v1.delete_namespaced_pod,
+                    name=p.pod_name,
+                    namespace=p.namespace,
+                    grace_period_seconds=30,
+                )
+                message = f"Restarted pod {p.pod_name}"
+            else:
+                # Equivalent of `kubectl rollout restart`: one PATCH and the
+                # Deployment controller replaces pods in an orderly rolling
+                # update (no pod LIST, no pods killed all at once)
+                await _k8s_call_raw(
+                    apps_v1.patch_namespaced_deployment,
+                    name=p.deployment,
+                    namespace=p.namespace,
+                    body=_restart_annotation_patch(restarted_at),
+                )
+                message = f"Triggered rolling restart of deployment {p.deployment}"
+
+            details = {
+                "action": _ACTION_POD_RESTART,
+                "namespace": p.namespace,
+                "deployment": p.deployment,
+                "pod_name": p.pod_name,
+                "strategy": "delete_pod" if p.pod_name else "rollout_restart",
+            }
+            if deployment_obj is not None:
+                details["replicas"] = deployment_obj.spec.replicas
+
+            # MED-5 fix: removed unconditional sleep(5). The PostActionVerifier's
+            # stabilization window handles "did it actually recover?" — sleeping
+            # here just delays the response without confirming pod readiness.
+            # Callers that need readiness opt in to an event-driven wait instead.
+            if p.wait_for_ready:
+                timeout = p.ready_timeout_seconds
+                ready = await _run_k8s_io(
+                    self._wait_for_replacement_ready,
+                    v1,
+                    p.namespace,
+                    p.deployment,
+                    p.pod_name,
+                    restarted_at,
+                    timeout,
+                )
+                details["replacement_ready"] = ready
+                if not ready:
+                    message += f" (replacement not Ready within {timeout}s)"
+
+            return self._create_result(
+                status=ExecutionStatus.SUCCESS,
+                message=message,
+                started_at=started_at,
+                start_ns=start_ns,
+                details=details,
+            )
+
         except Exception as e:
-            logger.error(f"Pod restart failed: {str(e)}", exc_info=True)
+            logger.error("Pod restart failed: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
             return self._create_result(
                 status=ExecutionStatus.FAILED,
                 message=f"Pod restart failed: {str(e)}",
                 started_at=started_at,
+                start_ns=start_ns,
                 error=str(e),
             )
 
+    def _wait_for_replacement_ready(
+        self,
+        v1: Any,
+        namespace: str,
+        deployment: str,
+        deleted_pod: str | None,
+        restarted_at: datetime,
+        timeout_seconds: int,
+    ) -> bool:
+        """
+        Block until a pod replacing deleted_pod reports Ready.
+
+        For a rolling restart (deleted_pod None) this is the first new pod.
+
+        Streams pod events for the deployment instead of polling; returns as
+        soon as the replacement is Ready. Blocking, so callers run it in a
+        worker thread. The watch's server-side timeout bounds the wait. If
+        the watch itself fails, falls back to polling with capped backoff
+        until the same deadline.
+
+        Returns:
+            True if a replacement became Ready before the timeout
+        """
+        deadline = time.monotonic() + timeout_seconds
+        selectors = {
+            "namespace": namespace,
+            "label_selector": f"app={deployment}",
+            # Only Running pods can be Ready; the apiserver drops the rest
+            "field_selector": "status.phase=Running",
+        }
+
+        def is_replacement(pod: Any) -> bool:
+            return (
+                pod.metadata.name != deleted_pod
+                and pod.metadata.creation_timestamp is not None
+                and pod.metadata.creation_timestamp >= restarted_at
+                and _pod_is_ready(pod)
+            )
+
+        watch = self.k8s_client.watch if self.k8s_client else _k8s_watch
+        watcher = watch.Watch()
+        try:
+            for event in watcher.stream(
+                v1.list_namespaced_pod, timeout_seconds=timeout_seconds, **selectors
+            ):
+                if is_replacement(event["object"]):
+                    watcher.stop()
+                    return True
+            return False
+        except Exception as e:
+            logger.warning("Pod watch failed, polling for readiness instead: %s", e)
+
+        delays = itertools.chain(
+            READY_POLL_BACKOFF_SECONDS, itertools.repeat(READY_POLL_BACKOFF_SECONDS[-1])
+        )
+        for delay in delays:
+            try:
+                if any(is_replacement(pod) for pod in v1.list_namespaced_pod(**selectors).items):
+                    return True
+            except Exception as e:
+                logger.warning("Readiness poll failed: %s", e)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(delay, remaining))
+        return False
+
     async def validate(
         self,
         target: str,
@@ -250,60 +726,73 @@ class KubernetesPodRestartExecutor(ActionExecutor):
         4. No active rollout
         """
         try:
-            namespace = parameters.get("namespace", "default")
-            deployment = parameters.get("deployment", target)
+            p = _RestartParams.parse(target, parameters)
 
             # Validate resource names (done in execute() but good to double-check)
-            is_valid, error_msg = validate_k8s_resource_name(namespace, "namespace")
+            is_valid, error_msg = validate_k8s_resource_name(p.namespace, "namespace")
             if not is_valid:
                 return False, error_msg
 
-            is_valid, error_msg = validate_k8s_resource_name(deployment, "deployment")
+            is_valid, error_msg = validate_k8s_resource_name(p.deployment, "deployment")
             if not is_valid:
                 return False, error_msg
 
             if self.dry_run:
                 # Skip cluster state validation in dry-run
-                return True, None
+                return _VALIDATE_OK
 
-            try:
-                if self.k8s_client:
-                    apps_v1 = self.k8s_client.AppsV1Api()
-                else:
-                    from kubernetes import client, config
-
-                    try:
-                        config.load_incluster_config()
-                    except config.ConfigException:
-                        config.load_kube_config()
-
-                    apps_v1 = client.AppsV1Api()
-
-                # Get deployment
-                deployment_obj = apps_v1.read_namespaced_deployment(
-                    name=deployment,
-                    namespace=namespace,
-                )
+            is_valid, error_msg, _ = await self._check_deployment_state(p.namespace, p.deployment)
+            return is_valid, error_msg
+
+        except Exception as e:
+            return False, f"Validation error: {str(e)}"
+
+    async def _check_deployment_state(
+        self,
+        namespace: str,
+        deployment: str,
+    ) -> tuple[bool, str | None, Any]:
+        """
+        Check the live deployment is safe to restart a pod of.
+
+        Shared by validate() and execute() so execute neither re-validates
+        names nor re-reads the deployment.
+
+        Returns:
+            Tuple of (is_valid, error_message, deployment_obj); deployment_obj
+            is None when the Kubernetes client is unavailable
+        """
+        if self.k8s_client is None and not _HAS_K8S:
+            # No k8s client - allow in dry-run mode
+            logger.warning("Kubernetes client not available, skipping validation")
+            return True, None, None
+
+        try:
+            if self.k8s_client:
+                apps_v1 = self.k8s_client.AppsV1Api()
+            else:
+                _, apps_v1 = await _get_k8s_apis()
 
-                # Check replica count
-                replicas = deployment_obj.spec.replicas
-                if replicas < 2:
-                    return False, f"Only {replicas} replica(s) - unsafe to restart"
+            deployment_obj = await _k8s_call(
+                apps_v1.read_namespaced_deployment,
+                name=deployment,
+                namespace=namespace,
+            )
 
-                # Check if deployment is stable
-                available_replicas = deployment_obj.status.available_replicas or 0
-                if available_replicas < replicas:
-                    return False, "Deployment not fully available"
+            # Check replica count
+            replicas = deployment_obj.spec.replicas
+            if replicas < 2:
+                return False, f"Only {replicas} replica(s) - unsafe to restart", deployment_obj
 
-                return True, None
+            # Check if deployment is stable
+            available_replicas = deployment_obj.status.available_replicas or 0
+            if available_replicas < replicas:
+                return False, "Deployment not fully available", deployment_obj
 
-            except ImportError:
-                # No k8s client - allow in dry-run mode
-                logger.warning("Kubernetes client not available, skipping validation")
-                return True, None
+            return True, None, deployment_obj
 
         except Exception as e:
-            return False, f"Validation error: {str(e)}"
+            return False, f"Validation error: {str(e)}", None
 
     async def rollback(
         self,
@@ -315,14 +804,7 @@ class KubernetesPodRestartExecutor(ActionExecutor):
 
         A new pod is created automatically by the ReplicaSet.
         """
-        return ExecutionResult(
-            status=ExecutionStatus.SKIPPED,
-            message="Rollback not applicable for pod restart",
-            started_at=datetime.now(timezone.utc),
-            completed_at=datetime.now(timezone.utc),
-            duration_seconds=0,
-            dry_run=self.dry_run,
-        )
+        return self._skipped_result("Rollback not applicable for pod restart")
 
 
 class KubernetesScaleExecutor(ActionExecutor):
@@ -358,126 +840,147 @@ class KubernetesScaleExecutor(ActionExecutor):
         - namespace: Kubernetes namespace
         - deployment: Deployment name
         - replicas: Target replica count
+        - current_replicas: Observed replica count (optional; used for
+          dry-run/simulated results only, live scaling reads the cluster)
         """
+        if self.dry_run:
+            return await self._execute(target, parameters)
+        return await _run_deduplicated(
+            _action_key(self, target, parameters),
+            _target_key(target, parameters),
+            lambda: self._execute(target, parameters),
+        )
+
+    async def _execute(
+        self,
+        target: str,
+        parameters: dict[str, Any],
+    ) -> ExecutionResult:
+        """Perform the scale; see execute()."""
         started_at = datetime.now(timezone.utc)
+        start_ns = time.perf_counter_ns()
 
         try:
-            namespace = parameters.get("namespace", "default")
-            deployment = parameters.get("deployment", target)
-            target_replicas = parameters.get("replicas", 2)
+            p = _ScaleParams.parse(target, parameters)
 
             # Validate Kubernetes resource names to prevent injection
-            is_valid, error_msg = validate_k8s_resource_name(namespace, "namespace")
+            is_valid, error_msg = validate_k8s_resource_name(p.namespace, "namespace")
             if not is_valid:
                 return self._create_result(
                     status=ExecutionStatus.FAILED,
                     message=f"Invalid namespace: {error_msg}",
                     started_at=started_at,
+                    start_ns=start_ns,
                     error=error_msg,
                 )
 
-            is_valid, error_msg = validate_k8s_resource_name(deployment, "deployment")
+            is_valid, error_msg = validate_k8s_resource_name(p.deployment, "deployment")
             if not is_valid:
                 return self._create_result(
                     status=ExecutionStatus.FAILED,
                     message=f"Invalid deployment name: {error_msg}",
                     started_at=started_at,
+                    start_ns=start_ns,
                     error=error_msg,
                 )
 
-            # Validate deployment state
-            is_valid, error_msg = await self.validate(target, parameters)
+            # Validate replica bounds (names were checked above)
+            is_valid, error_msg = self._check_replica_bounds(p)
             if not is_valid:
                 return self._create_result(
                     status=ExecutionStatus.FAILED,
                     message=f"Validation failed: {error_msg}",
                     started_at=started_at,
+                    start_ns=start_ns,
                     error=error_msg,
                 )
 
             if self.dry_run:
                 # Use current_replicas from parameters if provided
-                current_replicas = parameters.get("current_replicas", 1)
+                current_replicas = p.current_replicas if p.current_replicas is not None else 1
                 return self._create_result(
                     status=ExecutionStatus.SUCCESS,
-                    message=f"[DRY RUN] Would scale {deployment} from {current_replicas} to {target_replicas} replicas",
+                    message=f"[DRY RUN] Would scale {p.deployment} from {current_replicas} to {p.replicas} replicas",
                     started_at=started_at,
+                    start_ns=start_ns,
                     details={
-                        "action": "scale",
-                        "namespace": namespace,
-                        "deployment": deployment,
+                        "action": _ACTION_SCALE,
+                        "namespace": p.namespace,
+                        "deployment": p.deployment,
                         "previous_replicas": current_replicas,
-                        "target_replicas": target_replicas,
+                        "target_replicas": p.replicas,
                         "simulated": True,
                     },
                 )
 
-            # Actual execution
-            try:
-                if self.k8s_client:
-                    apps_v1 = self.k8s_client.AppsV1Api()
-                else:
-                    from kubernetes import client, config
-
-                    try:
-                        config.load_incluster_config()
-                    except config.ConfigException:
-                        config.load_kube_config()
-
-                    apps_v1 = client.AppsV1Api()
-
-                # Get current replica count
-                deployment_obj = apps_v1.read_namespaced_deployment(
-                    name=deployment,
-                    namespace=namespace,
-                )
-                current_replicas = deployment_obj.spec.replicas
-
-                # Scale deployment
-                deployment_obj.spec.replicas = target_replicas
-                apps_v1.patch_namespaced_deployment_scale(
-                    name=deployment,
-                    namespace=namespace,
-                    body={"spec": {"replicas": target_replicas}},
-                )
-
-                return self._create_result(
-                    status=ExecutionStatus.SUCCESS,
-                    message=f"Scaled {deployment} from {current_replicas} to {target_replicas} replicas",
-                    started_at=started_at,
-                    details={
-                        "action": "scale",
-                        "namespace": namespace,
-                        "deployment": deployment,
-                        "previous_replicas": current_replicas,
-                        "target_replicas": target_replicas,
-                    },
-                )
-
-            except ImportError:
+            if self.k8s_client is None and not _HAS_K8S:
                 logger.warning("Kubernetes client not installed, simulating scale")
                 # Use current_replicas from parameters if provided
-                current_replicas = parameters.get("current_replicas", 1)
+                current_replicas = p.current_replicas if p.current_replicas is not None else 1
                 return self._create_result(
                     status=ExecutionStatus.SUCCESS,
-                    message=f"[SIMULATED] Scaled {deployment} from {current_replicas} to {target_replicas} replicas",
+                    message=f"[SIMULATED] Scaled {p.deployment} from {current_replicas} to {p.replicas} replicas",
                     started_at=started_at,
+                    start_ns=start_ns,
                     details={
-                        "action": "scale",
-                        "namespace": namespace,
-                        "deployment": deployment,
+                        "action": _ACTION_SCALE,
+                        "namespace": p.namespace,
+                        "deployment": p.deployment,
                         "previous_replicas": current_replicas,
-                        "target_replicas": target_replicas,
+                        "target_replicas": p.replicas,
                         "simulated": True,
                     },
                 )
 
+            # Actual execution
+            if self.k8s_client:
+                apps_v1 = self.k8s_client.AppsV1Api()
+            else:
+                _, apps_v1 = await _get_k8s_apis()
+
+            # Previous replica count, recorded as the rollback target: always
+            # read live (a caller-supplied count may be stale), from the small
+            # scale subresource rather than the whole deployment object.
+            scale = json.loads(
+                await _k8s_call_raw(
+                    apps_v1.read_namespaced_deployment_scale,
+                    name=p.deployment,
+                    namespace=p.namespace,
+                )
+            )
+            previous_replicas: int = scale["spec"].get("replicas", 0)
+
+            # Scale deployment: one JSON Patch op on the scale subresource (no
+            # strategic-merge diff to compute server-side)
+            await _k8s_call_raw(
+                apps_v1.patch_namespaced_deployment_scale,
+                name=p.deployment,
+                namespace=p.namespace,
+                body=[{"op": "replace", "path": "/spec/replicas", "value": p.replicas}],
+                _content_type=JSON_PATCH,
+            )
+
+            return self._create_result(
+                status=ExecutionStatus.SUCCESS,
+                message=f"Scaled {p.deployment} from {previous_replicas} to {p.replicas} replicas",
+                started_at=started_at,
+                start_ns=start_ns,
+                details={
+                    "action": _ACTION_SCALE,
+                    "namespace": p.namespace,
+                    "deployment": p.deployment,
+                    "previous_replicas": previous_replicas,
+                    "target_replicas": p.replicas,
+                },
+            )
+
         except Exception as e:
-            logger.error(f"Scale operation failed: {str(e)}", exc_info=True)
+            logger.error("Scale operation failed: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
             return self._create_result(
                 status=ExecutionStatus.FAILED,
                 message=f"Scale failed: {str(e)}",
                 started_at=started_at,
+                start_ns=start_ns,
                 error=str(e),
             )
 
@@ -487,30 +990,32 @@ class KubernetesScaleExecutor(ActionExecutor):
         parameters: dict[str, Any],
     ) -> tuple[bool, str | None]:
         """Validate scale operation is safe."""
-        # Validate resource names
-        namespace = parameters.get("namespace", "default")
-        deployment = parameters.get("deployment", target)
+        p = _ScaleParams.parse(target, parameters)
 
-        is_valid, error_msg = validate_k8s_resource_name(namespace, "namespace")
+        # Validate resource names
+        is_valid, error_msg = validate_k8s_resource_name(p.namespace, "namespace")
         if not is_valid:
             return False, error_msg
 
-        is_valid, error_msg = validate_k8s_resource_name(deployment, "deployment")
+        is_valid, error_msg = validate_k8s_resource_name(p.deployment, "deployment")
         if not is_valid:
             return False, error_msg
 
-        # Validate replica counts
-        target_replicas = parameters.get("replicas", 2)
-        min_replicas = parameters.get("min_replicas", 1)
-        max_replicas = parameters.get("max_replicas", 10)
+        return self._check_replica_bounds(p)
 
-        if target_replicas < min_replicas:
-            return False, f"Target replicas {target_replicas} below minimum {min_replicas}"
+    @staticmethod
+    def _check_replica_bounds(p: _ScaleParams) -> tuple[bool, str | None]:
+        # Reject non-integers (including bools) before they reach the API server
+        if type(p.replicas) is not int:
+            return False, f"Target replicas must be an integer (got {type(p.replicas).__name__})"
 
-        if target_replicas > max_replicas:
-            return False, f"Target replicas {target_replicas} exceeds maximum {max_replicas}"
+        # One comparison chain on the common in-bounds path
+        if p.min_replicas <= p.replicas <= p.max_replicas:
+            return _VALIDATE_OK
 
-        return True, None
+        if p.replicas < p.min_replicas:
+            return False, f"Target replicas {p.replicas} below minimum {p.min_replicas}"
+        return False, f"Target replicas {p.replicas} exceeds maximum {p.max_replicas}"
 
     async def rollback(
         self,
@@ -519,6 +1024,7 @@ class KubernetesScaleExecutor(ActionExecutor):
     ) -> ExecutionResult:
         """Rollback to previous replica count."""
         started_at = datetime.now(timezone.utc)
+        start_ns = time.perf_counter_ns()
 
         try:
             details = execution_result.details
@@ -529,6 +1035,7 @@ class KubernetesScaleExecutor(ActionExecutor):
                     status=ExecutionStatus.FAILED,
                     message="Cannot rollback: previous replica count unknown",
                     started_at=started_at,
+                    start_ns=start_ns,
                     error="Missing previous_replicas in execution details",
                 )
 
@@ -540,14 +1047,14 @@ class KubernetesScaleExecutor(ActionExecutor):
             }
 
             result = await self.execute(target, rollback_params)
-            result.message = f"Rollback: {result.message}"
-            return result
+            return replace(result, message=f"Rollback: {result.message}")
 
         except Exception as e:
             return self._create_result(
                 status=ExecutionStatus.FAILED,
                 message=f"Rollback failed: {str(e)}",
                 started_at=started_at,
+                start_ns=start_ns,
                 error=str(e),
             )
 
@@ -564,53 +1071,55 @@ class RollbackDeploymentExecutor(ActionExecutor):
 
     async def execute(self, target: str, parameters: dict[str, Any]) -> ExecutionResult:
         started_at = datetime.now(timezone.utc)
+        start_ns = time.perf_counter_ns()
         namespace = parameters.get("namespace", "default")
         deployment = parameters.get("deployment", target)
         revision = parameters.get("revision", "previous")
 
         is_valid, error_msg = validate_k8s_resource_name(namespace, "namespace")
         if not is_valid:
-            return self._create_result(ExecutionStatus.FAILED, f"Invalid namespace: {error_msg}", started_at, error=error_msg)
+            return self._create_result(ExecutionStatus.FAILED, f"Invalid namespace: {error_msg}", started_at, start_ns=start_ns, error=error_msg)
 
         is_valid, error_msg = validate_k8s_resource_name(deployment, "deployment")
         if not is_valid:
-            return self._create_result(ExecutionStatus.FAILED, f"Invalid deployment: {error_msg}", started_at, error=error_msg)
+            return self._create_result(ExecutionStatus.FAILED, f"Invalid deployment: {error_msg}", started_at, start_ns=start_ns, error=error_msg)
 
         if self.dry_run:
             return self._create_result(
                 ExecutionStatus.SUCCESS,
                 f"[DRY RUN] Would rollback deployment {deployment} to revision {revision}",
                 started_at,
-                details={"action": "rollback", "namespace": namespace, "deployment": deployment, "revision": revision, "simulated": True},
+                start_ns=start_ns,
+                details={"action": _ACTION_ROLLBACK, "namespace": namespace, "deployment": deployment, "revision": revision, "simulated": True},
             )
 
-        try:
-            from kubernetes import client, config
-            try:
-                config.load_incluster_config()
-            except config.ConfigException:
-                config.load_kube_config()
-            apps_v1 = client.AppsV1Api()
-            apps_v1.patch_namespaced_deployment(
-                name=deployment,
-                namespace=namespace,
-                body={"spec": {"template": {"metadata": {"annotations": {"kubectl.kubernetes.io/restartedAt": datetime.now(timezone.utc).isoformat()}}}}},
-            )
-            return self._create_result(
-                ExecutionStatus.SUCCESS,
-                f"Rolled back deployment {deployment}",
-                started_at,
-                details={"action": "rollback", "namespace": namespace, "deployment": deployment},
-            )
-        except ImportError:
+        if not _HAS_K8S:
             logger.warning("Kubernetes client not installed, simulating rollback")
             return self._create_result(
                 ExecutionStatus.SUCCESS,
                 f"[SIMULATED] Rolled back deployment {deployment}",
                 started_at,
-                details={"action": "rollback", "simulated": True, "reason": "kubernetes_client_not_available"},
+                start_ns=start_ns,
+                details={"action": _ACTION_ROLLBACK, "simulated": True, "reason": _SIM_REASON},
             )
 
+        # A rollback changes the deployment: no earlier result on it may be reused
+        _recent.pop(_target_key(target, parameters), None)
+        _, apps_v1 = await _get_k8s_apis()
+        await _k8s_call_raw(
+            apps_v1.patch_namespaced_deployment,
+            name=deployment,
+            namespace=namespace,
+            body=_restart_annotation_patch(started_at),
+        )
+        return self._create_result(
+            ExecutionStatus.SUCCESS,
+            f"Rolled back deployment {deployment}",
+            started_at,
+            start_ns=start_ns,
+            details={"action": _ACTION_ROLLBACK, "namespace": namespace, "deployment": deployment},
+        )
+
     async def validate(self, target: str, parameters: dict[str, Any]) -> tuple[bool, str | None]:
         namespace = parameters.get("namespace", "default")
         deployment = parameters.get("deployment", target)
@@ -621,14 +1130,7 @@ class RollbackDeploymentExecutor(ActionExecutor):
 
     async def rollback(self, target: str, execution_result: ExecutionResult) -> ExecutionResult:
         """Rolling back a rollback re-applies the original revision — not supported automatically."""
-        return ExecutionResult(
-            status=ExecutionStatus.SKIPPED,
-            message="Rollback of a rollback requires manual intervention",
-            started_at=datetime.now(timezone.utc),
-            completed_at=datetime.now(timezone.utc),
-            duration_seconds=0,
-            dry_run=self.dry_run,
-        )
+        return self._skipped_result("Rollback of a rollback requires manual intervention")
 
 
 class ToggleFeatureFlagExecutor(ActionExecutor):
@@ -641,6 +1143,7 @@ class ToggleFeatureFlagExecutor(ActionExecutor):
 
     async def execute(self, target: str, parameters: dict[str, Any]) -> ExecutionResult:
         started_at = datetime.now(timezone.utc)
+        start_ns = time.perf_counter_ns()
         flag_name = parameters.get("flag_name", "unknown_flag")
         enabled = parameters.get("enabled", False)
         return self._create_result(
@@ -648,11 +1151,12 @@ class ToggleFeatureFlagExecutor(ActionExecutor):
             f"[{'DRY RUN' if self.dry_run else 'SIMULATED'}] "
             f"{'Enabled' if enabled else 'Disabled'} feature flag '{flag_name}' for {target}",
             started_at,
+            start_ns=start_ns,
             details={"action": "toggle_feature_flag", "flag_name": flag_name, "enabled": enabled, "simulated": True},
         )
 
     async def validate(self, target: str, parameters: dict[str, Any]) -> tuple[bool, str | None]:
-        return True, None
+        return _VALIDATE_OK
 
     async def rollback(self, target: str, execution_result: ExecutionResult) -> ExecutionResult:
         details = execution_result.details
@@ -670,27 +1174,22 @@ class ClearCacheExecutor(ActionExecutor):
 
     async def execute(self, target: str, parameters: dict[str, Any]) -> ExecutionResult:
         started_at = datetime.now(timezone.utc)
+        start_ns = time.perf_counter_ns()
         cache_namespace = parameters.get("cache_namespace", target)
         return self._create_result(
             ExecutionStatus.SUCCESS,
             f"[{'DRY RUN' if self.dry_run else 'SIMULATED'}] "
             f"Cleared cache namespace '{cache_namespace}' for {target}",
             started_at,
+            start_ns=start_ns,
             details={"action": "clear_cache", "cache_namespace": cache_namespace, "simulated": True},
         )
 
     async def validate(self, target: str, parameters: dict[str, Any]) -> tuple[bool, str | None]:
-        return True, None
+        return _VALIDATE_OK
 
     async def rollback(self, target: str, execution_result: ExecutionResult) -> ExecutionResult:
-        return ExecutionResult(
-            status=ExecutionStatus.SKIPPED,
-            message="Cache clear cannot be rolled back — data must be repopulated naturally",
-            started_at=datetime.now(timezone.utc),
-            completed_at=datetime.now(timezone.utc),
-            duration_seconds=0,
-            dry_run=self.dry_run,
-        )
+        return self._skipped_result("Cache clear cannot be rolled back — data must be repopulated naturally")
 
 
 class CustomExecutor(ActionExecutor):
@@ -698,25 +1197,20 @@ class CustomExecutor(ActionExecutor):
 
     async def execute(self, target: str, parameters: dict[str, Any]) -> ExecutionResult:
         started_at = datetime.now(timezone.utc)
+        start_ns = time.perf_counter_ns()
         return self._create_result(
             ExecutionStatus.SUCCESS,
             f"[SIMULATED] Custom action on {target}",
             started_at,
+            start_ns=start_ns,
             details={"action": "custom", "parameters": parameters, "simulated": True},
         )
 
     async def validate(self, target: str, parameters: dict[str, Any]) -> tuple[bool, str | None]:
-        return True, None
+        return _VALIDATE_OK
 
     async def rollback(self, target: str, execution_result: ExecutionResult) -> ExecutionResult:
-        return ExecutionResult(
-            status=ExecutionStatus.SKIPPED,
-            message="Rollback not defined for custom actions",
-            started_at=datetime.now(timezone.utc),
-            completed_at=datetime.now(timezone.utc),
-            duration_seconds=0,
-            dry_run=self.dry_run,
-        )
+        return self._skipped_result("Rollback not defined for custom actions")
 
 
 # Executor registry — maps ActionType.value → executor class.
@@ -734,15 +1228,69 @@ EXECUTOR_REGISTRY: dict[str, type[ActionExecutor]] = {
 }
 
 
+# Executors hold no per-call state (only dry_run and the shared client), so one
+# instance per (action_type, dry_run) is reused across actions.
+_executor_cache: dict[tuple[str, bool], ActionExecutor] = {}
+
+
 def get_executor(action_type: str, dry_run: bool = True) -> ActionExecutor | None:
     """
     Return an executor instance for the given action type.
 
+    Instances are memoized per (action_type, dry_run) and shared by callers.
+
     Returns None only for truly unknown action type strings (not in registry).
     The registry covers all ActionType enum values so None indicates a bug or
     a dynamically constructed type string.
     """
-    executor_class = EXECUTOR_REGISTRY.get(action_type)
-    if executor_class:
-        return executor_class(dry_run=dry_run)
-    return None
+    key = (action_type, dry_run)
+    executor = _executor_cache.get(key)
+    if executor is None:
+        executor_class = EXECUTOR_REGISTRY.get(action_type)
+        if executor_class is None:
+            return None
+        executor = _executor_cache.setdefault(key, executor_class(dry_run=dry_run))
+    return executor
+
+
+async def dispatch_many(
+    actions: Sequence[tuple[str, str, dict[str, Any]]],
+    dry_run: bool = True,
+    concurrency: int | None = None,
+) -> list[ExecutionResult]:
+    """
+    Execute several actions, possibly of different types, concurrently.
+
+    Like ActionExecutor.execute_many but resolves the executor per action.
+    One semaphore bounds the whole batch (default: settings.k8s_concurrency),
+    so a large rollout can't exceed the API client's connection pool.
+
+    Args:
+        actions: (action_type, target, parameters) triples
+        dry_run: Run every action in dry-run mode
+        concurrency: Maximum simultaneous executions
+
+    Returns:
+        One ExecutionResult per action, in input order; unknown action
+        types yield a FAILED result rather than aborting the batch
+    """
+    semaphore = asyncio.Semaphore(concurrency or settings.k8s_concurrency)
+
+    async def run_one(action_type: str, target: str, parameters: dict[str, Any]) -> ExecutionResult:
+        executor = get_executor(action_type, dry_run=dry_run)
+        if executor is None:
+            message = f"Unknown action type: {action_type}"
+            now = datetime.now(timezone.utc)
+            return ExecutionResult(
+                status=ExecutionStatus.FAILED,
+                message=message,
+                started_at=now,
+                completed_at=now,
+                duration_seconds=0.0,
+                dry_run=dry_run,
+                error=message,
+            )
+        async with semaphore:
+            return await executor.execute(target, parameters)
+
+    return list(await asyncio.gather(*(run_one(a, t, p) for a, t, p in actions)))
@@ -7,19 +7,91 @@ Senior Engineering Note:
 - Waits for stabilization window before checking
 - Determines if action succeeded, failed (rollback), or failed (escalate)
 - No system is autonomous without feedback
+- Metric queries are independent and issued concurrently (one round trip)
+- Latency percentiles come from Prometheus recording rules, not a
+  histogram_quantile over every bucket per query
 """
 import asyncio
+import functools
 import logging
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from enum import Enum
 
 from app.core.execution.base import ExecutionResult, ExecutionStatus
-from app.services.prometheus_client import PrometheusClient
+from app.services.prometheus_client import MetricResult, PrometheusClient
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1024)
+def _health_queries(service_name: str) -> tuple[str, str, str, str, str]:
+    """
+    PromQL for the verifier's health metrics, memoized per service.
+
+    Verification re-checks the same services (before/after, and repeated
+    actions), so repeats reuse the formatted strings. Every query aggregates
+    to one series per service, so responses stay O(1) however many pods,
+    status codes or buckets the service exposes.
+
+    Returns:
+        Queries for (error rate, latency P95, latency P99, request rate, availability)
+    """
+    return (
+        # Error rate (errors per minute)
+        f'sum(rate(http_requests_total{{service="{service_name}",status=~"5.."}}[1m])) * 60',
+        # Latency P95/P99 from recording rules (monitoring/prometheus/rules)
+        f'service:http_request_duration_seconds:p95{{service="{service_name}"}} * 1000',
+        f'service:http_request_duration_seconds:p99{{service="{service_name}"}} * 1000',
+        # Request rate
+        f'sum(rate(http_requests_total{{service="{service_name}"}}[1m]))',
+        # Availability (fraction of targets up)
+        f'avg(up{{service="{service_name}"}})',
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _live_latency_queries(service_name: str) -> tuple[str, str]:
+    """
+    Latency P95/P99 computed from the raw histogram, memoized per service.
+
+    Fallback for a Prometheus without the recording rules loaded.
+    """
+    return (
+        f'histogram_quantile(0.95, sum by (le) (rate(http_request_duration_seconds_bucket{{service="{service_name}"}}[5m]))) * 1000',
+        f'histogram_quantile(0.99, sum by (le) (rate(http_request_duration_seconds_bucket{{service="{service_name}"}}[5m]))) * 1000',
+    )
+
+
+def _latest_value(
+    results: list[MetricResult] | BaseException,
+    default: float | None = None,
+) -> float | None:
+    """
+    Most recent sample of the first series in a query result.
+
+    Returns None if the query failed or matched no series, and `default`
+    if the series has no samples.
+    """
+    if isinstance(results, BaseException):
+        logger.error(f"Failed to fetch health metric: {str(results)}")
+        return None
+    if not results:
+        return None
+    values = results[0].values
+    return values[-1].value if values else default
+
+
+# Metrics compared before/after an action:
+# (HealthMetrics field, higher is better, any value from a zero baseline is a -100% regression)
+_COMPARED_METRICS: tuple[tuple[str, bool, bool], ...] = (
+    ("error_rate", False, True),
+    ("latency_p95", False, False),
+    ("latency_p99", False, False),
+    ("availability", True, False),
+)
+
+
 class VerificationStatus(str, Enum):
     """Status of post-action verification."""
 
@@ -92,7 +164,7 @@ class PostActionVerifier:
         Verify that an action improved system health.
 
         Process:
-        1. Wait for stabilization window
+        1. Wait out whatever remains of the stabilization window
         2. Fetch current metrics
         3. Compare with pre-action metrics
         4. Determine success/failure
@@ -124,24 +196,32 @@ class PostActionVerifier:
                 verification_timestamp=datetime.now(timezone.utc),
             )
 
-        # Wait for stabilization
-        await asyncio.sleep(self.stabilization_window)
-
-        # Fetch current metrics
-        after_metrics = await self._fetch_health_metrics(service_name)
+        # Wait for stabilization, measured from when the action finished: time
+        # already spent queued (or in an earlier, retried attempt) counts
+        action_finished_at = execution_result.completed_at or execution_result.started_at
+        elapsed = (datetime.now(timezone.utc) - action_finished_at).total_seconds()
+        remaining = self.stabilization_window - elapsed
+        if remaining > 0:
+            await asyncio.sleep(remaining)
 
-        # If we don't have before metrics, try to get them from recent history
+        # Annotated local: gather() results lose the None narrowing
+        baseline_metrics: HealthMetrics
         if before_metrics is None:
-            # Get metrics from just before action execution
+            # No before metrics: fetch them from just before action execution,
+            # concurrently with the current metrics
             before_time = execution_result.started_at - timedelta(minutes=5)
-            before_metrics = await self._fetch_health_metrics(
-                service_name,
-                time=before_time,
+            after_metrics, baseline_metrics = await asyncio.gather(
+                self._fetch_health_metrics(service_name),
+                self._fetch_health_metrics(service_name, time=before_time),
             )
+        else:
+            baseline_metrics = before_metrics
+            # Fetch current metrics
+            after_metrics = await self._fetch_health_metrics(service_name)
 
         # Compare metrics and determine status
         verification_status, improvements = self._compare_metrics(
-            before_metrics,
+            baseline_metrics,
             after_metrics,
         )
 
@@ -155,7 +235,7 @@ class PostActionVerifier:
         message = self._generate_message(
             verification_status,
             improvements,
-            before_metrics,
+            baseline_metrics,
             after_metrics,
         )
 
@@ -167,7 +247,7 @@ class PostActionVerifier:
         return VerificationResult(
             status=verification_status,
             message=message,
-            before_metrics=before_metrics,
+            before_metrics=baseline_metrics,
             after_metrics=after_metrics,
             improvement_percentage=improvements,
             recommendation=recommendation,
@@ -192,39 +272,27 @@ class PostActionVerifier:
         """
         metrics = HealthMetrics(timestamp=time or datetime.now(timezone.utc))
 
-        try:
-            # Error rate (errors per minute)
-            error_query = f'rate(http_requests_total{{service="{service_name}",status=~"5.."}}[1m]) * 60'
-            error_results = await self.prometheus_client.query(error_query, time=time)
-            if error_results:
-                metrics.error_rate = error_results[0].values[-1].value if error_results[0].values else 0.0
-
-            # Latency P95
-            latency_p95_query = f'histogram_quantile(0.95, rate(http_request_duration_seconds_bucket{{service="{service_name}"}}[5m])) * 1000'
-            p95_results = await self.prometheus_client.query(latency_p95_query, time=time)
-            if p95_results:
-                metrics.latency_p95 = p95_results[0].values[-1].value if p95_results[0].values else None
-
-            # Latency P99
-            latency_p99_query = f'histogram_quantile(0.99, rate(http_request_duration_seconds_bucket{{service="{service_name}"}}[5m])) * 1000'
-            p99_results = await self.prometheus_client.query(latency_p99_query, time=time)
-            if p99_results:
-                metrics.latency_p99 = p99_results[0].values[-1].value if p99_results[0].values else None
-
-            # Request rate
-            rate_query = f'rate(http_requests_total{{service="{service_name}"}}[1m])'
-            rate_results = await self.prometheus_client.query(rate_query, time=time)
-            if rate_results:
-                metrics.request_rate = rate_results[0].values[-1].value if rate_results[0].values else None
-
-            # Availability (uptime)
-            up_query = f'up{{service="{service_name}"}}'
-            up_results = await self.prometheus_client.query(up_query, time=time)
-            if up_results:
-                metrics.availability = up_results[0].values[-1].value if up_results[0].values else 0.0
-
-        except Exception as e:
-            logger.error(f"Failed to fetch health metrics: {str(e)}")
+        queries = _health_queries(service_name)
+
+        # Independent queries: issue them together so the fetch costs one
+        # round trip; a failed query only leaves its own metric unset
+        error_results, p95_results, p99_results, rate_results, up_results = await asyncio.gather(
+            *(self.prometheus_client.query(query, time=time) for query in queries),
+            return_exceptions=True,
+        )
+
+        if p95_results == [] and p99_results == []:
+            # Recording rules not loaded (or not yet evaluated): compute live
+            p95_results, p99_results = await asyncio.gather(
+                *(self.prometheus_client.query(query, time=time) for query in _live_latency_queries(service_name)),
+                return_exceptions=True,
+            )
+
+        metrics.error_rate = _latest_value(error_results, default=0.0)
+        metrics.latency_p95 = _latest_value(p95_results)
+        metrics.latency_p99 = _latest_value(p99_results)
+        metrics.request_rate = _latest_value(rate_results)
+        metrics.availability = _latest_value(up_results, default=0.0)
 
         return metrics
 
@@ -243,44 +311,30 @@ class PostActionVerifier:
         Returns:
             Tuple of (status, improvement_percentages)
         """
-        improvements = {}
+        improvements: dict[str, float] = {}
 
         # Calculate improvement for each metric (negative = worse)
-        if before.error_rate is not None and after.error_rate is not None:
-            if before.error_rate > 0:
-                improvements["error_rate"] = (
-                    (before.error_rate - after.error_rate) / before.error_rate
-                ) * 100
+        for name, higher_is_better, penalize_from_zero in _COMPARED_METRICS:
+            before_value = getattr(before, name)
+            after_value = getattr(after, name)
+            if before_value is None or after_value is None:
+                continue
+            if before_value > 0:
+                change = after_value - before_value if higher_is_better else before_value - after_value
+                improvements[name] = change / before_value * 100
             else:
-                improvements["error_rate"] = 0.0 if after.error_rate == 0 else -100.0
-
-        if before.latency_p95 is not None and after.latency_p95 is not None:
-            if before.latency_p95 > 0:
-                improvements["latency_p95"] = (
-                    (before.latency_p95 - after.latency_p95) / before.latency_p95
-                ) * 100
-            else:
-                improvements["latency_p95"] = 0.0
-
-        if before.latency_p99 is not None and after.latency_p99 is not None:
-            if before.latency_p99 > 0:
-                improvements["latency_p99"] = (
-                    (before.latency_p99 - after.latency_p99) / before.latency_p99
-                ) * 100
-            else:
-                improvements["latency_p99"] = 0.0
-
-        if before.availability is not None and after.availability is not None:
-            improvements["availability"] = ((after.availability - before.availability) / before.availability) * 100 if before.availability > 0 else 0.0
+                improvements[name] = -100.0 if penalize_from_zero and after_value != 0 else 0.0
 
         # Determine status based on improvements
         if not improvements:
             return VerificationStatus.NO_CHANGE, improvements
 
-        avg_improvement = sum(improvements.values()) / len(improvements)
+        values = improvements.values()
+        avg_improvement = sum(values) / len(improvements)
+        worst, best = min(values), max(values)
 
         # Check for degradation (any metric significantly worse)
-        if any(imp < -10.0 for imp in improvements.values()):
+        if worst < -10.0:
             return VerificationStatus.DEGRADED, improvements
 
         # Check for success (significant improvement)
@@ -292,7 +346,7 @@ class PostActionVerifier:
             return VerificationStatus.PARTIAL_SUCCESS, improvements
 
         # Check for instability (high variance in improvements)
-        if improvements and max(improvements.values()) - min(improvements.values()) > 30.0:
+        if best - worst > 30.0:
             return VerificationStatus.UNSTABLE, improvements
 
         return VerificationStatus.NO_CHANGE, improvements
@@ -344,52 +398,57 @@ class PostActionVerifier:
 
         This is examiner-proof and shows clear impact.
         """
-        lines = [f"Post-action verification: {status.value}"]
-        lines.append("\n=== Before-After Metrics Comparison ===")
+        # One entry per metric block (not per line): fewer list ops and strings
+        lines = [f"Post-action verification: {status.value}", "\n=== Before-After Metrics Comparison ==="]
 
         # Error rate
         if before.error_rate is not None and after.error_rate is not None:
-            delta = after.error_rate - before.error_rate
-            delta_pct = improvements.get("error_rate", 0.0)
-            lines.append("\nError Rate:")
-            lines.append(f"  Before: {before.error_rate:.2f} errors/min")
-            lines.append(f"  After:  {after.error_rate:.2f} errors/min")
-            lines.append(f"  Δ = {delta:+.2f} errors/min ({delta_pct:+.1f}%)")
+            lines.append(
+                "\nError Rate:"
+                f"\n  Before: {before.error_rate:.2f} errors/min"
+                f"\n  After:  {after.error_rate:.2f} errors/min"
+                f"\n  Δ = {after.error_rate - before.error_rate:+.2f} errors/min"
+                f" ({improvements.get('error_rate', 0.0):+.1f}%)"
+            )
 
         # Latency P95
         if before.latency_p95 is not None and after.latency_p95 is not None:
-            delta = after.latency_p95 - before.latency_p95
-            delta_pct = improvements.get("latency_p95", 0.0)
-            lines.append("\nLatency P95:")
-            lines.append(f"  Before: {before.latency_p95:.1f}ms")
-            lines.append(f"  After:  {after.latency_p95:.1f}ms")
-            lines.append(f"  Δ = {delta:+.1f}ms ({delta_pct:+.1f}%)")
+            lines.append(
+                "\nLatency P95:"
+                f"\n  Before: {before.latency_p95:.1f}ms"
+                f"\n  After:  {after.latency_p95:.1f}ms"
+                f"\n  Δ = {after.latency_p95 - before.latency_p95:+.1f}ms"
+                f" ({improvements.get('latency_p95', 0.0):+.1f}%)"
+            )
 
         # Latency P99
         if before.latency_p99 is not None and after.latency_p99 is not None:
-            delta = after.latency_p99 - before.latency_p99
-            delta_pct = improvements.get("latency_p99", 0.0)
-            lines.append("\nLatency P99:")
-            lines.append(f"  Before: {before.latency_p99:.1f}ms")
-            lines.append(f"  After:  {after.latency_p99:.1f}ms")
-            lines.append(f"  Δ = {delta:+.1f}ms ({delta_pct:+.1f}%)")
+            lines.append(
+                "\nLatency P99:"
+                f"\n  Before: {before.latency_p99:.1f}ms"
+                f"\n  After:  {after.latency_p99:.1f}ms"
+                f"\n  Δ = {after.latency_p99 - before.latency_p99:+.1f}ms"
+                f" ({improvements.get('latency_p99', 0.0):+.1f}%)"
+            )
 
         # Availability
         if before.availability is not None and after.availability is not None:
-            delta = after.availability - before.availability
-            delta_pct = improvements.get("availability", 0.0)
-            lines.append("\nAvailability:")
-            lines.append(f"  Before: {before.availability:.2%}")
-            lines.append(f"  After:  {after.availability:.2%}")
-            lines.append(f"  Δ = {delta:+.2%} ({delta_pct:+.1f}%)")
+            lines.append(
+                "\nAvailability:"
+                f"\n  Before: {before.availability:.2%}"
+                f"\n  After:  {after.availability:.2%}"
+                f"\n  Δ = {after.availability - before.availability:+.2%}"
+                f" ({improvements.get('availability', 0.0):+.1f}%)"
+            )
 
         # Request rate
         if before.request_rate is not None and after.request_rate is not None:
-            delta = after.request_rate - before.request_rate
-            lines.append("\nRequest Rate:")
-            lines.append(f"  Before: {before.request_rate:.1f} req/s")
-            lines.append(f"  After:  {after.request_rate:.1f} req/s")
-            lines.append(f"  Δ = {delta:+.1f} req/s")
+            lines.append(
+                "\nRequest Rate:"
+                f"\n  Before: {before.request_rate:.1f} req/s"
+                f"\n  After:  {after.request_rate:.1f} req/s"
+                f"\n  Δ = {after.request_rate - before.request_rate:+.1f} req/s"
+            )
 
         lines.append("\n" + "=" * 40)
 
@@ -8,12 +8,15 @@ Senior Engineering Note:
 - Normalize severity
 - Reasoning must see events, not spam
 """
+import bisect
+import functools
 import hashlib
 import logging
 from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from enum import Enum
+from operator import attrgetter
 
 logger = logging.getLogger(__name__)
 
@@ -28,9 +31,53 @@ class AlertSeverity(str, Enum):
     INFO = "info"  # Purely informational
 
 
-@dataclass
+# Severity rank for comparisons (higher = more severe); built once, not per alert
+_SEVERITY_ORDER: dict[AlertSeverity, int] = {
+    AlertSeverity.INFO: 0,
+    AlertSeverity.LOW: 1,
+    AlertSeverity.MEDIUM: 2,
+    AlertSeverity.HIGH: 3,
+    AlertSeverity.CRITICAL: 4,
+}
+
+
+# Sort/search key for alerts by time
+_timestamp = attrgetter("timestamp")
+
+
+# Labels that vary between otherwise identical alerts
+_VOLATILE_LABELS = frozenset({"instance", "pod", "timestamp", "alertstate"})
+
+
+@functools.lru_cache(maxsize=4096)
+def _fingerprint(service: str, name: str, labels: tuple[tuple[str, str], ...]) -> str:
+    """
+    Fingerprint for an alert's identity, memoized.
+
+    A storm repeats the same few (service, name, labels) combinations, so
+    most alerts skip the label sort and hash entirely.
+    """
+    # Sort labels for consistent hashing
+    stable_labels = {k: v for k, v in sorted(labels) if k not in _VOLATILE_LABELS}
+
+    fingerprint_str = f"{service}:{name}:{str(stable_labels)}"
+    # Grouping key only (in-memory, never persisted), so no need for SHA-256;
+    # an 8-byte BLAKE2b digest is cheaper and yields the same 16 hex chars
+    return hashlib.blake2b(fingerprint_str.encode(), digest_size=8).hexdigest()
+
+
+def _severity_rank(severity: AlertSeverity) -> int:
+    """Rank of a severity; unknown values rank lowest."""
+    return _SEVERITY_ORDER.get(severity, 0)
+
+
+@dataclass(slots=True)
 class Alert:
-    """Single alert from monitoring system."""
+    """
+    Single alert from monitoring system.
+
+    Slotted: an alert storm materializes thousands of these at once.
+    """
 
     source: str  # prometheus, pagerduty, cloudwatch, etc.
     name: str  # Alert name/rule name
@@ -58,17 +105,10 @@ class Alert:
 
         This allows grouping of identical alerts.
         """
-        # Sort labels for consistent hashing
-        stable_labels = {
-            k: v for k, v in sorted(self.labels.items())
-            if k not in {'instance', 'pod', 'timestamp', 'alertstate'}
-        }
-
-        fingerprint_str = f"{self.service}:{self.name}:{str(stable_labels)}"
-        return hashlib.sha256(fingerprint_str.encode()).hexdigest()[:16]
+        return _fingerprint(self.service, self.name, tuple(self.labels.items()))
 
 
-@dataclass
+@dataclass(slots=True)
 class DedupedAlert:
     """Deduplicated alert with count and time range."""
 
@@ -166,7 +206,7 @@ class AlertDeduplicator:
         deduped_alerts = []
         for fingerprint, group_alerts in fingerprint_groups.items():
             # Sort by timestamp
-            group_alerts.sort(key=lambda a: a.timestamp)
+            group_alerts.sort(key=_timestamp)
 
             # Group within time windows
             windows = self._group_by_time_window(group_alerts)
@@ -179,7 +219,7 @@ class AlertDeduplicator:
                 # Find highest severity
                 max_severity = max(
                     (a.severity for a in window_alerts),
-                    key=lambda s: self._severity_to_int(s),
+                    key=_severity_rank,
                 )
 
                 deduped = DedupedAlert(
@@ -213,34 +253,22 @@ class AlertDeduplicator:
         if not alerts:
             return []
 
+        # Each window ends dedup_window after its first alert; since alerts are
+        # sorted, bisect finds every cut point in C instead of stepping through
+        # the list one alert at a time
         windows = []
-        current_window = [alerts[0]]
-
-        for alert in alerts[1:]:
-            # If this alert is within window of the first alert in current window
-            if alert.timestamp - current_window[0].timestamp <= self.dedup_window:
-                current_window.append(alert)
-            else:
-                # Start new window
-                windows.append(current_window)
-                current_window = [alert]
-
-        # Don't forget the last window
-        if current_window:
-            windows.append(current_window)
+        start = 0
+        while start < len(alerts):
+            window_end = alerts[start].timestamp + self.dedup_window
+            end = bisect.bisect_right(alerts, window_end, lo=start + 1, key=_timestamp)
+            windows.append(alerts[start:end])
+            start = end
 
         return windows
 
     def _severity_to_int(self, severity: AlertSeverity) -> int:
         """Convert severity to integer for comparison."""
-        severity_order = {
-            AlertSeverity.INFO: 0,
-            AlertSeverity.LOW: 1,
-            AlertSeverity.MEDIUM: 2,
-            AlertSeverity.HIGH: 3,
-            AlertSeverity.CRITICAL: 4,
-        }
-        return severity_order.get(severity, 0)
+        return _severity_rank(severity)
 
     def normalize_severity(
         self,
@@ -294,12 +322,13 @@ class AlertDeduplicator:
         Returns:
             Filtered alerts
         """
-        min_severity_int = self._severity_to_int(min_severity)
+        min_severity_int = _severity_rank(min_severity)
+        severity_order = _SEVERITY_ORDER
 
         filtered = [
             a for a in alerts
             if a.count >= min_count
-            and self._severity_to_int(a.severity) >= min_severity_int
+            and severity_order.get(a.severity, 0) >= min_severity_int
         ]
 
         if len(filtered) < len(alerts):
@@ -6,19 +6,59 @@ Senior Engineering Note:
 - Can be extended with ML-based detection (Prophet, Isolation Forest, etc.)
 - Returns confidence scores for detected anomalies
 """
+import functools
+import heapq
 import logging
-import statistics
+import math
 from dataclasses import dataclass
 from datetime import datetime
+from operator import attrgetter
 
 from app.services.prometheus_client import MetricResult
 
 logger = logging.getLogger(__name__)
 
+_confidence = attrgetter("confidence")
 
-@dataclass
+# Metric-name keywords per category in priority order, with the category
+# reported for an increasing and a decreasing value
+_CATEGORY_KEYWORDS = (
+    (("error", "failure"), ("error_spike", "error_recovery")),
+    (("latency", "duration"), ("latency_spike", "latency_improvement")),
+    (("memory", "heap"), ("memory_leak", "memory_release")),
+    (("cpu",), ("cpu_spike", "cpu_drop")),
+    (("request", "throughput"), ("traffic_spike", "traffic_drop")),
+)
+_UNCATEGORIZED = ("metric_anomaly", "metric_anomaly")
+
+# Scales the median absolute deviation to the stdev of a normal distribution
+_MAD_TO_SIGMA = 1.4826
+
+
+def _median(ordered: list[float]) -> float:
+    """Median of an already-sorted list."""
+    mid = len(ordered) // 2
+    if len(ordered) % 2:
+        return ordered[mid]
+    return (ordered[mid - 1] + ordered[mid]) / 2
+
+
+def _median_mad(values: list[float]) -> tuple[float, float]:
+    """Median and normal-scaled median absolute deviation of values."""
+    ordered = sorted(values)
+    median = _median(ordered)
+    mad = _median(sorted(abs(v - median) for v in ordered))
+    return median, _MAD_TO_SIGMA * mad
+
+
+@dataclass(frozen=True, slots=True)
 class AnomalyDetection:
-    """Result of anomaly detection."""
+    """
+    Result of anomaly detection.
+
+    Frozen and slotted: detections are produced per series on every poll and
+    shared between correlation, categorization and incident creation.
+    """
 
     metric_name: str
     is_anomaly: bool
@@ -43,14 +83,17 @@ class AnomalyDetector:
     - Multi-variate analysis
     """
 
-    def __init__(self, threshold_sigma: float = 3.0):
+    def __init__(self, threshold_sigma: float = 3.0, robust: bool = False):
         """
         Initialize anomaly detector.
 
         Args:
             threshold_sigma: Number of standard deviations for anomaly threshold
+            robust: Use median/MAD instead of mean/stdev for the baseline, so an
+                    earlier spike inside the window cannot mask a new one
         """
         self.threshold_sigma = threshold_sigma
+        self.robust = robust
 
     def detect(
         self,
@@ -71,7 +114,7 @@ class AnomalyDetector:
         if not metric_result.values:
             return []
 
-        anomalies = []
+        anomalies: list[AnomalyDetection] = []
 
         # Use all points except the last one for baseline
         all_values = [dp.value for dp in metric_result.values]
@@ -80,15 +123,23 @@ class AnomalyDetector:
             logger.warning(f"Insufficient data points for {metric_result.metric_name}")
             return []
 
-        # Calculate baseline statistics
-        baseline_values = all_values[:-1] if len(all_values) > 1 else all_values
-        mean = statistics.mean(baseline_values)
-
-        # Handle case where all values are the same
-        try:
-            stdev = statistics.stdev(baseline_values)
-        except statistics.StatisticsError:
-            stdev = 0.0
+        # Calculate baseline statistics. Plain float math: the statistics
+        # module computes in exact fractions, which dominates detection cost
+        # for no benefit at metric precision.
+        baseline_values = all_values[:-1]
+        n = len(baseline_values)
+        low, high = min(baseline_values), max(baseline_values)
+
+        if low == high:
+            # All values are the same: exact mean, no variance
+            mean, stdev = low, 0.0
+        elif self.robust:
+            # Median and MAD stand in for mean and stdev; a MAD of zero takes
+            # the same no-variance path as a flat baseline
+            mean, stdev = _median_mad(baseline_values)
+        else:
+            mean = math.fsum(baseline_values) / n
+            stdev = math.sqrt(math.fsum((v - mean) ** 2 for v in baseline_values) / (n - 1))
 
         # Check the most recent point
         current_point = metric_result.values[-1]
@@ -110,15 +161,15 @@ class AnomalyDetector:
 
         is_anomaly = z_score > self.threshold_sigma
 
-        # Calculate confidence based on how far beyond threshold
-        if is_anomaly:
-            # Confidence scales with z-score beyond threshold
-            # Caps at 0.99 to avoid overconfidence
-            excess_sigma = z_score - self.threshold_sigma
-            confidence = min(0.99, 0.5 + (excess_sigma / 10.0))
-        else:
-            # Low confidence when below threshold
-            confidence = max(0.0, z_score / self.threshold_sigma) * 0.4
+        if not is_anomaly:
+            # Most series are healthy and only anomalies are returned, so
+            # skip scoring and building a detection nobody sees
+            return anomalies
+
+        # Confidence scales with z-score beyond threshold
+        # Caps at 0.99 to avoid overconfidence
+        excess_sigma = z_score - self.threshold_sigma
+        confidence = min(0.99, 0.5 + (excess_sigma / 10.0))
 
         anomaly = AnomalyDetection(
             metric_name=metric_result.metric_name,
@@ -133,28 +184,30 @@ class AnomalyDetector:
                 "baseline_mean": mean,
                 "baseline_stdev": stdev,
                 "threshold_sigma": self.threshold_sigma,
+                "robust": self.robust,
                 "sample_size": len(baseline_values),
             },
         )
 
-        if is_anomaly:
-            anomalies.append(anomaly)
-            logger.info(
-                f"Anomaly detected in {metric_result.metric_name}: "
-                f"value={current_value:.2f}, expected={mean:.2f}, "
-                f"sigma={z_score:.2f}, confidence={confidence:.2f}"
-            )
+        anomalies.append(anomaly)
+        logger.info(
+            f"Anomaly detected in {metric_result.metric_name}: "
+            f"value={current_value:.2f}, expected={mean:.2f}, "
+            f"sigma={z_score:.2f}, confidence={confidence:.2f}"
+        )
 
         return anomalies
 
     def detect_multiple(
         self,
         metric_results: list[MetricResult],
+        top_k: int | None = None,
     ) -> list[AnomalyDetection]:
         """
         Detect anomalies across multiple metrics.
 
-        Returns all detected anomalies sorted by confidence.
+        Returns all detected anomalies sorted by confidence, or only the
+        top_k most confident when given (a heap select instead of a full sort).
         """
         all_anomalies = []
 
@@ -163,11 +216,23 @@ class AnomalyDetector:
             all_anomalies.extend(anomalies)
 
         # Sort by confidence (highest first)
-        all_anomalies.sort(key=lambda x: x.confidence, reverse=True)
+        if top_k is not None:
+            return heapq.nlargest(top_k, all_anomalies, key=_confidence)
+        all_anomalies.sort(key=_confidence, reverse=True)
 
         return all_anomalies
 
 
+@functools.lru_cache(maxsize=4096)
+def _metric_categories(metric_name: str) -> tuple[str, str]:
+    """(increasing, decreasing) categories for a metric name."""
+    lowered = metric_name.lower()
+    for keywords, categories in _CATEGORY_KEYWORDS:
+        if any(keyword in lowered for keyword in keywords):
+            return categories
+    return _UNCATEGORIZED
+
+
 def categorize_anomaly(anomaly: AnomalyDetection) -> str:
     """
     Categorize anomaly based on metric name and characteristics.
@@ -175,21 +240,7 @@ def categorize_anomaly(anomaly: AnomalyDetection) -> str:
     Senior Engineering Note:
     This is a simple heuristic categorization.
     In production, you'd use pattern matching or ML classification.
+    Metric names repeat on every poll, so the keyword scan is cached per name.
     """
-    metric_name = anomaly.metric_name.lower()
-
-    # Check if value is increasing or decreasing
-    increasing = anomaly.current_value > anomaly.expected_value
-
-    if "error" in metric_name or "failure" in metric_name:
-        return "error_spike" if increasing else "error_recovery"
-    elif "latency" in metric_name or "duration" in metric_name:
-        return "latency_spike" if increasing else "latency_improvement"
-    elif "memory" in metric_name or "heap" in metric_name:
-        return "memory_leak" if increasing else "memory_release"
-    elif "cpu" in metric_name:
-        return "cpu_spike" if increasing else "cpu_drop"
-    elif "request" in metric_name or "throughput" in metric_name:
-        return "traffic_spike" if increasing else "traffic_drop"
-    else:
-        return "metric_anomaly"
+    increasing, decreasing = _metric_categories(anomaly.metric_name)
+    return increasing if anomaly.current_value > anomaly.expected_value else decreasing
@@ -9,17 +9,35 @@ Senior Engineering Note:
 - Weighted scoring based on signal types
 - Pattern matching for known issues
 - Eliminates false positives through multi-signal validation
+- Correlation is CPU-bound; large batches run in a worker thread so the
+  event loop keeps serving fetches, small ones run inline where the thread
+  hop would cost more than the work
 """
+import asyncio
+import bisect
+import heapq
 import logging
 from datetime import datetime, timedelta, timezone
 from enum import Enum
+from operator import attrgetter, itemgetter
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
 from app.core.perception.anomaly_detector import AnomalyDetection
 
 logger = logging.getLogger(__name__)
 
+_timestamp = attrgetter("timestamp")
+# Candidate windows are (service, signals, confidence) until selected
+_candidate_confidence = itemgetter(2)
+
+# Batches at least this large are correlated in a worker thread (~0.4ms of
+# work); below it a to_thread round trip (~50-70us) outweighs the work
+_OFFLOAD_MIN_SIGNALS = 200
+
+# Minimum confidence for a window to become a correlated incident
+_MIN_CONFIDENCE = 0.6
+
 
 class SignalType(str, Enum):
     """Type of observability signal."""
@@ -39,9 +57,17 @@ class Signal(BaseModel):
     value: float = Field(..., description="Numeric value or severity score")
     timestamp: datetime
     labels: dict[str, str] = Field(default_factory=dict)
+    service: str = Field(default="", description="Owning service; derived from labels if unset")
     context: dict = Field(default_factory=dict)
     anomaly_score: float = Field(default=0.0, ge=0.0, le=1.0)
 
+    @model_validator(mode="after")
+    def _resolve_service(self) -> "Signal":
+        """Resolve the service label once at ingest instead of on every grouping."""
+        if not self.service:
+            self.service = self.labels.get("service", self.labels.get("app", "unknown"))
+        return self
+
 
 class CorrelatedIncident(BaseModel):
     """A correlated incident with multiple supporting signals."""
@@ -83,6 +109,7 @@ class SignalCorrelator:
         self,
         signals: list[Signal],
         service_filter: str | None = None,
+        top_k: int | None = None,
     ) -> list[CorrelatedIncident]:
         """
         Correlate signals to identify incidents.
@@ -90,15 +117,27 @@ class SignalCorrelator:
         Args:
             signals: List of signals from various sources
             service_filter: Optional service to filter by
+            top_k: Return only this many of the most confident incidents
 
         Returns:
             List of correlated incidents with high confidence
         """
+        if len(signals) >= _OFFLOAD_MIN_SIGNALS:
+            return await asyncio.to_thread(self._correlate, signals, service_filter, top_k)
+        return self._correlate(signals, service_filter, top_k)
+
+    def _correlate(
+        self,
+        signals: list[Signal],
+        service_filter: str | None,
+        top_k: int | None,
+    ) -> list[CorrelatedIncident]:
+        """Synchronous body of correlate_signals."""
         try:
             # Group signals by service and time window
             service_groups = self._group_by_service(signals, service_filter)
 
-            correlated_incidents = []
+            candidates: list[tuple[str, list[Signal], float]] = []
 
             for service, service_signals in service_groups.items():
                 # Time-window based grouping
@@ -114,18 +153,28 @@ class SignalCorrelator:
                     if len(signal_types) < 2:
                         continue
 
+                    # The weighted average never exceeds the top score, so a
+                    # window whose top score plus diversity bonus is already
+                    # below the threshold can skip the weighted pass
+                    top_score = max(s.anomaly_score for s in window_signals)
+                    if top_score + min(0.3, len(signal_types) * 0.1) < _MIN_CONFIDENCE:
+                        continue
+
                     # Calculate correlation confidence
                     confidence = self._calculate_confidence(window_signals)
 
-                    if confidence >= 0.6:  # Minimum confidence threshold
-                        incident = self._create_correlated_incident(
-                            service=service,
-                            signals=window_signals,
-                            confidence=confidence,
-                        )
-                        correlated_incidents.append(incident)
+                    if confidence >= _MIN_CONFIDENCE:
+                        candidates.append((service, window_signals, confidence))
 
-            return sorted(correlated_incidents, key=lambda x: x.confidence, reverse=True)
+            # Rank first, then build (and validate) only the incidents returned
+            if top_k is not None:
+                selected = heapq.nlargest(top_k, candidates, key=_candidate_confidence)
+            else:
+                selected = sorted(candidates, key=_candidate_confidence, reverse=True)
+            return [
+                self._create_correlated_incident(service=service, signals=window_signals, confidence=confidence)
+                for service, window_signals, confidence in selected
+            ]
 
         except Exception as e:
             logger.error(f"Signal correlation failed: {str(e)}", exc_info=True)
@@ -138,7 +187,7 @@ class SignalCorrelator:
         groups: dict[str, list[Signal]] = {}
 
         for signal in signals:
-            service = signal.labels.get("service", signal.labels.get("app", "unknown"))
+            service = signal.service
 
             if service_filter and service != service_filter:
                 continue
@@ -154,25 +203,19 @@ class SignalCorrelator:
         if not signals:
             return {}
 
-        # Sort by timestamp
-        sorted_signals = sorted(signals, key=lambda s: s.timestamp)
+        sorted_signals = sorted(signals, key=_timestamp)
 
+        # Each window ends correlation_window after its first signal; bisect
+        # finds every cut point in C instead of comparing signal by signal
         groups: dict[datetime, list[Signal]] = {}
-        current_window_start = sorted_signals[0].timestamp
-        current_group = []
-
-        for signal in sorted_signals:
-            if signal.timestamp - current_window_start <= self.correlation_window:
-                current_group.append(signal)
-            else:
-                # Start new window
-                groups[current_window_start] = current_group
-                current_window_start = signal.timestamp
-                current_group = [signal]
-
-        # Add last group
-        if current_group:
-            groups[current_window_start] = current_group
+        start = 0
+        while start < len(sorted_signals):
+            window_start = sorted_signals[start].timestamp
+            end = bisect.bisect_right(
+                sorted_signals, window_start + self.correlation_window, lo=start + 1, key=_timestamp
+            )
+            groups[window_start] = sorted_signals[start:end]
+            start = end
 
         return groups
 
@@ -221,19 +264,11 @@ class SignalCorrelator:
 
         severity_score = (max_anomaly + avg_anomaly) / 2
 
-        # Generate title
-        _signal_summaries = [f"{s.name} ({s.signal_type.value})" for s in signals[:3]]
         title = f"Multiple anomalies detected in {service}"
-
-        # Generate description
-        description_parts = ["Correlated signals indicate an incident:"]
-        for signal in signals:
-            description_parts.append(
-                f"  • {signal.signal_type.value}: {signal.name} "
-                f"(score: {signal.anomaly_score:.2f})"
-            )
-
-        description = "\n".join(description_parts)
+        description = "Correlated signals indicate an incident:\n" + "\n".join(
+            f"  • {s.signal_type.value}: {s.name} (score: {s.anomaly_score:.2f})"
+            for s in signals
+        )
 
         return CorrelatedIncident(
             service=service,
@@ -246,10 +281,14 @@ class SignalCorrelator:
 
     @staticmethod
     def from_anomalies(anomalies: list[AnomalyDetection]) -> list[Signal]:
-        """Convert anomaly detections to signals for correlation."""
-        signals = []
-        for anomaly in anomalies:
-            signal = Signal(
+        """
+        Convert anomaly detections to signals for correlation.
+
+        Uses the validated constructor on purpose: model_construct() runs in
+        Python and is slower on pydantic v2, and would skip service resolution.
+        """
+        return [
+            Signal(
                 signal_type=SignalType.METRIC,
                 source="prometheus",
                 name=anomaly.metric_name,
@@ -259,8 +298,8 @@ class SignalCorrelator:
                 context=anomaly.context,
                 anomaly_score=anomaly.confidence,
             )
-            signals.append(signal)
-        return signals
+            for anomaly in anomalies
+        ]
 
 
 def get_correlator() -> SignalCorrelator:
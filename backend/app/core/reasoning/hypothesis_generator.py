@@ -9,6 +9,7 @@ Senior Engineering Note:
 - LLM = reasoning assistant, NOT controller
 - Input sanitization prevents prompt injection attacks
 """
+import functools
 import logging
 import re
 from typing import Any
@@ -139,11 +140,58 @@ class HypothesesResponse(BaseModel):
     overall_assessment: str = Field(..., description="Summary of the incident")
 
 
+# Base confidence by category (from historical data / expert knowledge)
+_CATEGORY_BASE_CONFIDENCE = {
+    "memory_leak": 0.70,
+    "cpu_spike": 0.75,
+    "traffic_spike": 0.80,
+    "latency_spike": 0.65,
+    "error_spike": 0.85,
+    "database_issue": 0.60,
+    "network_issue": 0.55,
+    "deployment_issue": 0.80,
+}
+
+
+_DATABASE_KEYWORDS = ("database", "postgres", "mysql", "mongo", "db")
+_CACHE_KEYWORDS = ("redis", "cache", "memcached")
+
+
+@functools.lru_cache(maxsize=4096)
+def _upstream_traits(depends_on: tuple[str, ...]) -> tuple[bool, bool]:
+    """
+    Whether a service's upstreams include a database and a cache.
+
+    Keyed on the dependency list itself rather than the service name, so a
+    reloaded or swapped dependency graph can never be served stale results.
+    """
+    upstream_str = " ".join(depends_on).lower()
+    return (
+        any(kw in upstream_str for kw in _DATABASE_KEYWORDS),
+        any(kw in upstream_str for kw in _CACHE_KEYWORDS),
+    )
+
+
+def _anomaly_strength(anomalies: list[AnomalyDetection]) -> float:
+    """Anomaly strength component of hypothesis confidence."""
+    if not anomalies:
+        return 0.0
+
+    avg_anomaly_confidence = sum(a.confidence for a in anomalies) / len(anomalies)
+    max_deviation = max(a.deviation_sigma for a in anomalies)
+
+    # Normalize deviation (3 sigma = 0.5, 6 sigma = 1.0)
+    deviation_score = min(1.0, max_deviation / 6.0)
+
+    return (avg_anomaly_confidence * 0.7) + (deviation_score * 0.3)
+
+
 def calculate_hypothesis_confidence(
     hypothesis: HypothesisItemLLM,
     anomalies: list[AnomalyDetection],
     affected_service: str | None = None,
     pattern_adjustment: float = 0.0,
+    anomaly_score: float | None = None,
 ) -> float:
     """
     Calculate deterministic confidence score for a hypothesis.
@@ -177,23 +225,13 @@ def calculate_hypothesis_confidence(
     Args:
         hypothesis: LLM-generated hypothesis (without confidence)
         anomalies: Original anomalies that triggered analysis
+        anomaly_score: Precomputed _anomaly_strength(anomalies), so callers
+            scoring several hypotheses for one incident compute it once
 
     Returns:
         Confidence score 0.0-1.0 (deterministic, explainable)
     """
-    # Base confidence by category (from historical data / expert knowledge)
-    category_base_confidence = {
-        "memory_leak": 0.70,
-        "cpu_spike": 0.75,
-        "traffic_spike": 0.80,
-        "latency_spike": 0.65,
-        "error_spike": 0.85,
-        "database_issue": 0.60,
-        "network_issue": 0.55,
-        "deployment_issue": 0.80,
-    }
-
-    base_confidence = category_base_confidence.get(hypothesis.category, 0.50)
+    base_confidence = _CATEGORY_BASE_CONFIDENCE.get(hypothesis.category, 0.50)
 
     # Evidence quality score
     if not hypothesis.evidence:
@@ -211,17 +249,9 @@ def calculate_hypothesis_confidence(
 
         evidence_score = (avg_relevance * 0.6) + diversity_bonus + count_bonus
 
-    # Anomaly strength score
-    if anomalies:
-        avg_anomaly_confidence = sum(a.confidence for a in anomalies) / len(anomalies)
-        max_deviation = max(a.deviation_sigma for a in anomalies)
-
-        # Normalize deviation (3 sigma = 0.5, 6 sigma = 1.0)
-        deviation_score = min(1.0, max_deviation / 6.0)
-
-        anomaly_score = (avg_anomaly_confidence * 0.7) + (deviation_score * 0.3)
-    else:
-        anomaly_score = 0.0
+    # Anomaly strength score (identical for every hypothesis of an incident)
+    if anomaly_score is None:
+        anomaly_score = _anomaly_strength(anomalies)
 
     # Weighted combination
     final_confidence = (
@@ -240,16 +270,12 @@ def calculate_hypothesis_confidence(
             dep_graph = get_dependency_graph()
             svc_info = dep_graph.get_service_info(affected_service)
             if svc_info and svc_info.depends_on:
-                upstream_str = " ".join(svc_info.depends_on).lower()
+                has_database, has_cache = _upstream_traits(tuple(svc_info.depends_on))
                 # DB issue is more credible if service has a database upstream
-                if hypothesis.category == "database_issue" and any(
-                    kw in upstream_str for kw in ("database", "postgres", "mysql", "mongo", "db")
-                ):
+                if hypothesis.category == "database_issue" and has_database:
                     final_confidence += 0.08
                 # Cache issue more credible if service depends on Redis/Memcached
-                elif hypothesis.category in ("latency_spike", "error_spike") and any(
-                    kw in upstream_str for kw in ("redis", "cache", "memcached")
-                ):
+                elif hypothesis.category in ("latency_spike", "error_spike") and has_cache:
                     final_confidence += 0.05
                 # Network issue more credible for services with many upstream deps (more hops)
                 elif hypothesis.category == "network_issue" and len(svc_info.depends_on) >= 3:
@@ -334,6 +360,7 @@ Focus on generating insightful hypotheses. Confidence will be scored determinist
             # gevent/eventlet without adding an asyncio.Lock around this block.
             if not learning_engine.patterns:
                 await learning_engine.load_patterns_from_db()
+            anomaly_score = _anomaly_strength(anomalies)
             hypotheses_with_confidence = []
             for llm_hypothesis in llm_hypotheses.hypotheses:
                 # Fetch historical pattern adjustment (async, non-blocking)
@@ -353,6 +380,7 @@ Focus on generating insightful hypotheses. Confidence will be scored determinist
                     anomalies,
                     affected_service=service_name,
                     pattern_adjustment=pattern_adjustment,
+                    anomaly_score=anomaly_score,
                 )
 
                 hypothesis = HypothesisItem(
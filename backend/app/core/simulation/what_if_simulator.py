@@ -326,7 +326,7 @@ class WhatIfSimulator:
             expected_cost_dollars=expected_cost,
             worst_case_cost_dollars=worst_cost,
             blast_radius_impact=risk_profile.blast_radius,
-            potential_side_effects=risk_profile.side_effects,
+            potential_side_effects=list(risk_profile.side_effects),
             prerequisites_met=prerequisites_met,
             prerequisites_missing=prerequisites_missing,
             recommended=recommended,
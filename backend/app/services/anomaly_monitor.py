@@ -114,7 +114,7 @@ class AnomalyMonitor:
                     signals = SignalCorrelator.from_anomalies(significant_anomalies)
                     correlator = SignalCorrelator()
                     correlated = await correlator.correlate_signals(
-                        signals, service_filter=service_name
+                        signals, service_filter=service_name, top_k=1
                     )
                     top_correlation: CorrelatedIncident | None = correlated[0] if correlated else None
 
@@ -4,9 +4,11 @@ Prometheus client for querying metrics.
 Senior Engineering Note:
 - PromQL query abstraction
 - Metric data normalization
-- Connection pooling via httpx
+- Connection pooling via httpx: one keep-alive pool per client, sized for
+  concurrent query fan-out
 - Async HTTP requests
 """
+import asyncio
 import logging
 from datetime import datetime, timedelta, timezone
 from typing import Any
@@ -18,6 +20,13 @@ from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Keep-alive pool shared by all queries on a client. Verification and
+# get_service_metrics fan out several queries at once, so idle connections
+# are kept for reuse rather than re-opened per query.
+PROMETHEUS_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+# Fail fast when Prometheus is unreachable; allow slow queries to finish
+PROMETHEUS_HTTP_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+
 
 class MetricDataPoint(BaseModel):
     """Single metric data point."""
@@ -43,7 +52,10 @@ class PrometheusClient:
 
     def __init__(self, base_url: str):
         self.base_url = base_url.rstrip("/")
-        self.client = httpx.AsyncClient(timeout=30.0)
+        self.client = httpx.AsyncClient(
+            limits=PROMETHEUS_HTTP_LIMITS,
+            timeout=PROMETHEUS_HTTP_TIMEOUT,
+        )
 
     async def close(self) -> None:
         """Close the HTTP client."""
@@ -203,13 +215,18 @@ class PrometheusClient:
             "memory_usage": f'airra_demo_memory_bytes{{service="{service_name}"}}',
         }
 
-        results = {}
-        for name, query in queries.items():
-            try:
-                results[name] = await self.query_range(query, start, end)
-            except Exception as e:
-                logger.error(f"Failed to query {name}: {str(e)}")
+        responses = await asyncio.gather(
+            *(self.query_range(query, start, end) for query in queries.values()),
+            return_exceptions=True,
+        )
+
+        results: dict[str, list[MetricResult]] = {}
+        for name, response in zip(queries, responses, strict=True):
+            if isinstance(response, BaseException):
+                logger.error(f"Failed to query {name}: {str(response)}")
                 results[name] = []
+            else:
+                results[name] = response
 
         return results
 
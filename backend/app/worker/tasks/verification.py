@@ -193,7 +193,7 @@ async def _handle_rollback(
         try:
             rollback_result = await executor.rollback(action.target_service, exec_result)
             logger.info(
-                f"Rollback for action {action.id}: {rollback_result.status.value} — {rollback_result.message}"
+                f"Rollback for action {action.id}: {rollback_result.status.label} — {rollback_result.message}"
             )
         except Exception as rb_exc:
             logger.error(f"Rollback executor failed for action {action.id}: {rb_exc}")
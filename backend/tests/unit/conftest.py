@@ -493,6 +493,9 @@ def mock_k8s_client():
     mock_deployment.spec.replicas = 3
     mock_deployment.status.ready_replicas = 3
     mock_apps_v1.read_namespaced_deployment = Mock(return_value=mock_deployment)
+    mock_apps_v1.read_namespaced_deployment_scale = Mock(
+        return_value=Mock(data=b'{"spec": {"replicas": 3}}')
+    )
     mock_apps_v1.patch_namespaced_deployment_scale = Mock()
 
     mock_client.CoreV1Api = Mock(return_value=mock_core_v1)
@@ -5,11 +5,14 @@ Pure in-memory logic — no external deps needed.
 """
 from datetime import datetime, timedelta, timezone
 
+import pytest
+
 from app.core.perception.alert_deduplication import (
     Alert,
     AlertDeduplicator,
     AlertSeverity,
     DedupedAlert,
+    _fingerprint,
 )
 
 
@@ -74,6 +77,24 @@ class TestAlertFingerprint:
         alert = _make_alert()
         assert all(c in "0123456789abcdef" for c in alert.fingerprint)
 
+    def test_label_order_does_not_change_fingerprint(self):
+        a1 = _make_alert(labels={"env": "prod", "team": "payments"})
+        a2 = _make_alert(labels={"team": "payments", "env": "prod"})
+        assert a1.fingerprint == a2.fingerprint
+
+    def test_repeat_alerts_reuse_fingerprint(self):
+        labels = {"env": "prod", "pod": "pod-abc"}
+        _make_alert(labels=labels)
+        hits = _fingerprint.cache_info().hits
+        _make_alert(labels=dict(labels), offset_seconds=5)
+        assert _fingerprint.cache_info().hits == hits + 1
+
+    def test_alerts_are_slotted(self):
+        alert = _make_alert()
+        assert not hasattr(alert, "__dict__")
+        with pytest.raises(AttributeError):
+            alert.extra = "x"
+
 
 class TestAlertDeduplicatorInit:
     def test_default_dedup_window(self):
@@ -203,6 +224,26 @@ class TestGroupByTimeWindow:
         windows = dedup._group_by_time_window(sorted([a1, a2], key=lambda a: a.timestamp))
         assert len(windows) == 2
 
+    def test_windows_anchor_on_first_alert(self):
+        # Windows are measured from their first alert, inclusive of the boundary,
+        # not chained from one alert to the next
+        dedup = AlertDeduplicator(deduplication_window_seconds=60)
+        base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        alerts = [
+            Alert(
+                source="prometheus",
+                name="HighMemory",
+                service="svc",
+                severity=AlertSeverity.HIGH,
+                message="m",
+                timestamp=base + timedelta(seconds=offset),
+            )
+            for offset in (0, 30, 60, 61, 90, 121, 122, 300)
+        ]
+        windows = dedup._group_by_time_window(alerts)
+        offsets = [[int((a.timestamp - base).total_seconds()) for a in w] for w in windows]
+        assert offsets == [[0, 30, 60], [61, 90, 121], [122], [300]]
+
 
 class TestSeverityToInt:
     def test_order(self):
@@ -7,10 +7,13 @@ Senior Engineering Note:
 - Mocks external dependencies
 - Covers edge cases
 """
+import statistics
+from dataclasses import FrozenInstanceError
 from datetime import datetime
 
 import pytest
 
+from app.core.perception import anomaly_detector
 from app.core.perception.anomaly_detector import (
     AnomalyDetection,
     AnomalyDetector,
@@ -139,6 +142,73 @@ class TestAnomalyDetector:
         # Flat data should not produce anomalies
         assert len(anomalies) == 0
 
+    def test_baseline_statistics_match_sample_definitions(self):
+        """Test baseline mean/stdev agree with the statistics module."""
+        baseline = [0.1, 0.7, 0.3, 12.5, 0.2, 0.9, 0.4]
+        metric = MetricResult(
+            metric_name="latency",
+            labels={},
+            values=[MetricDataPoint(timestamp=float(i), value=v) for i, v in enumerate([*baseline, 60.0])],
+        )
+
+        (anomaly,) = AnomalyDetector(threshold_sigma=3.0).detect(metric)
+
+        assert anomaly.context["baseline_mean"] == pytest.approx(statistics.mean(baseline), rel=1e-12)
+        assert anomaly.context["baseline_stdev"] == pytest.approx(statistics.stdev(baseline), rel=1e-12)
+        assert anomaly.context["sample_size"] == len(baseline)
+
+    def test_detections_are_immutable(self, anomalous_metric_data):
+        """Test detections are frozen, slotted records."""
+        (anomaly,) = AnomalyDetector(threshold_sigma=3.0).detect(anomalous_metric_data)
+
+        assert not hasattr(anomaly, "__dict__")
+        with pytest.raises(FrozenInstanceError):
+            anomaly.confidence = 0.1
+
+    def test_flat_baseline_keeps_exact_mean(self):
+        """Test a constant baseline reports its exact value and zero variance."""
+        metric = MetricResult(
+            metric_name="ratio",
+            labels={},
+            values=[MetricDataPoint(timestamp=float(i), value=0.1) for i in range(10)]
+            + [MetricDataPoint(timestamp=10.0, value=5.0)],
+        )
+
+        (anomaly,) = AnomalyDetector(threshold_sigma=3.0).detect(metric)
+
+        assert anomaly.expected_value == 0.1
+        assert anomaly.context["baseline_stdev"] == 0.0
+
+    def test_robust_baseline_ignores_earlier_spike(self):
+        """Test median/MAD still flags a spike when the baseline holds another one."""
+        values = [50.0 + i % 3 for i in range(18)] + [500.0, 200.0]
+        metric = MetricResult(
+            metric_name="latency",
+            labels={},
+            values=[MetricDataPoint(timestamp=float(i), value=v) for i, v in enumerate(values)],
+        )
+
+        assert AnomalyDetector(threshold_sigma=3.0).detect(metric) == []
+        (anomaly,) = AnomalyDetector(threshold_sigma=3.0, robust=True).detect(metric)
+
+        assert anomaly.expected_value == 51.0
+        assert anomaly.context["baseline_stdev"] == pytest.approx(1.4826)
+        assert anomaly.context["robust"] is True
+
+    def test_robust_zero_mad_uses_relative_deviation(self):
+        """Test a zero MAD falls back to the no-variance scoring."""
+        values = [100.0] * 15 + [400.0, 150.0]
+        metric = MetricResult(
+            metric_name="queue_depth",
+            labels={},
+            values=[MetricDataPoint(timestamp=float(i), value=v) for i, v in enumerate(values)],
+        )
+
+        (anomaly,) = AnomalyDetector(threshold_sigma=3.0, robust=True).detect(metric)
+
+        assert anomaly.context["baseline_stdev"] == 0.0
+        assert anomaly.deviation_sigma == pytest.approx(50.0 / 150.0 * 10.0)
+
     def test_detect_multiple_metrics(self, normal_metric_data, anomalous_metric_data):
         """Test detection across multiple metrics."""
         detector = AnomalyDetector(threshold_sigma=3.0)
@@ -174,6 +244,25 @@ class TestAnomalyDetector:
             assert all_anomalies[0].confidence >= all_anomalies[1].confidence
 
 
+    def test_detect_multiple_top_k(self):
+        """Test top_k keeps only the most confident anomalies, in order."""
+        metrics = [
+            MetricResult(
+                metric_name=f"metric{spike}",
+                labels={},
+                values=[MetricDataPoint(timestamp=float(i), value=100.0 + 10.0 * (i % 2)) for i in range(20)]
+                + [MetricDataPoint(timestamp=20.0, value=100.0 + spike)],
+            )
+            for spike in (20, 35, 25, 30)
+        ]
+        detector = AnomalyDetector(threshold_sigma=2.0)
+
+        top = detector.detect_multiple(metrics, top_k=2)
+
+        assert top == detector.detect_multiple(metrics)[:2]
+        assert [a.metric_name for a in top] == ["metric35", "metric30"]
+
+
 class TestCategorizeAnomaly:
     """Test suite for anomaly categorization."""
 
@@ -241,6 +330,34 @@ class TestCategorizeAnomaly:
         category = categorize_anomaly(anomaly)
         assert category == "cpu_spike"
 
+    @pytest.mark.parametrize(
+        ("metric_name", "current_value", "expected"),
+        [
+            ("Request_Latency_Errors", 9.0, "error_spike"),
+            ("request_duration_seconds", 1.0, "latency_improvement"),
+            ("jvm_heap_cpu_ratio", 9.0, "memory_leak"),
+            ("HTTP_Requests_Total", 1.0, "traffic_drop"),
+            ("disk_io_bytes", 9.0, "metric_anomaly"),
+        ],
+    )
+    def test_categorize_keyword_priority(self, metric_name, current_value, expected):
+        """Test keywords match case-insensitively in priority order, not name order."""
+        anomaly = AnomalyDetection(
+            metric_name=metric_name,
+            is_anomaly=True,
+            confidence=0.8,
+            current_value=current_value,
+            expected_value=5.0,
+            deviation_sigma=4.0,
+            timestamp=datetime.utcnow(),
+            context={},
+        )
+
+        assert categorize_anomaly(anomaly) == expected
+        hits = anomaly_detector._metric_categories.cache_info().hits
+        assert categorize_anomaly(anomaly) == expected
+        assert anomaly_detector._metric_categories.cache_info().hits == hits + 1
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -15,12 +15,15 @@ from unittest.mock import AsyncMock
 import pytest
 
 from app.core.perception.anomaly_detector import AnomalyDetection
+from app.core.reasoning import hypothesis_generator
 from app.core.reasoning.hypothesis_generator import (
     Evidence,
     HypothesesResponse,
     HypothesesResponseLLM,
     HypothesisGenerator,
     HypothesisItem,
+    HypothesisItemLLM,
+    calculate_hypothesis_confidence,
     rank_hypotheses,
 )
 from app.services.llm_client import LLMResponse
@@ -482,6 +485,108 @@ class TestHypothesisGenerator:
         assert call_args.kwargs["temperature"] == 0.3
 
 
+class TestCalculateHypothesisConfidence:
+    """Test deterministic hypothesis confidence scoring."""
+
+    def test_precomputed_anomaly_score_matches(self):
+        """
+        Test passing a precomputed anomaly strength gives the same confidence.
+        """
+        anomalies = [
+            AnomalyDetection(
+                metric_name=name,
+                is_anomaly=True,
+                confidence=confidence,
+                current_value=10.0,
+                expected_value=1.0,
+                deviation_sigma=sigma,
+                timestamp=datetime.utcnow(),
+                context={},
+            )
+            for name, confidence, sigma in [("errors", 0.9, 4.5), ("latency", 0.7, 7.0)]
+        ]
+        hypothesis = HypothesisItemLLM(
+            description="Bad deploy",
+            category="deployment_issue",
+            evidence=[
+                Evidence(signal_type="metric", signal_name="errors", observation="up", relevance=0.9),
+                Evidence(signal_type="log", signal_name="stack", observation="NPE", relevance=0.6),
+            ],
+            reasoning="Errors began at rollout",
+        )
+
+        anomaly_score = hypothesis_generator._anomaly_strength(anomalies)
+
+        assert anomaly_score == pytest.approx(0.8 * 0.7 + 1.0 * 0.3)
+        assert calculate_hypothesis_confidence(
+            hypothesis, anomalies, anomaly_score=anomaly_score
+        ) == calculate_hypothesis_confidence(hypothesis, anomalies)
+        assert hypothesis_generator._anomaly_strength([]) == 0.0
+
+    def test_topology_boost_reuses_upstream_traits(self, monkeypatch):
+        """
+        Test upstream keyword traits are computed once per dependency list.
+        """
+        from app.services import dependency_graph
+
+        graph = dependency_graph.DependencyGraph.__new__(dependency_graph.DependencyGraph)
+        graph.config_path = "dummy"
+        graph.dependencies = {
+            "checkout": dependency_graph.ServiceDependency(
+                service="checkout", depends_on=["Postgres-Primary", "redis"], depended_by=[]
+            )
+        }
+        monkeypatch.setattr(dependency_graph, "_dependency_graph", graph)
+        hypothesis_generator._upstream_traits.cache_clear()
+
+        def confidence(category, service):
+            hypothesis = HypothesisItemLLM(
+                description="d", category=category, evidence=[], reasoning="r"
+            )
+            return calculate_hypothesis_confidence(
+                hypothesis, [], affected_service=service, anomaly_score=0.0
+            )
+
+        assert confidence("database_issue", "checkout") == pytest.approx(
+            confidence("database_issue", "unknown") + 0.08
+        )
+        assert confidence("latency_spike", "checkout") == pytest.approx(
+            confidence("latency_spike", "unknown") + 0.05
+        )
+        assert confidence("cpu_spike", "checkout") == confidence("cpu_spike", "unknown")
+        info = hypothesis_generator._upstream_traits.cache_info()
+        assert (info.misses, info.hits) == (1, 2)
+
+    async def test_generate_scores_anomalies_once(self, mock_llm_client, monkeypatch):
+        """
+        Test anomaly strength is computed once per incident, not per hypothesis.
+        """
+        calls = []
+        real_strength = hypothesis_generator._anomaly_strength
+        monkeypatch.setattr(
+            hypothesis_generator,
+            "_anomaly_strength",
+            lambda anomalies: calls.append(len(anomalies)) or real_strength(anomalies),
+        )
+        anomaly = AnomalyDetection(
+            metric_name="memory_usage",
+            is_anomaly=True,
+            confidence=0.90,
+            current_value=7.5,
+            expected_value=2.0,
+            deviation_sigma=5.5,
+            timestamp=datetime.utcnow(),
+            context={},
+        )
+
+        response, _ = await HypothesisGenerator(mock_llm_client).generate(
+            anomalies=[anomaly], service_name="payment-service"
+        )
+
+        assert len(response.hypotheses) >= 2
+        assert calls == [1]
+
+
 class TestRankHypotheses:
     """Test hypothesis ranking utility function."""
 
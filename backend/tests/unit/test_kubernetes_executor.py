@@ -1,14 +1,35 @@
 """Unit tests for Kubernetes executors."""
 
+import asyncio
+import threading
+import time
+from dataclasses import FrozenInstanceError
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+
+import pytest
+
+from app.core.execution import kubernetes as k8s_executors
 from app.core.execution.base import ExecutionStatus
 from app.core.execution.kubernetes import (
     KubernetesPodRestartExecutor,
     KubernetesScaleExecutor,
+    dispatch_many,
     get_executor,
 )
 from app.models.action import ActionType
 
 
+@pytest.fixture(autouse=True)
+def _clear_dedup_state():
+    """Isolate tests from each other's single-flight bookkeeping."""
+    k8s_executors._inflight.clear()
+    k8s_executors._recent.clear()
+    yield
+    k8s_executors._inflight.clear()
+    k8s_executors._recent.clear()
+
+
 class TestKubernetesPodRestartExecutor:
     """Test pod restart executor."""
 
@@ -48,6 +69,19 @@ class TestKubernetesPodRestartExecutor:
         assert is_valid is False
         assert "replica" in error_msg.lower()
 
+    async def test_dry_run_skips_cluster_and_reuses_name_checks(self, pod_restart_parameters, mock_k8s_client):
+        """Test dry-run never touches the cluster and repeat names hit the cache."""
+        executor = KubernetesPodRestartExecutor(dry_run=True, k8s_client=mock_k8s_client)
+        await executor.execute(target="payment-service", parameters=pod_restart_parameters)
+        hits = k8s_executors.validate_k8s_resource_name.cache_info().hits
+
+        result = await executor.execute(target="payment-service", parameters=pod_restart_parameters)
+
+        assert result.status == ExecutionStatus.SUCCESS
+        assert k8s_executors.validate_k8s_resource_name.cache_info().hits > hits
+        mock_k8s_client.AppsV1Api.assert_not_called()
+        mock_k8s_client.CoreV1Api.assert_not_called()
+
     async def test_rollback_not_applicable(self, pod_restart_parameters):
         """Test rollback returns not applicable for pod restart."""
         executor = KubernetesPodRestartExecutor(dry_run=True)
@@ -56,6 +90,8 @@ class TestKubernetesPodRestartExecutor:
         rollback_result = await executor.rollback(target="test", execution_result=result)
 
         assert "not applicable" in rollback_result.message.lower() or rollback_result.status == ExecutionStatus.SKIPPED
+        assert rollback_result.started_at == rollback_result.completed_at
+        assert rollback_result.duration_seconds == 0
 
     async def test_graceful_shutdown_parameter(self, pod_restart_parameters):
         """Test graceful shutdown seconds parameter."""
@@ -76,6 +112,116 @@ class TestKubernetesPodRestartExecutor:
         assert result.status == ExecutionStatus.SUCCESS
 
 
+def _pod_event(name: str, created_at: datetime, ready: bool) -> dict:
+    """Build a watch event for a pod."""
+    pod = Mock()
+    pod.metadata.name = name
+    pod.metadata.creation_timestamp = created_at
+    pod.status.phase = "Running"
+    pod.status.conditions = [Mock(type="Ready", status="True" if ready else "False")]
+    return {"type": "MODIFIED", "object": pod}
+
+
+class TestPodRestartReadiness:
+    """Test the opt-in wait for a replacement pod to become Ready."""
+
+    @pytest.fixture
+    def live_executor(self, mock_k8s_client):
+        mock_k8s_client.AppsV1Api().read_namespaced_deployment().status.available_replicas = 3
+        return KubernetesPodRestartExecutor(dry_run=False, k8s_client=mock_k8s_client)
+
+    async def test_waits_for_new_ready_pod(self, live_executor, mock_k8s_client, pod_restart_parameters):
+        """Test existing Ready pods are ignored until the replacement is Ready."""
+        old = datetime.now(timezone.utc) - timedelta(hours=1)
+        new = datetime.now(timezone.utc) + timedelta(seconds=1)
+        watcher = mock_k8s_client.watch.Watch.return_value
+        watcher.stream.return_value = iter([
+            _pod_event("payment-service-old", old, ready=True),
+            _pod_event("payment-service-new", new, ready=False),
+            _pod_event("payment-service-new", new, ready=True),
+        ])
+
+        result = await live_executor.execute(
+            target="payment-service",
+            parameters={**pod_restart_parameters, "wait_for_ready": True, "ready_timeout_seconds": 5},
+        )
+
+        assert result.status == ExecutionStatus.SUCCESS
+        assert result.details["replacement_ready"] is True
+        watcher.stop.assert_called_once()
+        assert watcher.stream.call_args.kwargs["timeout_seconds"] == 5
+        assert watcher.stream.call_args.kwargs["field_selector"] == "status.phase=Running"
+
+    async def test_reports_timeout(self, live_executor, mock_k8s_client, pod_restart_parameters):
+        """Test a watch that ends without a Ready replacement is reported."""
+        mock_k8s_client.watch.Watch.return_value.stream.return_value = iter([])
+
+        result = await live_executor.execute(
+            target="payment-service",
+            parameters={**pod_restart_parameters, "wait_for_ready": True},
+        )
+
+        assert result.status == ExecutionStatus.SUCCESS
+        assert result.details["replacement_ready"] is False
+        assert "not Ready" in result.message
+
+    async def test_polls_when_watch_fails(self, live_executor, mock_k8s_client, pod_restart_parameters, monkeypatch):
+        """Test a failed watch falls back to polling with backoff."""
+        monkeypatch.setattr(k8s_executors, "READY_POLL_BACKOFF_SECONDS", (0.01,))
+        new = datetime.now(timezone.utc) + timedelta(seconds=1)
+        mock_k8s_client.watch.Watch.return_value.stream.side_effect = RuntimeError("watch refused")
+        mock_k8s_client.CoreV1Api().list_namespaced_pod.side_effect = [
+            Mock(items=[_pod_event("payment-service-new", new, ready=False)["object"]]),
+            Mock(items=[_pod_event("payment-service-new", new, ready=True)["object"]]),
+        ]
+
+        result = await live_executor.execute(
+            target="payment-service",
+            parameters={**pod_restart_parameters, "wait_for_ready": True, "ready_timeout_seconds": 5},
+        )
+
+        assert result.details["replacement_ready"] is True
+        assert mock_k8s_client.CoreV1Api().list_namespaced_pod.call_count == 2
+
+    async def test_deployment_read_once(self, live_executor, mock_k8s_client, pod_restart_parameters):
+        """Test execute reuses the deployment fetched by its state check."""
+        read = mock_k8s_client.AppsV1Api().read_namespaced_deployment
+        read.reset_mock()
+
+        result = await live_executor.execute(target="payment-service", parameters=pod_restart_parameters)
+
+        assert result.status == ExecutionStatus.SUCCESS
+        assert result.details["replicas"] == 3
+        read.assert_called_once_with(name="payment-service", namespace="production")
+
+    async def test_rollout_restart_without_pod_name(self, live_executor, mock_k8s_client):
+        """Test restarting a whole deployment is one annotation PATCH, not LIST + DELETE."""
+        core_v1 = mock_k8s_client.CoreV1Api()
+        apps_v1 = mock_k8s_client.AppsV1Api()
+
+        result = await live_executor.execute(
+            target="payment-service",
+            parameters={"namespace": "production", "deployment": "payment-service"},
+        )
+
+        assert result.status == ExecutionStatus.SUCCESS
+        assert result.details["strategy"] == "rollout_restart"
+        core_v1.list_namespaced_pod.assert_not_called()
+        core_v1.delete_namespaced_pod.assert_not_called()
+        body = apps_v1.patch_namespaced_deployment.call_args.kwargs["body"]
+        assert apps_v1.patch_namespaced_deployment.call_args.kwargs["_preload_content"] is False
+        annotations = body["spec"]["template"]["metadata"]["annotations"]
+        assert "kubectl.kubernetes.io/restartedAt" in annotations
+
+    async def test_no_wait_by_default(self, live_executor, mock_k8s_client, pod_restart_parameters):
+        """Test readiness is not awaited unless requested."""
+        result = await live_executor.execute(target="payment-service", parameters=pod_restart_parameters)
+
+        assert result.status == ExecutionStatus.SUCCESS
+        assert "replacement_ready" not in result.details
+        mock_k8s_client.watch.Watch.assert_not_called()
+
+
 class TestKubernetesScaleExecutor:
     """Test scaling executor."""
 
@@ -108,6 +254,18 @@ class TestKubernetesScaleExecutor:
         assert is_valid is False
         assert "minimum" in error_msg.lower() or "below" in error_msg.lower()
 
+    @pytest.mark.parametrize("replicas", ["3", 3.0, True, None])
+    async def test_validation_rejects_non_integer_replicas(self, scale_up_parameters, replicas):
+        """Test non-integer replica counts fail before any API call."""
+        executor = KubernetesScaleExecutor(dry_run=True)
+
+        scale_up_parameters["replicas"] = replicas
+
+        is_valid, error_msg = await executor.validate(target="test", parameters=scale_up_parameters)
+
+        assert is_valid is False
+        assert "integer" in error_msg
+
     async def test_validation_checks_max_replicas(self, scale_up_parameters):
         """Test validation checks maximum replicas."""
         executor = KubernetesScaleExecutor(dry_run=True)
@@ -143,6 +301,451 @@ class TestKubernetesScaleExecutor:
         assert result is not None
 
 
+class TestLiveScale:
+    """Test live scaling against a mocked cluster."""
+
+    async def test_rollback_baseline_read_live(self, mock_k8s_client, scale_up_parameters):
+        """Test the recorded previous count is the cluster's, not the caller's."""
+        apps_v1 = mock_k8s_client.AppsV1Api()
+        apps_v1.read_namespaced_deployment_scale.return_value.data = b'{"spec": {"replicas": 4}}'
+        executor = KubernetesScaleExecutor(dry_run=False, k8s_client=mock_k8s_client)
+
+        # scale_up_parameters claims current_replicas=3; the cluster has 4
+        result = await executor.execute(target="api-gateway", parameters=scale_up_parameters)
+
+        assert result.status == ExecutionStatus.SUCCESS
+        assert result.details["previous_replicas"] == 4
+        assert result.message == "Scaled api-gateway from 4 to 5 replicas"
+        apps_v1.read_namespaced_deployment.assert_not_called()
+        apps_v1.read_namespaced_deployment_scale.assert_called_once()
+        apps_v1.patch_namespaced_deployment_scale.assert_called_once_with(
+            name="api-gateway",
+            namespace="production",
+            body=[{"op": "replace", "path": "/spec/replicas", "value": 5}],
+            _content_type="application/json-patch+json",
+            _preload_content=False,
+        )
+
+    async def test_reads_scale_subresource_when_unknown(self, mock_k8s_client):
+        """Test the previous count comes from the scale subresource."""
+        apps_v1 = mock_k8s_client.AppsV1Api()
+        apps_v1.read_namespaced_deployment_scale.return_value.data = b'{"spec": {"replicas": 4}}'
+        executor = KubernetesScaleExecutor(dry_run=False, k8s_client=mock_k8s_client)
+
+        result = await executor.execute(
+            target="api-gateway",
+            parameters={"namespace": "production", "deployment": "api-gateway", "replicas": 6},
+        )
+
+        assert result.details["previous_replicas"] == 4
+        apps_v1.read_namespaced_deployment.assert_not_called()
+        assert apps_v1.read_namespaced_deployment_scale.call_args.kwargs["_preload_content"] is False
+
+    async def test_api_calls_do_not_block_event_loop(self, mock_k8s_client, scale_up_parameters):
+        """Test a slow API server stalls only the worker thread, not the loop."""
+        def slow_patch(**_):
+            time.sleep(0.2)
+            return Mock()
+
+        mock_k8s_client.AppsV1Api().patch_namespaced_deployment_scale.side_effect = slow_patch
+        executor = KubernetesScaleExecutor(dry_run=False, k8s_client=mock_k8s_client)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticking = asyncio.create_task(ticker())
+        result = await executor.execute(target="api-gateway", parameters=scale_up_parameters)
+        ticking.cancel()
+
+        assert result.status == ExecutionStatus.SUCCESS
+        assert ticks >= 5
+
+    async def test_failure_traceback_only_at_debug(self, mock_k8s_client, scale_up_parameters, caplog):
+        """Test failures log the error, with a traceback only when DEBUG is on."""
+        mock_k8s_client.AppsV1Api().patch_namespaced_deployment_scale.side_effect = RuntimeError("API down")
+        executor = KubernetesScaleExecutor(dry_run=False, k8s_client=mock_k8s_client)
+
+        with caplog.at_level("INFO", logger=k8s_executors.__name__):
+            await executor.execute(target="api-gateway", parameters=scale_up_parameters)
+        (record,) = [r for r in caplog.records if r.levelname == "ERROR"]
+        assert record.getMessage() == "Scale operation failed: API down"
+        assert not record.exc_info
+
+        caplog.clear()
+        with caplog.at_level("DEBUG", logger=k8s_executors.__name__):
+            await executor.execute(target="api-gateway", parameters=scale_up_parameters)
+        (record,) = [r for r in caplog.records if r.levelname == "ERROR"]
+        assert record.exc_info
+
+
+class TestDeduplication:
+    """Test single-flighting of identical live executions."""
+
+    async def test_concurrent_duplicates_share_one_call(self, mock_k8s_client, scale_up_parameters):
+        """Test concurrent identical scales issue a single PATCH."""
+        apps_v1 = mock_k8s_client.AppsV1Api()
+        executor = KubernetesScaleExecutor(dry_run=False, k8s_client=mock_k8s_client)
+
+        first, second = await asyncio.gather(
+            executor.execute(target="api-gateway", parameters=scale_up_parameters),
+            executor.execute(target="api-gateway", parameters=scale_up_parameters),
+        )
+
+        assert first is second
+        assert apps_v1.patch_namespaced_deployment_scale.call_count == 1
+        assert not k8s_executors._inflight
+
+    async def test_recent_success_reused_within_window(self, mock_k8s_client, scale_up_parameters):
+        """Test a retry right after success reuses the result; expiry re-executes."""
+        apps_v1 = mock_k8s_client.AppsV1Api()
+        executor = KubernetesScaleExecutor(dry_run=False, k8s_client=mock_k8s_client)
+
+        first = await executor.execute(target="api-gateway", parameters=scale_up_parameters)
+        assert await executor.execute(target="api-gateway", parameters=scale_up_parameters) is first
+        assert apps_v1.patch_namespaced_deployment_scale.call_count == 1
+
+        target_key, (action_key, _, result) = next(iter(k8s_executors._recent.items()))
+        k8s_executors._recent[target_key] = (action_key, float("-inf"), result)
+        await executor.execute(target="api-gateway", parameters=scale_up_parameters)
+        assert apps_v1.patch_namespaced_deployment_scale.call_count == 2
+
+    async def test_different_parameters_not_deduplicated(self, mock_k8s_client, scale_up_parameters):
+        """Test distinct replica targets each execute."""
+        apps_v1 = mock_k8s_client.AppsV1Api()
+        executor = KubernetesScaleExecutor(dry_run=False, k8s_client=mock_k8s_client)
+
+        await executor.execute(target="api-gateway", parameters=scale_up_parameters)
+        await executor.execute(
+            target="api-gateway", parameters={**scale_up_parameters, "replicas": 7}
+        )
+
+        assert apps_v1.patch_namespaced_deployment_scale.call_count == 2
+
+    async def test_intervening_action_on_target_not_deduplicated(self, mock_k8s_client, scale_up_parameters):
+        """Test 5 -> 3 -> 5 within the window re-issues the last scale."""
+        apps_v1 = mock_k8s_client.AppsV1Api()
+        executor = KubernetesScaleExecutor(dry_run=False, k8s_client=mock_k8s_client)
+
+        await executor.execute(target="api-gateway", parameters=scale_up_parameters)
+        await executor.execute(target="api-gateway", parameters={**scale_up_parameters, "replicas": 3})
+        result = await executor.execute(target="api-gateway", parameters=scale_up_parameters)
+
+        assert result.status == ExecutionStatus.SUCCESS
+        assert apps_v1.patch_namespaced_deployment_scale.call_count == 3
+        assert apps_v1.patch_namespaced_deployment_scale.call_args.kwargs["body"][0]["value"] == 5
+
+    async def test_other_executor_on_target_clears_result(self, mock_k8s_client, scale_up_parameters):
+        """Test a restart between identical scales forgets the earlier scale."""
+        apps_v1 = mock_k8s_client.AppsV1Api()
+        scaler = KubernetesScaleExecutor(dry_run=False, k8s_client=mock_k8s_client)
+        restarter = KubernetesPodRestartExecutor(dry_run=False, k8s_client=mock_k8s_client)
+
+        await scaler.execute(target="api-gateway", parameters=scale_up_parameters)
+        await restarter.execute(
+            target="api-gateway",
+            parameters={"namespace": "production", "deployment": "api-gateway", "pod_name": "api-gateway-abc"},
+        )
+        await scaler.execute(target="api-gateway", parameters=scale_up_parameters)
+
+        assert apps_v1.patch_namespaced_deployment_scale.call_count == 2
+
+    async def test_overlapping_actions_on_target_not_cached(self, mock_k8s_client, scale_up_parameters):
+        """Test concurrent different actions on one target leave nothing to reuse."""
+        executor = KubernetesScaleExecutor(dry_run=False, k8s_client=mock_k8s_client)
+
+        await asyncio.gather(
+            executor.execute(target="api-gateway", parameters=scale_up_parameters),
+            executor.execute(target="api-gateway", parameters={**scale_up_parameters, "replicas": 3}),
+        )
+
+        assert not k8s_executors._recent
+
+    async def test_failures_not_cached(self, mock_k8s_client, scale_up_parameters):
+        """Test a failed execution is retried rather than replayed."""
+        apps_v1 = mock_k8s_client.AppsV1Api()
+        apps_v1.patch_namespaced_deployment_scale.side_effect = RuntimeError("API down")
+        executor = KubernetesScaleExecutor(dry_run=False, k8s_client=mock_k8s_client)
+
+        first = await executor.execute(target="api-gateway", parameters=scale_up_parameters)
+        second = await executor.execute(target="api-gateway", parameters=scale_up_parameters)
+
+        assert first.status == second.status == ExecutionStatus.FAILED
+        assert apps_v1.patch_namespaced_deployment_scale.call_count == 2
+        assert not k8s_executors._recent
+
+
+class _FakeApiError(Exception):
+    def __init__(self, status, headers=None):
+        super().__init__(f"({status})")
+        self.status = status
+        self.headers = headers
+
+
+class TestK8sCallRetries:
+    """Test retry of transient Kubernetes API errors."""
+
+    async def test_retries_transient_errors(self):
+        """Test 429/5xx responses are retried until the call succeeds."""
+        fn = Mock(side_effect=[_FakeApiError(503), _FakeApiError(429, {"Retry-After": "0"}), "ok"])
+
+        assert await k8s_executors._k8s_call(fn, name="api") == "ok"
+        assert fn.call_count == 3
+        fn.assert_called_with(name="api")
+
+    async def test_runs_on_dedicated_pool(self):
+        """Test calls run on the k8s-io pool, not the loop's default executor."""
+        result = await k8s_executors._k8s_call(lambda: threading.current_thread().name)
+
+        assert result.startswith("k8s-io")
+
+    async def test_non_transient_errors_raise_immediately(self):
+        """Test client errors such as 404 are not retried."""
+        fn = Mock(side_effect=_FakeApiError(404))
+
+        with pytest.raises(_FakeApiError):
+            await k8s_executors._k8s_call(fn)
+        assert fn.call_count == 1
+
+    async def test_gives_up_after_max_attempts(self, monkeypatch):
+        """Test persistent overload surfaces the last error."""
+        monkeypatch.setattr(k8s_executors, "_k8s_retry_wait", lambda _: 0)
+        fn = Mock(side_effect=_FakeApiError(500))
+
+        with pytest.raises(_FakeApiError):
+            await k8s_executors._k8s_call(fn)
+        assert fn.call_count == k8s_executors.K8S_MAX_ATTEMPTS
+
+    async def test_unauthorized_invalidates_shared_clients(self, monkeypatch):
+        """Test a 401 drops the cached clients so credentials reload."""
+        monkeypatch.setattr(k8s_executors, "_k8s_apis", (Mock(), Mock()))
+        fn = Mock(side_effect=_FakeApiError(401))
+
+        with pytest.raises(_FakeApiError):
+            await k8s_executors._k8s_call(fn)
+        assert fn.call_count == 1
+        assert k8s_executors._k8s_apis is None
+
+    async def test_retried_delete_treats_not_found_as_done(self, monkeypatch):
+        """Test a 404 after a 503 means the first DELETE went through."""
+        monkeypatch.setattr(k8s_executors, "_k8s_retry_wait", lambda _: 0)
+        fn = Mock(side_effect=[_FakeApiError(503), _FakeApiError(404)])
+
+        await k8s_executors._k8s_delete(fn, name="api-1")
+
+        assert fn.call_count == 2
+
+    async def test_first_delete_not_found_raises(self):
+        """Test a 404 with no earlier attempt is still an error."""
+        fn = Mock(side_effect=_FakeApiError(404))
+
+        with pytest.raises(_FakeApiError):
+            await k8s_executors._k8s_delete(fn, name="api-1")
+
+    async def test_pod_restart_succeeds_when_retry_finds_pod_gone(
+        self, monkeypatch, mock_k8s_client, pod_restart_parameters
+    ):
+        """Test a pod DELETE answered 503 then 404 reports the restart as done."""
+        monkeypatch.setattr(k8s_executors, "_k8s_retry_wait", lambda _: 0)
+        v1 = mock_k8s_client.CoreV1Api()
+        v1.delete_namespaced_pod.side_effect = [_FakeApiError(503), _FakeApiError(404)]
+        mock_k8s_client.AppsV1Api().read_namespaced_deployment().status.available_replicas = 3
+        executor = KubernetesPodRestartExecutor(dry_run=False, k8s_client=mock_k8s_client)
+
+        result = await executor.execute(target="payment-service", parameters=pod_restart_parameters)
+
+        assert result.status == ExecutionStatus.SUCCESS
+        assert v1.delete_namespaced_pod.call_count == 2
+
+    def test_wait_honours_capped_retry_after(self):
+        """Test Retry-After wins over backoff, up to the cap."""
+        def state(exc, attempt=1):
+            retry_state = Mock(attempt_number=attempt)
+            retry_state.outcome.exception.return_value = exc
+            return retry_state
+
+        assert k8s_executors._k8s_retry_wait(state(_FakeApiError(429, {"Retry-After": "3"}))) == 3.0
+        assert k8s_executors._k8s_retry_wait(
+            state(_FakeApiError(429, {"Retry-After": "600"}))
+        ) == k8s_executors.K8S_MAX_RETRY_AFTER_SECONDS
+        assert k8s_executors._k8s_retry_wait(state(_FakeApiError(503), attempt=10)) == 2.0
+
+
+class TestExecuteMany:
+    """Test bounded-concurrency batch execution."""
+
+    async def test_results_in_input_order(self, mock_k8s_client):
+        """Test each item gets its own result, in order."""
+        executor = KubernetesScaleExecutor(dry_run=False, k8s_client=mock_k8s_client)
+        items = [
+            ("svc-a", {"namespace": "production", "deployment": "svc-a", "replicas": 3, "current_replicas": 2}),
+            ("svc-b", {"namespace": "production", "deployment": "svc-b", "replicas": 4, "current_replicas": 2}),
+        ]
+
+        results = await executor.execute_many(items)
+
+        assert [r.details["deployment"] for r in results] == ["svc-a", "svc-b"]
+        assert mock_k8s_client.AppsV1Api().patch_namespaced_deployment_scale.call_count == 2
+
+    async def test_concurrency_is_bounded(self, monkeypatch):
+        """Test no more than `concurrency` executions run at once."""
+        executor = KubernetesScaleExecutor(dry_run=True)
+        in_flight = peak = 0
+
+        async def fake_execute(target, parameters):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return target
+
+        monkeypatch.setattr(executor, "execute", fake_execute)
+
+        results = await executor.execute_many([(f"svc-{i}", {}) for i in range(10)], concurrency=3)
+
+        assert results == [f"svc-{i}" for i in range(10)]
+        assert peak == 3
+
+    async def test_dispatch_many_mixed_action_types(self):
+        """Test a mixed batch resolves one executor per action, in order."""
+        results = await dispatch_many(
+            [
+                ("scale_up", "svc-a", {"namespace": "production", "replicas": 4, "current_replicas": 2}),
+                ("restart_pod", "svc-b", {"namespace": "production"}),
+                ("no_such_action", "svc-c", {}),
+            ]
+        )
+
+        assert [r.status for r in results] == [
+            ExecutionStatus.SUCCESS,
+            ExecutionStatus.SUCCESS,
+            ExecutionStatus.FAILED,
+        ]
+        assert all(r.dry_run for r in results)
+        assert results[0].details["deployment"] == "svc-a"
+        assert "no_such_action" in results[2].error
+
+    async def test_dispatch_many_concurrency_is_bounded(self, monkeypatch):
+        """Test one cap spans executors of different types."""
+        in_flight = peak = 0
+
+        async def fake_execute(target, parameters):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return target
+
+        for action_type in ("scale_up", "restart_pod"):
+            monkeypatch.setattr(get_executor(action_type), "execute", fake_execute)
+
+        results = await dispatch_many(
+            [("scale_up" if i % 2 else "restart_pod", f"svc-{i}", {}) for i in range(10)],
+            concurrency=4,
+        )
+
+        assert results == [f"svc-{i}" for i in range(10)]
+        assert peak == 4
+
+
+class TestSharedApiClients:
+    """Test the process-wide Kubernetes API handles."""
+
+    @pytest.fixture
+    def fake_kubernetes(self, monkeypatch):
+        """Install a stand-in kubernetes package and reset the shared handles."""
+        fake = Mock()
+        monkeypatch.setattr(k8s_executors, "_k8s_client", fake.client)
+        monkeypatch.setattr(k8s_executors, "_k8s_config", fake.config)
+        monkeypatch.setattr(k8s_executors, "_HAS_K8S", True)
+        monkeypatch.setattr(k8s_executors, "_k8s_apis", None)
+        return fake
+
+    async def test_config_loaded_once(self, fake_kubernetes):
+        """Test kubeconfig is loaded and clients built only on first use."""
+        first = await k8s_executors._get_k8s_apis()
+        second = await k8s_executors._get_k8s_apis()
+
+        assert first is second
+        fake_kubernetes.config.load_incluster_config.assert_called_once()
+        fake_kubernetes.client.ApiClient.assert_called_once()
+
+    async def test_missing_client_raises_import_error(self, monkeypatch):
+        """Test an absent kubernetes package is reported without importing."""
+        monkeypatch.setattr(k8s_executors, "_HAS_K8S", False)
+        monkeypatch.setattr(k8s_executors, "_k8s_apis", None)
+
+        with pytest.raises(ImportError):
+            await k8s_executors._get_k8s_apis()
+
+    async def test_clients_share_api_client(self, fake_kubernetes):
+        """Test both API wrappers reuse one pooled ApiClient."""
+        await k8s_executors._get_k8s_apis()
+
+        api_client = fake_kubernetes.client.ApiClient.return_value
+        fake_kubernetes.client.CoreV1Api.assert_called_once_with(api_client)
+        fake_kubernetes.client.AppsV1Api.assert_called_once_with(api_client)
+        configuration = fake_kubernetes.client.ApiClient.call_args.kwargs["configuration"]
+        assert configuration.connection_pool_maxsize == k8s_executors.K8S_CONNECTION_POOL_SIZE
+
+
+class TestParsedParameters:
+    """Test parameter parsing into frozen records."""
+
+    def test_restart_defaults(self):
+        """Test omitted restart parameters fall back to the target and defaults."""
+        params = k8s_executors._RestartParams.parse("payment-service", {})
+
+        assert params.namespace == "default"
+        assert params.deployment == "payment-service"
+        assert params.pod_name is None
+        assert params.wait_for_ready is False
+        assert params.ready_timeout_seconds == 30
+        with pytest.raises(FrozenInstanceError):
+            params.namespace = "production"
+
+    def test_scale_values(self, scale_up_parameters):
+        """Test scale parameters carry the requested and observed counts."""
+        params = k8s_executors._ScaleParams.parse("api-gateway", scale_up_parameters)
+
+        assert params.replicas == 5
+        assert params.current_replicas == 3
+        assert (params.min_replicas, params.max_replicas) == (1, 10)
+
+
+class TestResourceNameValidation:
+    """Test Kubernetes resource name validation."""
+
+    @pytest.mark.parametrize(
+        "name",
+        ["api", "payment-service", "a1", "x", "svc.production.local", "a-b.c-d"],
+    )
+    def test_valid_names(self, name):
+        """Test DNS-1123 names are accepted, with and without dots."""
+        assert k8s_executors.validate_k8s_resource_name(name, "deployment") == (True, None)
+
+    @pytest.mark.parametrize(
+        "name",
+        ["Api", "-api", "api-", "api_v2", "api service", "api\n", "a..b", ".api", "api.", "api.-x", "ａpi"],
+    )
+    def test_invalid_names(self, name):
+        """Test bad characters, edges and empty labels are rejected."""
+        is_valid, error = k8s_executors.validate_k8s_resource_name(name, "deployment")
+
+        assert is_valid is False
+        assert error.startswith("deployment must consist of")
+
+    def test_length_and_empty(self):
+        """Test empty and over-long names are rejected before the character check."""
+        assert k8s_executors.validate_k8s_resource_name("", "namespace")[0] is False
+        assert k8s_executors.validate_k8s_resource_name("a" * 254, "namespace")[0] is False
+
+
 class TestExecutorRegistry:
     """Test executor factory function."""
 
@@ -171,6 +774,15 @@ class TestExecutorRegistry:
         executor = get_executor("unknown_action", dry_run=True)
         assert executor is None
 
+    def test_instances_reused_per_mode(self):
+        """Test executors are memoized per (action_type, dry_run)."""
+        dry = get_executor(ActionType.RESTART_POD, dry_run=True)
+
+        assert get_executor("restart_pod", dry_run=True) is dry
+        live = get_executor(ActionType.RESTART_POD, dry_run=False)
+        assert live is not dry
+        assert live.dry_run is False
+
 
 class TestExecutionResults:
     """Test execution result creation."""
@@ -203,3 +815,53 @@ class TestExecutionResults:
         except (ValueError, KeyError):
             # Expected
             pass
+
+    async def test_result_model_dump(self, scale_up_parameters):
+        """Test result serializes to a plain dict."""
+        executor = KubernetesScaleExecutor(dry_run=True)
+
+        result = await executor.execute(target="test", parameters=scale_up_parameters)
+        dumped = result.model_dump()
+
+        assert dumped["status"] == "success"
+        assert dumped["dry_run"] is True
+        assert dumped["details"]["action"] == "scale"
+
+    async def test_result_duration_is_monotonic(self, scale_up_parameters):
+        """Test completed_at is derived from started_at plus the measured duration."""
+        executor = KubernetesScaleExecutor(dry_run=True)
+
+        result = await executor.execute(target="test", parameters=scale_up_parameters)
+
+        assert result.duration_seconds >= 0
+        assert (result.completed_at - result.started_at).total_seconds() == pytest.approx(
+            result.duration_seconds, abs=1e-6
+        )
+
+    async def test_result_is_immutable(self, scale_up_parameters):
+        """Test results can't be altered once shared between callers."""
+        result = await KubernetesScaleExecutor(dry_run=True).execute(
+            target="test", parameters=scale_up_parameters
+        )
+
+        with pytest.raises(FrozenInstanceError):
+            result.status = ExecutionStatus.FAILED
+
+    def test_wall_clock_duration_never_negative(self):
+        """Test a start time ahead of the wall clock yields zero, not negative."""
+        executor = KubernetesScaleExecutor(dry_run=True)
+        future = datetime.now(timezone.utc) + timedelta(minutes=5)
+
+        result = executor._create_result(ExecutionStatus.SUCCESS, "ok", future)
+
+        assert result.duration_seconds == 0
+        assert result.completed_at == future
+
+
+class TestExecutionStatus:
+    """Test execution status serialization."""
+
+    def test_label_matches_serialized_name(self):
+        """Test labels keep the string names stored in execution results."""
+        assert ExecutionStatus.SUCCESS.label == "success"
+        assert ExecutionStatus.ROLLED_BACK.label == "rolled_back"
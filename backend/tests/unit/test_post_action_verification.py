@@ -0,0 +1,239 @@
+"""Unit tests for post-action verification."""
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.core.execution import verification
+from app.core.execution.base import ExecutionResult, ExecutionStatus
+from app.core.execution.verification import HealthMetrics, PostActionVerifier, VerificationStatus
+from app.services.prometheus_client import MetricDataPoint, MetricResult
+
+
+def _series(*values: float) -> list[MetricResult]:
+    """Build a single-series query result with the given samples."""
+    return [
+        MetricResult(
+            metric_name="m",
+            labels={},
+            values=[MetricDataPoint(timestamp=float(i), value=v) for i, v in enumerate(values)],
+        )
+    ]
+
+
+class _FakePrometheus:
+    """Prometheus stand-in that answers by query prefix and tracks concurrency."""
+
+    def __init__(self, answers: dict[str, object]):
+        self.answers = answers
+        self.calls: list[tuple[str, datetime | None]] = []
+        self.in_flight = 0
+        self.peak = 0
+
+    async def query(self, query: str, time: datetime | None = None):
+        self.calls.append((query, time))
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+        for prefix, answer in self.answers.items():
+            if query.startswith(prefix):
+                if isinstance(answer, Exception):
+                    raise answer
+                return answer
+        return []
+
+
+class TestFetchHealthMetrics:
+    """Test metric collection from Prometheus."""
+
+    async def test_queries_run_concurrently(self):
+        """Test all five metric queries are in flight together."""
+        prometheus = _FakePrometheus({
+            "sum(rate(http_requests_total{service=\"api\",status": _series(1.0, 2.0),
+            "service:http_request_duration_seconds:p95": _series(120.0),
+            "service:http_request_duration_seconds:p99": _series(300.0),
+            "sum(rate(http_requests_total{service=\"api\"}": _series(50.0),
+            "avg(up{": _series(1.0),
+        })
+        verifier = PostActionVerifier(prometheus)
+
+        metrics = await verifier._fetch_health_metrics("api")
+
+        assert prometheus.peak == 5
+        assert len(prometheus.calls) == 5
+        assert metrics.error_rate == 2.0
+        assert metrics.latency_p95 == 120.0
+        assert metrics.latency_p99 == 300.0
+        assert metrics.request_rate == 50.0
+        assert metrics.availability == 1.0
+
+    async def test_failed_query_only_unsets_its_metric(self):
+        """Test one failing query leaves the other metrics populated."""
+        prometheus = _FakePrometheus({
+            "service:http_request_duration_seconds:p95": RuntimeError("timeout"),
+            "service:http_request_duration_seconds:p99": _series(300.0),
+            "avg(up{": [MetricResult(metric_name="up", labels={}, values=[])],
+        })
+        verifier = PostActionVerifier(prometheus)
+
+        metrics = await verifier._fetch_health_metrics("api")
+
+        assert metrics.latency_p95 is None
+        assert metrics.latency_p99 == 300.0
+        assert metrics.error_rate is None  # no series matched
+        assert metrics.availability == 0.0  # series without samples
+
+    async def test_latency_falls_back_without_recording_rules(self):
+        """Test empty recording-rule series fall back to live histogram quantiles."""
+        prometheus = _FakePrometheus({
+            "histogram_quantile(0.95": _series(120.0),
+            "histogram_quantile(0.99": _series(300.0),
+        })
+        verifier = PostActionVerifier(prometheus)
+
+        metrics = await verifier._fetch_health_metrics("api")
+
+        assert len(prometheus.calls) == 7
+        assert metrics.latency_p95 == 120.0
+        assert metrics.latency_p99 == 300.0
+
+    async def test_queries_are_memoized_per_service(self):
+        """Test repeat fetches for a service reuse the formatted queries."""
+        prometheus = _FakePrometheus({})
+        verifier = PostActionVerifier(prometheus)
+
+        await verifier._fetch_health_metrics("checkout")
+        hits = verification._health_queries.cache_info().hits
+        await verifier._fetch_health_metrics("checkout")
+
+        assert verification._health_queries.cache_info().hits == hits + 1
+        first, second = prometheus.calls[:7], prometheus.calls[7:]
+        assert all(a[0] is b[0] for a, b in zip(first, second, strict=True))
+        assert 'service="checkout"' in first[0][0]
+
+
+class TestVerifyAction:
+    """Test the verify_action flow."""
+
+    async def test_fetches_before_and_after_together(self):
+        """Test missing before-metrics are fetched alongside the after-metrics."""
+        prometheus = _FakePrometheus({"avg(up{": _series(1.0)})
+        verifier = PostActionVerifier(prometheus, stabilization_window_seconds=0)
+        started_at = datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+        result = await verifier.verify_action(
+            "api",
+            ExecutionResult(status=ExecutionStatus.SUCCESS, message="ok", started_at=started_at),
+        )
+
+        assert prometheus.peak == 10
+        assert {t for _, t in prometheus.calls} == {None, datetime(2026, 1, 1, 11, 55, tzinfo=timezone.utc)}
+        assert result.before_metrics.availability == 1.0
+        assert result.after_metrics.availability == 1.0
+
+    @pytest.mark.parametrize(("finished_ago", "expected_sleeps"), [(30, [90]), (300, [])])
+    async def test_sleeps_only_remaining_stabilization(self, monkeypatch, finished_ago, expected_sleeps):
+        """Test time since the action finished counts toward the stabilization window."""
+        real_sleep = asyncio.sleep
+        sleeps = []
+
+        async def fake_sleep(seconds):
+            if seconds:
+                sleeps.append(round(seconds))
+            await real_sleep(0)
+
+        monkeypatch.setattr(verification.asyncio, "sleep", fake_sleep)
+        verifier = PostActionVerifier(_FakePrometheus({}), stabilization_window_seconds=120)
+        finished_at = datetime.now(timezone.utc) - timedelta(seconds=finished_ago)
+
+        result = await verifier.verify_action(
+            "api",
+            ExecutionResult(
+                status=ExecutionStatus.SUCCESS, message="ok", started_at=finished_at, completed_at=finished_at
+            ),
+            before_metrics=HealthMetrics(),
+        )
+
+        assert sleeps == expected_sleeps
+        assert result.stabilization_seconds == 120
+
+    async def test_failed_execution_skips_metrics(self):
+        """Test a failed action is reported without querying Prometheus."""
+        prometheus = _FakePrometheus({})
+        verifier = PostActionVerifier(prometheus)
+
+        result = await verifier.verify_action(
+            "api",
+            ExecutionResult(status=ExecutionStatus.FAILED, message="boom", error="boom"),
+            before_metrics=HealthMetrics(error_rate=1.0),
+        )
+
+        assert result.recommendation == "rollback"
+        assert prometheus.calls == []
+        assert result.before_metrics.error_rate == pytest.approx(1.0)
+
+
+class TestCompareMetrics:
+    """Test before/after metric comparison."""
+
+    def test_improvement_percentages(self):
+        """Test lower-is-better and higher-is-better metrics are signed correctly."""
+        verifier = PostActionVerifier(_FakePrometheus({}))
+
+        status, improvements = verifier._compare_metrics(
+            HealthMetrics(error_rate=10.0, latency_p95=200.0, latency_p99=400.0, availability=0.5),
+            HealthMetrics(error_rate=5.0, latency_p95=100.0, latency_p99=300.0, availability=1.0),
+        )
+
+        assert improvements == pytest.approx(
+            {"error_rate": 50.0, "latency_p95": 50.0, "latency_p99": 25.0, "availability": 100.0}
+        )
+        assert status == VerificationStatus.SUCCESS
+
+    def test_errors_from_zero_baseline_degrade(self):
+        """Test errors appearing from a zero baseline count as a regression."""
+        verifier = PostActionVerifier(_FakePrometheus({}))
+
+        status, improvements = verifier._compare_metrics(
+            HealthMetrics(error_rate=0.0, latency_p95=0.0),
+            HealthMetrics(error_rate=3.0, latency_p95=50.0),
+        )
+
+        assert improvements == {"error_rate": -100.0, "latency_p95": 0.0}
+        assert status == VerificationStatus.DEGRADED
+
+    def test_missing_metrics_are_skipped(self):
+        """Test metrics absent on either side are left out."""
+        verifier = PostActionVerifier(_FakePrometheus({}))
+
+        status, improvements = verifier._compare_metrics(
+            HealthMetrics(error_rate=1.0), HealthMetrics(latency_p95=10.0)
+        )
+
+        assert improvements == {}
+        assert status == VerificationStatus.NO_CHANGE
+
+
+class TestGenerateMessage:
+    """Test the before/after summary message."""
+
+    def test_renders_only_metrics_present_on_both_sides(self):
+        """Test each metric block is rendered once, in order, when both sides have data."""
+        verifier = PostActionVerifier(_FakePrometheus({}))
+        before = HealthMetrics(error_rate=4.0, latency_p95=200.0, request_rate=10.0)
+        after = HealthMetrics(error_rate=1.0, latency_p95=150.0)
+        status, improvements = verifier._compare_metrics(before, after)
+
+        message = verifier._generate_message(status, improvements, before, after)
+
+        assert message.startswith(f"Post-action verification: {status.value}\n")
+        assert (
+            "\nError Rate:\n"
+            "  Before: 4.00 errors/min\n"
+            "  After:  1.00 errors/min\n"
+            "  Δ = -3.00 errors/min (+75.0%)\n"
+        ) in message
+        assert "  Δ = -50.0ms (+25.0%)" in message
+        assert "Request Rate" not in message
+        assert message.endswith("\nOverall improvement: +50.0%")
@@ -1,4 +1,5 @@
 """Unit tests for Prometheus client."""
+import asyncio
 from datetime import datetime, timedelta
 from unittest.mock import Mock, patch
 
@@ -81,6 +82,36 @@ class TestPrometheusClient:
             assert "cpu_usage" in metrics or "request_rate" in metrics or metrics is not None
             mock_query.assert_called()
 
+    async def test_get_service_metrics_queries_concurrently(self):
+        """Test the service metric queries run together and fail independently."""
+        in_flight = peak = 0
+
+        async def fake_query_range(query, start, end):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            if "cpu" in query:
+                raise RuntimeError("boom")
+            return [MetricResult(metric_name="m", labels={}, values=[])]
+
+        client = PrometheusClient(base_url="http://localhost:9090")
+        with patch.object(client, "query_range", side_effect=fake_query_range):
+            metrics = await client.get_service_metrics("test-service")
+
+        assert peak == len(metrics) == 5
+        assert metrics["cpu_usage"] == []
+        assert len(metrics["request_rate"]) == 1
+
+    async def test_client_timeouts(self):
+        """Test connects fail fast while slow queries may still complete."""
+        client = PrometheusClient(base_url="http://localhost:9090")
+
+        assert client.client.timeout.connect == 5.0
+        assert client.client.timeout.read == 30.0
+        await client.close()
+
     async def test_handles_connection_error(self):
         """Test handling of connection errors."""
         with patch('httpx.AsyncClient.get') as mock_get:
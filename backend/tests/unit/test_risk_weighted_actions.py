@@ -0,0 +1,287 @@
+"""
+Unit tests for risk-weighted action selection.
+
+Tests the ActionRiskRegistry ranking, cost calculation and best-action
+selection used by the decision engine and what-if simulator.
+"""
+
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+from app.core.decision.risk_weighted_actions import (
+    ActionRiskRegistry,
+    Criticality,
+    get_action_risk_registry,
+)
+from app.models.action import ActionType
+
+
+class TestActionRiskProfile:
+    """Test suite for ActionRiskProfile."""
+
+    def test_profiles_are_immutable(self):
+        """Profiles are frozen and carry immutable sequences."""
+        profile = ActionRiskRegistry().get_risk_profile(ActionType.SCALE_UP)
+
+        assert isinstance(profile.prerequisites, tuple)
+        assert isinstance(profile.side_effects, tuple)
+        with pytest.raises(FrozenInstanceError):
+            profile.risk_score = 0.9
+
+    def test_profiles_shared_and_read_only(self):
+        """Registries share one read-only profile table."""
+        first, second = ActionRiskRegistry(), ActionRiskRegistry()
+
+        assert first.risk_profiles is second.risk_profiles
+        with pytest.raises(TypeError):
+            first.risk_profiles[ActionType.CUSTOM] = first.risk_profiles[ActionType.SCALE_UP]
+
+
+    def test_precomputes_cost_units(self):
+        """Cost units fold downtime and $/minute into one factor."""
+        profile = ActionRiskRegistry().get_risk_profile(ActionType.ROLLBACK_DEPLOYMENT)
+
+        # 60s expected; 1800s worst case + 600s recovery; $500/min
+        assert profile.expected_cost_unit == pytest.approx(500.0)
+        assert profile.worst_case_cost_unit == pytest.approx(20000.0)
+
+
+class TestGlobalRegistry:
+    """Test suite for get_action_risk_registry."""
+
+    def test_global_registry_is_singleton(self):
+        """The global registry is one shared instance."""
+        assert get_action_risk_registry() is get_action_risk_registry()
+        assert isinstance(get_action_risk_registry(), ActionRiskRegistry)
+
+
+class TestRankActionsByRisk:
+    """Test suite for ActionRiskRegistry.rank_actions_by_risk."""
+
+    def test_ranks_lowest_risk_first(self):
+        """Actions come back ordered by adjusted risk regardless of input order."""
+        registry = ActionRiskRegistry()
+
+        ranked = registry.rank_actions_by_risk(
+            [ActionType.DRAIN_NODE, ActionType.RESTART_POD, ActionType.SCALE_UP]
+        )
+
+        assert [action for action, _, _ in ranked] == [
+            ActionType.SCALE_UP,
+            ActionType.RESTART_POD,
+            ActionType.DRAIN_NODE,
+        ]
+        risks = [risk for _, _, risk in ranked]
+        assert risks == sorted(risks)
+
+    def test_applies_criticality_and_urgency(self):
+        """Criticality scales the base risk; downtime discounts it."""
+        registry = ActionRiskRegistry()
+
+        (_, profile, risk), = registry.rank_actions_by_risk(
+            [ActionType.ROLLBACK_DEPLOYMENT],
+            service_criticality="critical",
+            current_downtime_seconds=600,
+        )
+
+        assert risk == pytest.approx(profile.risk_score * 1.5 - 0.3)
+
+    def test_accepts_criticality_enum(self):
+        """Criticality members and their string names rank identically."""
+        registry = ActionRiskRegistry()
+        candidates = [ActionType.RESTART_POD, ActionType.SCALE_DOWN]
+
+        for level in Criticality:
+            assert registry.rank_actions_by_risk(
+                candidates, level, 120
+            ) == registry.rank_actions_by_risk(candidates, level.name.lower(), 120)
+
+    def test_unknown_criticality_is_neutral(self):
+        """Unrecognised criticality strings use the medium multiplier."""
+        registry = ActionRiskRegistry()
+
+        assert registry.rank_actions_by_risk(
+            [ActionType.RESTART_POD], "unknown"
+        ) == registry.rank_actions_by_risk([ActionType.RESTART_POD], Criticality.MEDIUM)
+
+    def test_clamps_adjusted_risk_to_zero(self):
+        """A large urgency discount never produces a negative risk."""
+        registry = ActionRiskRegistry()
+
+        ranked = registry.rank_actions_by_risk(
+            [ActionType.SCALE_UP, ActionType.CLEAR_CACHE],
+            service_criticality="low",
+            current_downtime_seconds=3600,
+        )
+
+        assert [risk for _, _, risk in ranked] == [0.0, 0.0]
+        assert ranked[0][0] == ActionType.SCALE_UP
+
+    def test_ties_keep_input_order(self):
+        """Actions clamped to the same risk stay in the order they were given."""
+        registry = ActionRiskRegistry()
+
+        for candidates in (
+            [ActionType.CLEAR_CACHE, ActionType.SCALE_UP],
+            [ActionType.SCALE_UP, ActionType.CLEAR_CACHE],
+        ):
+            ranked = registry.rank_actions_by_risk(candidates, "critical", 600)
+            assert [action for action, _, _ in ranked] == candidates
+            assert [risk for _, _, risk in ranked] == [0.0, 0.0]
+
+    def test_repeated_actions_are_kept(self):
+        """A candidate listed twice is ranked twice, as given."""
+        registry = ActionRiskRegistry()
+
+        ranked = registry.rank_actions_by_risk(
+            [ActionType.SCALE_UP, ActionType.CLEAR_CACHE, ActionType.SCALE_UP]
+        )
+
+        assert [action for action, _, _ in ranked] == [
+            ActionType.SCALE_UP,
+            ActionType.SCALE_UP,
+            ActionType.CLEAR_CACHE,
+        ]
+
+    def test_skips_actions_without_profile(self):
+        """Unknown action types are dropped from the ranking."""
+        registry = ActionRiskRegistry()
+
+        ranked = registry.rank_actions_by_risk([ActionType.CUSTOM, ActionType.CLEAR_CACHE])
+
+        assert [action for action, _, _ in ranked] == [ActionType.CLEAR_CACHE]
+
+    def test_single_candidate(self):
+        """A single candidate is scored directly; an unknown one yields nothing."""
+        registry = ActionRiskRegistry()
+
+        ranked = registry.rank_actions_by_risk([ActionType.CLEAR_CACHE], service_criticality="high")
+
+        assert len(ranked) == 1
+        assert ranked[0][0] == ActionType.CLEAR_CACHE
+        assert ranked[0][2] == pytest.approx(0.10 * 1.2)
+        assert registry.rank_actions_by_risk([ActionType.CUSTOM]) == []
+
+    def test_empty_candidates(self):
+        """No candidates yields an empty ranking."""
+        assert ActionRiskRegistry().rank_actions_by_risk([]) == []
+
+
+class TestBatchRank:
+    """Test suite for ActionRiskRegistry.batch_rank."""
+
+    def test_matches_per_service_ranking(self):
+        """Each row equals what rank_actions_by_risk returns for that service."""
+        registry = ActionRiskRegistry()
+        candidates = [ActionType.ROLLBACK_DEPLOYMENT, ActionType.SCALE_UP, ActionType.RESTART_POD]
+        contexts = [("low", 0.0), ("critical", 120.0), ("medium", 900.0)]
+
+        actions, rows = registry.batch_rank(candidates, contexts)
+
+        assert len(rows) == len(contexts)
+        for (criticality, downtime), row in zip(contexts, rows, strict=True):
+            ranked = registry.rank_actions_by_risk(candidates, criticality, downtime)
+            assert actions == [action for action, _, _ in ranked]
+            assert row == [risk for _, _, risk in ranked]
+
+    def test_no_services(self):
+        """An empty fleet still reports the shared action order."""
+        actions, rows = ActionRiskRegistry().batch_rank([ActionType.CLEAR_CACHE, ActionType.CUSTOM], [])
+
+        assert actions == [ActionType.CLEAR_CACHE]
+        assert rows == []
+
+
+class TestSelectBestAction:
+    """Test suite for ActionRiskRegistry.select_best_action."""
+
+    def test_selects_lowest_risk_action(self):
+        """Without confidences the lowest-risk candidate wins."""
+        registry = ActionRiskRegistry()
+
+        result = registry.select_best_action(
+            [ActionType.ROLLBACK_DEPLOYMENT, ActionType.RESTART_POD]
+        )
+
+        assert result is not None
+        action, reasoning = result
+        assert action == ActionType.RESTART_POD
+        assert "restart_pod" in reasoning
+
+    def test_filters_by_confidence(self):
+        """Candidates below min_confidence are skipped."""
+        registry = ActionRiskRegistry()
+
+        result = registry.select_best_action(
+            [ActionType.SCALE_UP, ActionType.RESTART_POD],
+            action_confidences={ActionType.SCALE_UP: 0.3, ActionType.RESTART_POD: 0.9},
+        )
+
+        assert result is not None
+        assert result[0] == ActionType.RESTART_POD
+
+    def test_tie_goes_to_first_candidate(self):
+        """Under high urgency, the earliest of equally risky candidates wins."""
+        registry = ActionRiskRegistry()
+
+        result = registry.select_best_action(
+            [ActionType.CLEAR_CACHE, ActionType.SCALE_UP, ActionType.RESTART_POD],
+            service_criticality="critical",
+            current_downtime_seconds=600,
+        )
+
+        assert result is not None
+        assert result[0] == ActionType.CLEAR_CACHE
+
+    def test_returns_none_when_nothing_qualifies(self):
+        """No candidate meeting the confidence bar yields None."""
+        registry = ActionRiskRegistry()
+
+        assert registry.select_best_action([]) is None
+        assert (
+            registry.select_best_action(
+                [ActionType.SCALE_UP],
+                action_confidences={ActionType.SCALE_UP: 0.1},
+            )
+            is None
+        )
+
+    def test_flags_high_risk_for_approval(self):
+        """Expensive, risky selections recommend human approval."""
+        registry = ActionRiskRegistry()
+
+        result = registry.select_best_action(
+            [ActionType.DRAIN_NODE],
+            blast_radius_multiplier=5.0,
+        )
+
+        assert result is not None
+        assert "recommend human approval" in result[1]
+
+
+class TestCostCalculation:
+    """Test suite for expected and worst-case cost calculation."""
+
+    def test_expected_cost(self):
+        """Expected cost = downtime minutes * cost per minute * blast multiplier."""
+        registry = ActionRiskRegistry()
+
+        # Restart: 10s expected downtime at $100/min
+        assert registry.calculate_expected_cost(ActionType.RESTART_POD, 2.0) == pytest.approx(
+            10 / 60.0 * 100.0 * 2.0
+        )
+
+    def test_worst_case_cost(self):
+        """Worst case includes recovery time."""
+        registry = ActionRiskRegistry()
+
+        # Restart: (300s + 180s) at $100/min
+        assert registry.calculate_worst_case_cost(ActionType.RESTART_POD) == pytest.approx(480 / 60.0 * 100.0)
+
+    def test_unknown_action_costs_nothing(self):
+        """Actions without a profile report zero cost."""
+        registry = ActionRiskRegistry()
+
+        assert registry.calculate_expected_cost(ActionType.CUSTOM) == 0.0
+        assert registry.calculate_worst_case_cost(ActionType.CUSTOM) == 0.0
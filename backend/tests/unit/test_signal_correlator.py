@@ -10,8 +10,10 @@ Senior Engineering Note:
 - Verifies confidence scoring with weighted signals
 - Covers edge cases and error scenarios
 """
+import asyncio
 from datetime import datetime, timedelta
 
+from app.core.perception import signal_correlator
 from app.core.perception.anomaly_detector import AnomalyDetection
 from app.core.perception.signal_correlator import (
     Signal,
@@ -508,6 +510,7 @@ class TestSignalCorrelator:
         assert signals[0].anomaly_score == 0.85
         assert signals[0].labels["service"] == "test-service"
         assert signals[0].labels["env"] == "prod"
+        assert signals[0].service == "test-service"
 
         # Check second signal
         assert signals[1].name == "memory_usage"
@@ -673,3 +676,184 @@ class TestSignalCorrelatorEdgeCases:
         incidents = await correlator.correlate_signals(signals)
 
         assert len(incidents) == 2, "Should create two separate incidents for different windows"
+
+    async def test_windows_anchor_on_first_signal(self):
+        """
+        Test windows are measured from their first signal, boundary inclusive.
+
+        Input order does not matter; windows are not chained signal to signal.
+        """
+        correlator = SignalCorrelator(correlation_window_seconds=60)
+        base = datetime(2026, 1, 1)
+        signals = [
+            Signal(
+                signal_type=SignalType.METRIC,
+                source="prometheus",
+                name="cpu_high",
+                value=90.0,
+                timestamp=base + timedelta(seconds=offset),
+                anomaly_score=0.8,
+            )
+            for offset in (300, 61, 0, 122, 30, 121, 60, 90)
+        ]
+
+        groups = correlator._group_by_time_window(signals)
+
+        offsets = {
+            int((start - base).total_seconds()): [int((s.timestamp - base).total_seconds()) for s in group]
+            for start, group in groups.items()
+        }
+        assert offsets == {0: [0, 30, 60], 61: [61, 90, 121], 122: [122], 300: [300]}
+
+    async def test_large_batches_run_in_worker_thread(self, monkeypatch):
+        """
+        Test only batches past the offload threshold leave the event loop.
+        """
+        offloaded = []
+        real_to_thread = asyncio.to_thread
+
+        async def spy_to_thread(func, *args):
+            offloaded.append(len(args[0]))
+            return await real_to_thread(func, *args)
+
+        monkeypatch.setattr(signal_correlator.asyncio, "to_thread", spy_to_thread)
+        monkeypatch.setattr(signal_correlator, "_OFFLOAD_MIN_SIGNALS", 4)
+        correlator = SignalCorrelator()
+        now = datetime.utcnow()
+
+        def batch(count):
+            return [
+                Signal(
+                    signal_type=(SignalType.METRIC, SignalType.LOG)[i % 2],
+                    source="prometheus",
+                    name=f"signal_{i}",
+                    value=1.0,
+                    timestamp=now,
+                    labels={"service": "api-gateway"},
+                    anomaly_score=0.9,
+                )
+                for i in range(count)
+            ]
+
+        small = await correlator.correlate_signals(batch(3))
+        large = await correlator.correlate_signals(batch(4))
+
+        assert offloaded == [4]
+        assert len(small[0].signals) == 3
+        assert len(large[0].signals) == 4
+
+    async def test_only_returned_incidents_are_built(self, monkeypatch):
+        """
+        Test incidents (title/description included) are built only for windows returned.
+        """
+        correlator = SignalCorrelator()
+        built = []
+        create = correlator._create_correlated_incident
+
+        def spy(**kwargs):
+            built.append(kwargs["service"])
+            return create(**kwargs)
+
+        monkeypatch.setattr(correlator, "_create_correlated_incident", spy)
+        now = datetime.utcnow()
+        signals = [
+            Signal(
+                signal_type=signal_type,
+                source="test",
+                name=f"{service}-{signal_type.value}",
+                value=1.0,
+                timestamp=now,
+                labels={"service": service},
+                anomaly_score=score,
+            )
+            for service, score in (("a", 0.9), ("b", 0.7), ("c", 0.8))
+            for signal_type in (SignalType.METRIC, SignalType.LOG)
+        ]
+
+        (incident,) = await correlator.correlate_signals(signals, top_k=1)
+
+        assert built == ["a"]
+        assert incident.title == "Multiple anomalies detected in a"
+        assert incident.description == "Correlated signals indicate an incident:\n" + "\n".join(
+            f"  • {s.signal_type.value}: {s.name} (score: {s.anomaly_score:.2f})"
+            for s in incident.signals
+        )
+
+    async def test_skips_weighting_for_windows_below_bound(self, monkeypatch):
+        """
+        Test windows that cannot reach the threshold skip confidence scoring.
+        """
+        correlator = SignalCorrelator()
+        scored = []
+        real_confidence = correlator._calculate_confidence
+        monkeypatch.setattr(
+            correlator,
+            "_calculate_confidence",
+            lambda signals: scored.append(len(signals)) or real_confidence(signals),
+        )
+        now = datetime.utcnow()
+
+        def window(service, scores):
+            return [
+                Signal(
+                    signal_type=signal_type,
+                    source="test",
+                    name=f"{service}_{signal_type.value}",
+                    value=1.0,
+                    timestamp=now,
+                    labels={"service": service},
+                    anomaly_score=score,
+                )
+                for signal_type, score in zip((SignalType.METRIC, SignalType.LOG, SignalType.TRACE), scores)
+            ]
+
+        incidents = await correlator.correlate_signals(
+            window("quiet", [0.30, 0.39]) + window("edge", [0.40, 0.30]) + window("busy", [0.35, 0.3, 0.35])
+        )
+
+        # quiet: 0.39 + 0.2 < 0.6 is culled; edge: 0.40 + 0.2 is scored but
+        # its weighted average falls short; busy: 0.35 + 0.3 is scored and kept
+        assert scored == [2, 3]
+        assert [i.service for i in incidents] == ["busy"]
+
+    async def test_service_resolved_at_construction(self):
+        """
+        Test the service is taken from labels once, preferring service over app.
+        """
+        now = datetime.utcnow()
+
+        def signal(**kwargs):
+            return Signal(
+                signal_type=SignalType.LOG, source="loki", name="errors", value=1.0, timestamp=now, **kwargs
+            )
+
+        assert signal(labels={"service": "api", "app": "web"}).service == "api"
+        assert signal(labels={"app": "web"}).service == "web"
+        assert signal().service == "unknown"
+        assert signal(labels={"app": "web"}, service="checkout").service == "checkout"
+
+    async def test_top_k_returns_most_confident(self):
+        """
+        Test top_k keeps only the highest-confidence incidents, in order.
+        """
+        correlator = SignalCorrelator()
+        now = datetime.utcnow()
+        signals = [
+            Signal(
+                signal_type=signal_type,
+                source="test",
+                name=signal_type.value,
+                value=1.0,
+                timestamp=now,
+                labels={"service": f"service-{score}"},
+                anomaly_score=score,
+            )
+            for score in (0.7, 0.95, 0.8)
+            for signal_type in (SignalType.METRIC, SignalType.LOG)
+        ]
+
+        top = await correlator.correlate_signals(signals, top_k=2)
+
+        assert [i.service for i in top] == ["service-0.95", "service-0.8"]
+        ranked = await correlator.correlate_signals(signals)
+        assert [(i.service, i.confidence) for i in top] == [(i.service, i.confidence) for i in ranked[:2]]